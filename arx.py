@@ -1,7 +1,4 @@
-from arx_lib.helpers import debug_print
-from arx_lib.builder import build
-
-version_string : str = '[2025.09.26]'
+from arx_lib.helpers import debug_print, get_allocator_argument, get_jobs_argument, get_optimization_argument, version_string
 
 import os, sys, subprocess, shutil, platform, webbrowser
 from typing import Optional
@@ -36,13 +33,22 @@ if __name__ == '__main__':
             case 'build':
                 if len(sys.argv) > 2:
                     if os.path.isfile(sys.argv[2]):
+                        from arx_lib.builder import build
                         print(f'Building [{os.path.basename(sys.argv[2])}]')
-                        build(sys.argv[2], executable_dir)
+                        build(sys.argv[2], executable_dir, get_jobs_argument(), '--emit-llvm' in sys.argv, get_optimization_argument(), '--lto' in sys.argv, get_allocator_argument())
                         exit(0)
                     else:
                         raise FileNotFoundError(f'Input file not found at [ {sys.argv[2]} ]')
+            case 'run':
+                if len(sys.argv) > 2:
+                    if os.path.isfile(sys.argv[2]):
+                        from arx_lib.runner import run
+                        exit(run(sys.argv[2], executable_dir, get_optimization_argument(), '--lto' in sys.argv, get_jobs_argument(), get_allocator_argument()))
+                    else:
+                        raise FileNotFoundError(f'Input file not found at [ {sys.argv[2]} ]')
         
     print('Usage for (arx)')
     print('- arx version')
-    print('- arx build <input.arx>')
+    print('- arx build <input.arx> [-O0|-O1|-O2|-O3|-Os] [-j N] [--lto] [--alloc=libc|slab|arena] [--emit-llvm]')
+    print('- arx run <input.arx> [-O0|-O1|-O2|-O3|-Os] [-j N] [--lto] [--alloc=libc|slab|arena]')
     print('- arx insight')
\ No newline at end of file
@@ -82,10 +82,7 @@ def install_arx() -> None:
     print('(install) (success)')
 
 def check_environment() -> None:
-    llc_path : Optional[str] = shutil.which('llc')
     gcc_path : Optional[str] = shutil.which('gcc')
-    if (not llc_path):
-        print('Make sure (llc) is installed and on your PATH.')
     if (not gcc_path):
         print('Make sure (gcc) is installed and on your PATH.')
     check_lib('llvmlite')
@@ -0,0 +1,347 @@
+from enum import IntEnum
+from typing import Any, Iterator, Optional, Union
+
+class NodeKind(IntEnum):
+    PROGRAM = 0
+    USING = 1
+    FUNCTION = 2
+    PARAM = 3
+    CLASS = 4
+    METHOD = 5
+    FIELD = 6
+    EXPRESSION = 7
+    RETURN = 8
+    RETURN_VOID = 9
+    IF_CHAIN = 10
+    IF_BRANCH = 11
+    FOR_IN = 12
+    WHILE = 13
+    DECLARE = 14
+    DECLARE_LIST = 15
+    DECLARE_CUSTOM = 16
+    ASSIGN = 17
+    BREAK = 18
+    CONTINUE = 19
+    INT = 20
+    FLOAT = 21
+    STRING = 22
+    BOOL = 23
+    LIST_LITERAL = 24
+    VAR = 25
+    THIS = 26
+    BINOP = 27
+    UNOP = 28
+    POSTINC = 29
+    POSTDEC = 30
+    CALL = 31
+    CALL_METHOD = 32
+    OBJECT_CREATION = 33
+    GET_ATTR = 34
+
+
+class ArtemisNode(object):
+    # Source span of the node, lines and columns start at 1 and end_column is exclusive
+    __slots__ = ('lineno', 'column', 'end_lineno', 'end_column')
+    kind : NodeKind
+
+    def set_span(self, lineno:int, column:int, end_lineno:int, end_column:int) -> 'ArtemisNode':
+        self.lineno = lineno
+        self.column = column
+        self.end_lineno = end_lineno
+        self.end_column = end_column
+        return self
+
+    def copy_span(self, other:'ArtemisNode') -> 'ArtemisNode':
+        return self.set_span(other.lineno, other.column, other.end_lineno, other.end_column)
+
+    def location(self) -> str:
+        return f'{self.lineno}:{self.column}'
+
+    def __repr__(self) -> str:
+        values : str = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({values})'
+
+# ----- PROGRAM -----
+
+class ProgramNode(ArtemisNode):
+    __slots__ = ('usings', 'body')
+    kind : NodeKind = NodeKind.PROGRAM
+
+    def __init__(self, usings:list['UsingNode'], body:list[ArtemisNode]) -> None:
+        self.usings : list[UsingNode] = usings
+        self.body : list[ArtemisNode] = body
+
+class UsingNode(ArtemisNode):
+    __slots__ = ('name',)
+    kind : NodeKind = NodeKind.USING
+
+    def __init__(self, name:str) -> None:
+        self.name : str = name
+
+# ----- DECLARATIONS -----
+
+class ParamNode(ArtemisNode):
+    __slots__ = ('type', 'name')
+    kind : NodeKind = NodeKind.PARAM
+
+    def __init__(self, type:str, name:str) -> None:
+        self.type : str = type
+        self.name : str = name
+
+class FunctionNode(ArtemisNode):
+    __slots__ = ('name', 'params', 'body', 'return_type')
+    kind : NodeKind = NodeKind.FUNCTION
+
+    def __init__(self, name:str, params:list[ParamNode], body:list[ArtemisNode], return_type:str) -> None:
+        self.name : str = name
+        self.params : list[ParamNode] = params
+        self.body : list[ArtemisNode] = body
+        self.return_type : str = return_type
+
+class FieldNode(ArtemisNode):
+    __slots__ = ('type', 'name', 'value')
+    kind : NodeKind = NodeKind.FIELD
+
+    def __init__(self, type:str, name:str, value:Optional[ArtemisNode]) -> None:
+        self.type : str = type
+        self.name : str = name
+        self.value : Optional[ArtemisNode] = value
+
+class MethodNode(ArtemisNode):
+    __slots__ = ('return_type', 'name', 'params', 'body')
+    kind : NodeKind = NodeKind.METHOD
+
+    def __init__(self, return_type:str, name:str, params:list[ParamNode], body:list[ArtemisNode]) -> None:
+        self.return_type : str = return_type
+        self.name : str = name
+        self.params : list[ParamNode] = params
+        self.body : list[ArtemisNode] = body
+
+class ClassNode(ArtemisNode):
+    __slots__ = ('name', 'body')
+    kind : NodeKind = NodeKind.CLASS
+
+    def __init__(self, name:str, body:list[ArtemisNode]) -> None:
+        self.name : str = name
+        self.body : list[ArtemisNode] = body
+
+# ----- STATEMENTS -----
+
+class ExpressionNode(ArtemisNode):
+    __slots__ = ('expression',)
+    kind : NodeKind = NodeKind.EXPRESSION
+
+    def __init__(self, expression:ArtemisNode) -> None:
+        self.expression : ArtemisNode = expression
+
+class ReturnNode(ArtemisNode):
+    __slots__ = ('value',)
+    kind : NodeKind = NodeKind.RETURN
+
+    def __init__(self, value:ArtemisNode) -> None:
+        self.value : ArtemisNode = value
+
+class ReturnVoidNode(ArtemisNode):
+    __slots__ = ()
+    kind : NodeKind = NodeKind.RETURN_VOID
+
+class IfBranchNode(ArtemisNode):
+    # condition is None for the trailing else branch
+    __slots__ = ('condition', 'body')
+    kind : NodeKind = NodeKind.IF_BRANCH
+
+    def __init__(self, condition:Optional[ArtemisNode], body:list[ArtemisNode]) -> None:
+        self.condition : Optional[ArtemisNode] = condition
+        self.body : list[ArtemisNode] = body
+
+class IfChainNode(ArtemisNode):
+    __slots__ = ('branches',)
+    kind : NodeKind = NodeKind.IF_CHAIN
+
+    def __init__(self, branches:list[IfBranchNode]) -> None:
+        self.branches : list[IfBranchNode] = branches
+
+class ForInNode(ArtemisNode):
+    __slots__ = ('type', 'name', 'iterable', 'body')
+    kind : NodeKind = NodeKind.FOR_IN
+
+    def __init__(self, type:str, name:str, iterable:ArtemisNode, body:list[ArtemisNode]) -> None:
+        self.type : str = type
+        self.name : str = name
+        self.iterable : ArtemisNode = iterable
+        self.body : list[ArtemisNode] = body
+
+class WhileNode(ArtemisNode):
+    __slots__ = ('condition', 'body')
+    kind : NodeKind = NodeKind.WHILE
+
+    def __init__(self, condition:ArtemisNode, body:list[ArtemisNode]) -> None:
+        self.condition : ArtemisNode = condition
+        self.body : list[ArtemisNode] = body
+
+class DeclareNode(ArtemisNode):
+    __slots__ = ('type', 'name', 'value')
+    kind : NodeKind = NodeKind.DECLARE
+
+    def __init__(self, type:str, name:str, value:ArtemisNode) -> None:
+        self.type : str = type
+        self.name : str = name
+        self.value : ArtemisNode = value
+
+class DeclareListNode(ArtemisNode):
+    __slots__ = ('element_type', 'name', 'value')
+    kind : NodeKind = NodeKind.DECLARE_LIST
+
+    def __init__(self, element_type:str, name:str, value:ArtemisNode) -> None:
+        self.element_type : str = element_type
+        self.name : str = name
+        self.value : ArtemisNode = value
+
+class DeclareCustomNode(ArtemisNode):
+    __slots__ = ('type_name', 'name', 'value')
+    kind : NodeKind = NodeKind.DECLARE_CUSTOM
+
+    def __init__(self, type_name:str, name:str, value:ArtemisNode) -> None:
+        self.type_name : str = type_name
+        self.name : str = name
+        self.value : ArtemisNode = value
+
+class AssignNode(ArtemisNode):
+    # target is a VarNode or a GetAttrNode
+    __slots__ = ('target', 'value')
+    kind : NodeKind = NodeKind.ASSIGN
+
+    def __init__(self, target:ArtemisNode, value:ArtemisNode) -> None:
+        self.target : ArtemisNode = target
+        self.value : ArtemisNode = value
+
+class BreakNode(ArtemisNode):
+    __slots__ = ()
+    kind : NodeKind = NodeKind.BREAK
+
+class ContinueNode(ArtemisNode):
+    __slots__ = ()
+    kind : NodeKind = NodeKind.CONTINUE
+
+# ----- EXPRESSIONS -----
+
+class IntNode(ArtemisNode):
+    __slots__ = ('value',)
+    kind : NodeKind = NodeKind.INT
+
+    def __init__(self, value:int) -> None:
+        self.value : int = value
+
+class FloatNode(ArtemisNode):
+    __slots__ = ('value',)
+    kind : NodeKind = NodeKind.FLOAT
+
+    def __init__(self, value:float) -> None:
+        self.value : float = value
+
+class StringNode(ArtemisNode):
+    __slots__ = ('value',)
+    kind : NodeKind = NodeKind.STRING
+
+    def __init__(self, value:str) -> None:
+        self.value : str = value
+
+class BoolNode(ArtemisNode):
+    __slots__ = ('value',)
+    kind : NodeKind = NodeKind.BOOL
+
+    def __init__(self, value:bool) -> None:
+        self.value : bool = value
+
+class ListLiteralNode(ArtemisNode):
+    __slots__ = ('elements',)
+    kind : NodeKind = NodeKind.LIST_LITERAL
+
+    def __init__(self, elements:list[ArtemisNode]) -> None:
+        self.elements : list[ArtemisNode] = elements
+
+class VarNode(ArtemisNode):
+    __slots__ = ('name',)
+    kind : NodeKind = NodeKind.VAR
+
+    def __init__(self, name:str) -> None:
+        self.name : str = name
+
+class ThisNode(ArtemisNode):
+    __slots__ = ()
+    kind : NodeKind = NodeKind.THIS
+
+class BinOpNode(ArtemisNode):
+    __slots__ = ('operator', 'left', 'right')
+    kind : NodeKind = NodeKind.BINOP
+
+    def __init__(self, operator:str, left:ArtemisNode, right:ArtemisNode) -> None:
+        self.operator : str = operator
+        self.left : ArtemisNode = left
+        self.right : ArtemisNode = right
+
+class UnOpNode(ArtemisNode):
+    __slots__ = ('operator', 'operand')
+    kind : NodeKind = NodeKind.UNOP
+
+    def __init__(self, operator:str, operand:ArtemisNode) -> None:
+        self.operator : str = operator
+        self.operand : ArtemisNode = operand
+
+class PostIncNode(ArtemisNode):
+    __slots__ = ('target',)
+    kind : NodeKind = NodeKind.POSTINC
+
+    def __init__(self, target:ArtemisNode) -> None:
+        self.target : ArtemisNode = target
+
+class PostDecNode(ArtemisNode):
+    __slots__ = ('target',)
+    kind : NodeKind = NodeKind.POSTDEC
+
+    def __init__(self, target:ArtemisNode) -> None:
+        self.target : ArtemisNode = target
+
+class CallNode(ArtemisNode):
+    __slots__ = ('name', 'args')
+    kind : NodeKind = NodeKind.CALL
+
+    def __init__(self, name:str, args:list[ArtemisNode]) -> None:
+        self.name : str = name
+        self.args : list[ArtemisNode] = args
+
+class CallMethodNode(ArtemisNode):
+    __slots__ = ('object', 'method', 'args')
+    kind : NodeKind = NodeKind.CALL_METHOD
+
+    def __init__(self, object:ArtemisNode, method:str, args:list[ArtemisNode]) -> None:
+        self.object : ArtemisNode = object
+        self.method : str = method
+        self.args : list[ArtemisNode] = args
+
+class ObjectCreationNode(ArtemisNode):
+    __slots__ = ('class_name', 'args')
+    kind : NodeKind = NodeKind.OBJECT_CREATION
+
+    def __init__(self, class_name:str, args:list[ArtemisNode]) -> None:
+        self.class_name : str = class_name
+        self.args : list[ArtemisNode] = args
+
+class GetAttrNode(ArtemisNode):
+    __slots__ = ('object', 'name')
+    kind : NodeKind = NodeKind.GET_ATTR
+
+    def __init__(self, object:ArtemisNode, name:str) -> None:
+        self.object : ArtemisNode = object
+        self.name : str = name
+
+def walk(root:Union[ArtemisNode, list]) -> Iterator[ArtemisNode]:
+    # Every node under root (a node or a list of nodes), in no particular order
+    pending : list = [root]
+    while pending:
+        current : Any = pending.pop()
+        if isinstance(current, list):
+            pending.extend(current)
+        elif isinstance(current, ArtemisNode):
+            yield current
+            pending.extend(getattr(current, name) for name in current.__slots__)
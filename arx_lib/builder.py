@@ -3,24 +3,119 @@ from .parser import ArtemisParser
 from .compiler import ArtemisCompiler
 from .data_classes import ArtemisData
 from .helpers import debug_print
+from .cache import ArtemisCache, c_source_dependencies, get_compiler_id, hash_file
+from .scheduler import BuildJob, run_jobs
+from .externs import get_extern_registry
+from llvmlite import binding
 
 import os, sys, subprocess, shutil, platform
+from functools import partial
 from typing import Optional
 
 is_windows : bool = os.name == 'nt'
 
-def build(file_in:str, executable_dir:str) -> None:
+def get_c_flags(compiler_data:ArtemisData) -> list[str]:
+    # The allocator backend is compiled into the runtime, so it is part of every object key
+    allocator_flags : list[str] = [] if compiler_data.allocator == 'libc' else [f'-DARX_ALLOC_{compiler_data.allocator.upper()}']
+    if compiler_data.size_level > 0:
+        return ['-Os'] + allocator_flags
+    return [f'-O{compiler_data.optimization_level}'] + allocator_flags
+
+def get_cache_dir(executable_dir:str) -> str:
+    return os.environ.get('ARX_CACHE_DIR', os.path.join(executable_dir, 'build', 'cache'))
+
+def c_object_key(gcc_path:str, source_paths:list[str], flags:list[str]) -> str:
+    parts : list[str] = [get_compiler_id(gcc_path), ' '.join(flags)]
+    for source_path in source_paths:
+        parts.append(os.path.basename(source_path) + ':' + hash_file(source_path))
+        for header_path in c_source_dependencies(source_path):
+            parts.append(os.path.basename(header_path) + ':' + hash_file(header_path))
+    return ArtemisCache.make_key(*parts)
+
+def run_command(command:list[str]) -> None:
+    debug_print(' '.join(command))
+    subprocess.run(command, check=True)
+
+def compile_c_object(gcc_path:str, c_source:str, c_object:str, c_flags:list[str], object_cache:ArtemisCache) -> Optional[str]:
+    object_extension : str = os.path.splitext(c_object)[1]
+    object_key : str = c_object_key(gcc_path, [c_source], c_flags)
+    if object_cache.fetch(object_key, object_extension, c_object):
+        return '(cached)'
+    run_command([gcc_path, '-c'] + c_flags + ['-o', c_object, c_source])
+    object_cache.store(object_key, object_extension, c_object)
+    return None
+
+def get_lto_flags(compiler_data:ArtemisData) -> list[str]:
+    # Bitcode built at (-O0) would carry optnone and stay opaque to the optimizer
+    return ['-fPIC', '-Xclang', '-disable-O0-optnone'] + get_c_flags(compiler_data)
+
+def compile_c_bitcode(clang_path:str, c_source:str, c_bitcode:str, c_flags:list[str], object_cache:ArtemisCache) -> Optional[str]:
+    bitcode_key : str = c_object_key(clang_path, [c_source], c_flags)
+    if object_cache.fetch(bitcode_key, '.bc', c_bitcode):
+        return '(cached)'
+    run_command([clang_path, '-c', '-emit-llvm'] + c_flags + ['-o', c_bitcode, c_source])
+    object_cache.store(bitcode_key, '.bc', c_bitcode)
+    return None
+
+def build_runtime_bitcode(executable_dir:str, c_libs:set[str], c_flags:list[str], object_cache:ArtemisCache, jobs:int) -> list[str]:
+    clang_path : Optional[str] = shutil.which('clang')
+    if (not clang_path):
+        raise EnvironmentError('Make sure (clang) is installed and on your PATH, it is needed for (--lto).')
+    os.makedirs(os.path.join(executable_dir, 'build'), exist_ok=True)
+    bitcode_jobs : list[BuildJob] = []
+    bitcode_paths : list[str] = []
+    for c_lib in sorted(c_libs):
+        c_source : str = os.path.join(executable_dir, 'c_lib', c_lib + '.c')
+        c_bitcode : str = os.path.join(executable_dir, 'build', c_lib + '.bc')
+        bitcode_jobs.append(BuildJob(
+            f'bitcode:{c_lib}',
+            partial(compile_c_bitcode, clang_path, c_source, c_bitcode, c_flags, object_cache),
+            label=f'[lto] ({c_lib})'
+        ))
+        bitcode_paths.append(c_bitcode)
+    run_jobs(bitcode_jobs, jobs)
+    return bitcode_paths
+
+def build_shared_runtime(gcc_path:str, executable_dir:str, c_libs:set[str], c_flags:list[str], object_cache:ArtemisCache) -> str:
+    shared_extension : str = '.dll' if is_windows else '.so'
+    c_sources : list[str] = [os.path.join(executable_dir, 'c_lib', c_lib + '.c') for c_lib in sorted(c_libs)]
+    shared_flags : list[str] = ['-shared', '-fPIC'] + c_flags
+    runtime_key : str = c_object_key(gcc_path, c_sources, shared_flags)
+    # The library is loaded straight from its cache entry, so old runtimes are evicted with the rest of the cache
+    cached_shared : Optional[str] = object_cache.locate(runtime_key, shared_extension)
+    if cached_shared:
+        debug_print(f'[runtime] (cached) {cached_shared}')
+        return cached_shared
+    temporary_shared : str = os.path.join(executable_dir, 'build', f'runtime.{os.getpid()}{shared_extension}')
+    run_command([gcc_path] + shared_flags + ['-o', temporary_shared] + c_sources)
+    object_cache.store(runtime_key, shared_extension, temporary_shared)
+    os.remove(temporary_shared)
+    return object_cache.entry_path(runtime_key, shared_extension)
+
+def write_object(compiler:ArtemisCompiler, module_ref:binding.ModuleRef, out_o:str) -> None:
+    debug_print('[object]')
+    with open(out_o, 'wb') as f:
+        f.write(compiler.emit_object(module_ref))
+
+def build(file_in:str, executable_dir:str, jobs:int=1, emit_llvm:bool=False, optimization:Optional[tuple[int, int]]=None, lto:bool=False, allocator:str='libc') -> None:
     map_paths : set[str] = set()
     map_paths.add(os.path.join(executable_dir, 'c_map'))
     compiler_data : ArtemisData = ArtemisData(map_paths)
+    if optimization is not None:
+        compiler_data.optimization_level, compiler_data.size_level = optimization
+        compiler_data.codegen_level = min(compiler_data.optimization_level, 3)
+    compiler_data.allocator = allocator
+    compiler_data.module_cache = ArtemisCache(os.path.join(get_cache_dir(executable_dir), 'modules'))
+    compiler_data.extern_registry = get_extern_registry(map_paths, get_cache_dir(executable_dir))
     compiler : ArtemisCompiler = ArtemisCompiler(compiler_data)
-    module : str = compiler.compile_exec(file_in)
+    module_ref : binding.ModuleRef = compiler.compile_exec(file_in)
+    object_cache : ArtemisCache = ArtemisCache(get_cache_dir(executable_dir))
+    if lto:
+        compiler.link_runtime(module_ref, build_runtime_bitcode(executable_dir, compiler.extern_c, get_lto_flags(compiler_data), object_cache, jobs))
+    compiler.optimize(module_ref)
 
-    llc_path : Optional[str] = shutil.which('llc')
     gcc_path : Optional[str] = shutil.which('gcc')
 
-    if (not llc_path):
-        raise EnvironmentError('Make sure (llc) is installed and on your PATH.')
     if (not gcc_path):
         raise EnvironmentError('Make sure (gcc) is installed and on your PATH.')
 
@@ -28,22 +123,37 @@ def build(file_in:str, executable_dir:str) -> None:
     os.makedirs(os.path.join(executable_dir, 'out'), exist_ok=True)
 
     object_extension : str = '.obj' if is_windows else '.o'
-    out_ll : str = os.path.join(executable_dir, 'build', os.path.basename(file_in).rsplit('.', 1)[0] + '.ll')
-    out_o : str = out_ll.rsplit('.', 1)[0] + object_extension
-    with open(out_ll, 'w') as f:
-        f.write(module)
-    debug_print('[llc]')
-    subprocess.run([llc_path, out_ll, '-filetype=obj', '-o', out_o], check=True)
-    
-    final_command : list[str] = [gcc_path, out_o]
-    total_libs : int = len(compiler.extern_c) + 1
-    for i, c_lib in enumerate(compiler.extern_c):
-        print(f'[ {i + 1}/{total_libs} ]' + ' [lib] (' + c_lib + ')')
-        subprocess.run([gcc_path, '-c', '-o', os.path.join(executable_dir, 'build', c_lib + object_extension), os.path.join(executable_dir, 'c_lib', c_lib + '.c')], check=True)
-        final_command.append(
-            os.path.join(executable_dir, 'build', c_lib + object_extension)
-        )
-    print(f'[ {total_libs}/{total_libs} ]' + ' [main]')
+    out_base : str = os.path.join(executable_dir, 'build', os.path.basename(file_in).rsplit('.', 1)[0])
+    out_o : str = out_base + object_extension
+    if emit_llvm:
+        with open(out_base + '.ll', 'w') as f:
+            f.write(str(module_ref))
+        print(f'LLVM IR at [ {out_base}.ll ]')
     out_executable : str = os.path.join(executable_dir, 'out', os.path.basename(file_in).rsplit('.', 1)[0] + ('.exe' if is_windows else ''))
-    subprocess.run(final_command + ['-o', out_executable], check=True)
+
+    c_flags : list[str] = get_c_flags(compiler_data)
+    build_jobs : list[BuildJob] = [
+        BuildJob('object', partial(write_object, compiler, module_ref, out_o))
+    ]
+    final_command : list[str] = [gcc_path, out_o]
+    # With (--lto) the runtime is already part of the object
+    for c_lib in ([] if lto else sorted(compiler.extern_c)):
+        c_source : str = os.path.join(executable_dir, 'c_lib', c_lib + '.c')
+        c_object : str = os.path.join(executable_dir, 'build', c_lib + object_extension)
+        build_jobs.append(BuildJob(
+            f'lib:{c_lib}',
+            partial(compile_c_object, gcc_path, c_source, c_object, c_flags, object_cache),
+            label=f'[lib] ({c_lib})'
+        ))
+        final_command.append(c_object)
+    build_jobs.append(BuildJob(
+        'main',
+        partial(run_command, final_command + ['-o', out_executable]),
+        dependencies=[job.name for job in build_jobs],
+        label='[main]'
+    ))
+    run_jobs(build_jobs, jobs)
+    compiler_data.module_cache.save_stats()
+    cache_stats : dict[str, int] = object_cache.save_stats()
+    debug_print(f'[cache] {object_cache.hits} hits {object_cache.misses} misses (total {cache_stats["hits"]} hits {cache_stats["misses"]} misses)')
     print(f'Built at [ {out_executable} ]')
\ No newline at end of file
@@ -0,0 +1,150 @@
+from .helpers import debug_print
+
+import os, re, json, shutil, hashlib, threading, subprocess
+from typing import Optional
+
+include_pattern : re.Pattern = re.compile(r'^\s*#\s*include\s*"([^"]+)"', re.MULTILINE)
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def hash_file(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hash_bytes(f.read())
+
+def c_source_dependencies(source_path: str) -> list[str]:
+    # Local headers (#include "...") reachable from source_path, sorted for a stable key
+    found : set[str] = set()
+    pending : list[str] = [source_path]
+    while pending:
+        current : str = pending.pop()
+        with open(current, errors='replace') as f:
+            contents : str = f.read()
+        for header in include_pattern.findall(contents):
+            header_path : str = os.path.join(os.path.dirname(current), header)
+            if os.path.isfile(header_path) and header_path not in found:
+                found.add(header_path)
+                pending.append(header_path)
+    return sorted(found)
+
+compiler_ids : dict[str, str] = {}
+
+def get_compiler_id(compiler_path: str) -> str:
+    if compiler_path not in compiler_ids:
+        result = subprocess.run([compiler_path, '--version'], capture_output=True, text=True)
+        compiler_ids[compiler_path] = compiler_path + '\n' + result.stdout.strip()
+    return compiler_ids[compiler_path]
+
+
+class ArtemisCache:
+    '''Content-addressed file cache with hit/miss counters and LRU eviction.'''
+
+    def __init__(self, cache_dir: str, max_entries: int = 512, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.cache_dir : str = cache_dir
+        self.max_entries : int = max_entries
+        self.max_bytes : int = max_bytes
+        self.hits : int = 0
+        self.misses : int = 0
+        self.stats_path : str = os.path.join(cache_dir, 'stats.json')
+        self.lock : threading.Lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        return hash_bytes('\0'.join(parts).encode('utf-8'))
+
+    def entry_path(self, key: str, extension: str) -> str:
+        return os.path.join(self.cache_dir, key + extension)
+
+    def fetch(self, key: str, extension: str, destination: str) -> bool:
+        path : str = self.entry_path(key, extension)
+        try:
+            shutil.copyfile(path, destination)
+            os.utime(path)
+        except FileNotFoundError:
+            self.count(False)
+            return False
+        self.count(True)
+        return True
+
+    def locate(self, key: str, extension: str) -> Optional[str]:
+        # Path of an entry used in place instead of copied out
+        path : str = self.entry_path(key, extension)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.count(False)
+            return None
+        self.count(True)
+        return path
+
+    def read(self, key: str, extension: str) -> Optional[bytes]:
+        path : str = self.entry_path(key, extension)
+        try:
+            with open(path, 'rb') as f:
+                data : bytes = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def write(self, key: str, extension: str, data: bytes) -> None:
+        path : str = self.entry_path(key, extension)
+        temporary_path : str = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temporary_path, 'wb') as f:
+            f.write(data)
+        os.replace(temporary_path, path)
+        with self.lock:
+            self.evict()
+
+    def count(self, hit: bool) -> None:
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def store(self, key: str, extension: str, source: str) -> None:
+        path : str = self.entry_path(key, extension)
+        temporary_path : str = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        shutil.copyfile(source, temporary_path)
+        os.replace(temporary_path, path)
+        with self.lock:
+            self.evict()
+
+    def evict(self) -> None:
+        entries : list[tuple[float, int, str]] = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name == 'stats.json' or entry.name.endswith('.tmp') or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        total_bytes : int = sum(size for _mtime, size, _path in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _mtime, size, path = entries.pop(0)
+            try:
+                os.remove(path)
+            except (FileNotFoundError, PermissionError):
+                # A runtime library still loaded by another process cannot be removed on Windows
+                pass
+            total_bytes -= size
+            debug_print(f'[cache] (evict) {os.path.basename(path)}')
+
+    def save_stats(self) -> dict[str, int]:
+        stats : dict[str, int] = {'hits': 0, 'misses': 0}
+        try:
+            with open(self.stats_path) as f:
+                stats.update(json.load(f))
+        except (FileNotFoundError, ValueError):
+            pass
+        stats['hits'] += self.hits
+        stats['misses'] += self.misses
+        temporary_path : str = f'{self.stats_path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w') as f:
+            json.dump(stats, f)
+        os.replace(temporary_path, self.stats_path)
+        return stats
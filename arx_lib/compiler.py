@@ -1,63 +1,94 @@
 from llvmlite import ir, binding
-import configparser
-import glob
 import shutil
 import os
 import sys
 import re
-from .helpers import debug_print, arx_extension
+import json
+import llvmlite
+from .helpers import debug_print, arx_extension, version_string
 from .data_classes import ArtemisData, TypeEnum
+from .cache import ArtemisCache, hash_bytes, hash_file
+from .externs import ExternOverloads, find_overload, get_extern_registry
 from .converters import ir_to_string, string_to_ir
 from .lexer import ArtemisLexer
 from .parser import ArtemisParser
-from typing import Union, Optional, ItemsView, Any, Iterator, Iterable
+from .ast_nodes import (
+    ArtemisNode, NodeKind, ProgramNode, FunctionNode, ClassNode, MethodNode, FieldNode, ObjectCreationNode, walk
+)
+from typing import Union, Optional, Any, Iterator, Iterable
 
-def parse_file(file_in: str) -> tuple:
+def parse_file(file_in: str) -> ProgramNode:
     with open(file_in) as f:
         file_contents = f.read()
     lexer : ArtemisLexer = ArtemisLexer()
-    parser : ArtemisParser = ArtemisParser()
+    parser : ArtemisParser = ArtemisParser(file_contents)
     tokens : list = list(lexer.tokenize(file_contents))
     debug_print(tokens)
-    ast : tuple = parser.parse(iter(tokens))
+    ast : ProgramNode = parser.parse(iter(tokens))
     if not ast:
         raise RuntimeError('Parsing failed')
     debug_print(ast)
     return ast
 
-def parse_function_overloads(items:ItemsView[str, str], module_name: str) -> dict:
-    externs: dict = {}
-    for sig, mapping in items:
-        sig : str = sig.strip()
-        mapping : str = mapping.strip()
-        if not sig or not mapping:
-            continue
-        func_name, arg_part = (sig.split(':', 1) + [''])[:2]
-        func_name : str = func_name.strip()
-        arg_types : tuple = tuple(arg.strip() for arg in arg_part.split(',') if arg.strip())
-        llvm_name, return_type = map(str.strip, mapping.split('>'))
-        key : str = f'{module_name}.{func_name}'
-        externs.setdefault(key, {})[arg_types] = (llvm_name, return_type)
-    return externs
+using_pattern : re.Pattern = re.compile(r'^\s*using\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
+
+def read_using_modules(source: str) -> set[str]:
+    return set(using_pattern.findall(source))
+
+# Symbols the executable (main) and the JIT runner (_exec, io_flush) look up
+entry_points : tuple[str, ...] = ('main', '_exec', 'io_flush')
+# C runtime modules linked into every program, whether or not they are named in (using)
+runtime_modules : frozenset[str] = frozenset({'core', 'alloc'})
+compiler_dir : str = os.path.dirname(os.path.realpath(__file__))
+compiler_fingerprints : dict[tuple[str, ...], str] = {}
+
+def get_compiler_fingerprint(map_paths: Iterable[str]) -> str:
+    # Hash of the compiler sources and every extern map, cached modules built by a different compiler never match
+    map_dirs : tuple[str, ...] = tuple(sorted(map_paths))
+    if map_dirs not in compiler_fingerprints:
+        source_paths : list[str] = sorted(os.path.join(compiler_dir, name) for name in os.listdir(compiler_dir) if name.endswith('.py'))
+        for map_dir in map_dirs:
+            if os.path.isdir(map_dir):
+                source_paths += sorted(os.path.join(map_dir, name) for name in os.listdir(map_dir) if name.endswith('.map'))
+        compiler_fingerprints[map_dirs] = ArtemisCache.make_key(*(f'{os.path.basename(path)}:{hash_file(path)}' for path in source_paths))
+    return compiler_fingerprints[map_dirs]
+
+llvm_initialized : bool = False
+
+def initialize_llvm() -> None:
+    global llvm_initialized
+    if llvm_initialized:
+        return
+    binding.initialize()
+    binding.initialize_native_target()
+    binding.initialize_native_asmprinter()
+    llvm_initialized = True
 
 
 class ArtemisCompiler:
     def __init__(self, compiler_data: ArtemisData) -> None:
-        binding.initialize()
-        binding.initialize_native_target()
-        binding.initialize_native_asmprinter()
+        initialize_llvm()
         self.module: ir.Module = ir.Module(name='arx')
         self.module.triple = binding.get_default_triple()
         self.target : binding.Target = binding.Target.from_default_triple()
-        self.target_machine : binding.TargetMachine = self.target.create_target_machine()
+        self.target_machine : binding.TargetMachine = self.target.create_target_machine(opt=compiler_data.codegen_level, reloc='pic')
+        self.module.data_layout = str(self.target_machine.target_data)
         self.builder : Optional[ir.IRBuilder] = None
         self.func : Optional[ir.Function] = None
         self.compiler_data: ArtemisData = compiler_data
         self.variables : dict[str, tuple[ir.AllocaInstr, ir.Type]] = {}
+        # (list:str) for a list:string variable, the element type is not part of the IR type
+        self.list_types : dict[str, str] = {}
+        # Same for lists returned by an extern call, keyed by the call instruction
+        self.list_values : dict[ir.Value, str] = {}
+        # list:int variables declared from iter.range_int and only iterated, kept as (start, end, step) slots
+        self.range_lists : set[str] = set()
+        self.range_slots : dict[str, tuple[ir.AllocaInstr, ir.AllocaInstr, ir.AllocaInstr]] = {}
         self.local_vars: dict[str, ir.AllocaInstr] = {}
         self.loop_continue_stack: list[ir.Block] = []
         self.loop_break_stack: list[ir.Block] = []
         self.loop_counter : int = 0
+        self.entry_alloca_count : int = 0
         self.function_counter : int = 0
         self.if_counter : int = 0
         self.get_abi_counter : int = 0
@@ -65,18 +96,26 @@ class ArtemisCompiler:
         self.extern_functions: dict[str, dict] = {}
         self.extern_modules: dict[str, ir.Module] = {}
         self.extern_modules_namespace: dict[str, dict[str, str]] = {}
+        self.link_units: dict[str, binding.ModuleRef] = {}
+        self.string_literals: dict[bytes, ir.GlobalVariable] = {}
+        self.list_literal_counter : int = 0
         self.list_struct_type : ir.IdentifiedStructType = ir.global_context.get_identified_type('List')
-        self.list_struct_type.set_body(
-            TypeEnum.int8.as_pointer(),
-            TypeEnum.int32,
-            TypeEnum.int32,
-            TypeEnum.int64,
-            TypeEnum.boolean
-        )
+        if self.list_struct_type.is_opaque:
+            self.list_struct_type.set_body(
+                TypeEnum.int8.as_pointer(),
+                TypeEnum.int32,
+                TypeEnum.int32,
+                TypeEnum.int64,
+                TypeEnum.boolean
+            )
+        self.view_struct_type : ir.IdentifiedStructType = TypeEnum.string_view.pointee
+        if self.view_struct_type.is_opaque:
+            self.view_struct_type.set_body(TypeEnum.int8.as_pointer(), TypeEnum.int64)
 
     def get_abi_size_from_ir_type(self, ir_type: ir.Type) -> int:
         if isinstance(ir_type, ir.IntType):
-            return ir_type.width // 8
+            # bool (i1) takes a whole byte like C's bool
+            return (ir_type.width + 7) // 8
         elif isinstance(ir_type, ir.PointerType):
             return 8
         elif isinstance(ir_type, ir.FloatType):
@@ -94,8 +133,24 @@ class ArtemisCompiler:
         else:
             raise NotImplementedError(f'ABI size calculation not implemented for {ir_type}')
         
+    def entry_alloca(self, ir_type: ir.Type, name: str = '') -> ir.AllocaInstr:
+        # Every stack slot lives at the top of the entry block, so a declaration inside a loop reuses
+        # one slot instead of growing the stack each pass, and mem2reg can promote it to a register
+        # (the builder always appends at the end of its current block, so it is put back there)
+        entry_block : ir.Block = self.func.entry_basic_block
+        current_block : ir.Block = self.builder.block
+        if self.entry_alloca_count < len(entry_block.instructions):
+            self.builder.position_before(entry_block.instructions[self.entry_alloca_count])
+        else:
+            self.builder.position_at_end(entry_block)
+        pointer : ir.AllocaInstr = self.builder.alloca(ir_type, name=name)
+        self.entry_alloca_count += 1
+        self.builder.position_at_end(current_block)
+        return pointer
+
     def safe_store(self, value: ir.Value, pointer: ir.AllocaInstr):
         target_type = pointer.type.pointee
+        value = self.view_as(value, target_type)
         if target_type != value.type:
             if target_type.is_pointer and value.type.is_pointer:
                 value = self.builder.bitcast(value, target_type)
@@ -103,35 +158,97 @@ class ArtemisCompiler:
                 raise TypeError(f'Cannot assign {value.type} to {target_type}')
         self.builder.store(value, pointer)
 
-    def allocate_and_copy_array(self, elements: list[ir.Value], element_type: ir.Type) -> ir.Value:
-        element_count : int = len(elements)
-        element_size : int = self.get_abi_size_from_ir_type(element_type)
-        total_size : ir.Constant = ir.Constant(TypeEnum.int32, element_count * element_size)
-        malloc_fn : ir.Function = self.declare_malloc()
-        heap_pointer = self.builder.call(malloc_fn, [self.builder.zext(total_size, TypeEnum.int64)], name='heap_pointer')
-        typed_pointer = self.builder.bitcast(heap_pointer, element_type.as_pointer())
+    def view_as(self, value:ir.Value, target_type:ir.Type) -> ir.Value:
+        # A view stored where a (str) is expected escapes, so it is copied into a string there
+        if value.type == TypeEnum.string_view and target_type == TypeEnum.string:
+            return self.call_core('core_view_to_string', TypeEnum.string, [value])
+        return value
+
+    def declare_c_function(self, llvm_name:str, return_type:ir.Type, argument_types:list[ir.Type]) -> ir.Function:
+        func : ir.Function = self.module.globals.get(llvm_name)
+        if func:
+            return func
+        func = ir.Function(self.module, ir.FunctionType(return_type, argument_types), name=llvm_name)
+        # C (bool) only defines the low bit, the upper bits of an i1 crossing the boundary must be zero
+        for argument in func.args:
+            if argument.type == TypeEnum.boolean:
+                argument.add_attribute('zeroext')
+        if return_type == TypeEnum.boolean:
+            func.return_value.add_attribute('zeroext')
+        return func
+
+    def call_core(self, llvm_name:str, return_type:ir.Type, arguments:list[ir.Value]) -> ir.Value:
+        func : ir.Function = self.declare_c_function(llvm_name, return_type, [argument.type for argument in arguments])
+        return self.builder.call(func, arguments)
+
+    def list_element_type(self, type_name:str) -> ir.Type:
+        # Lists hold views by value, (data, length) pairs right in the list data
+        if type_name == 'view':
+            return self.view_struct_type
+        return string_to_ir(type_name)
+
+    def stack_array(self, elements: list[ir.Value], element_type: ir.Type) -> ir.Value:
+        # Elements laid out in a stack temporary, only valid until the List copies them
+        array_pointer : ir.AllocaInstr = self.entry_alloca(ir.ArrayType(element_type, len(elements)), name='list_elements')
+        zero : ir.Constant = ir.Constant(TypeEnum.int32, 0)
         for i, element in enumerate(elements):
-            index = ir.Constant(TypeEnum.int32, i)
-            element_address = self.builder.gep(typed_pointer, [index], name=f'element_pointer_{i}')
+            element_address = self.builder.gep(array_pointer, [zero, ir.Constant(TypeEnum.int32, i)], inbounds=True, name=f'element_pointer_{i}')
             element_value = element
             if element.type.is_pointer and not element.type == element_type:
                 element_value = self.builder.load(element)
             self.safe_store(element_value, element_address)
-        return heap_pointer
-
-    def load_externs_c(self, using_externs: list[str]) -> None:
-        for path in self.compiler_data.map_paths:
-            map_files = glob.glob(os.path.join(path, '*.map'))
-            for map_file in map_files:
-                cfg : configparser.RawConfigParser = configparser.RawConfigParser(delimiters=('='))
-                cfg.read(map_file)
-                module_name : str = cfg['meta']['name']
-                if (module_name != 'core') and (module_name not in using_externs):
-                    continue
-                self.extern_c.add(module_name)
-                externs : dict = parse_function_overloads(cfg['functions'].items(), module_name)
-                for full_name, overloads in externs.items():
-                    self.extern_functions.setdefault(full_name, {}).update(overloads)
+        return self.builder.bitcast(array_pointer, TypeEnum.int8.as_pointer())
+
+    def constant_element(self, expression:ArtemisNode, element_type:ir.Type) -> Optional[ir.Constant]:
+        # The element as a constant when it is a literal of the list's own type, None otherwise
+        match expression.kind:
+            case NodeKind.INT if element_type == TypeEnum.int32:
+                return ir.Constant(TypeEnum.int32, expression.value)
+            case NodeKind.FLOAT if element_type == TypeEnum.float32:
+                return ir.Constant(TypeEnum.float32, expression.value)
+            case NodeKind.BOOL if element_type == TypeEnum.boolean:
+                return ir.Constant(TypeEnum.boolean, int(expression.value))
+            case NodeKind.STRING | NodeKind.BINOP if element_type == TypeEnum.string:
+                folded : Optional[str] = self.fold_string_literal(expression)
+                return None if folded is None else self.get_string_literal(folded)
+        return None
+
+    def get_constant_array(self, element_type:ir.Type, elements:list[ir.Constant]) -> ir.Constant:
+        # Private constant like string literals, identical tables are merged after linking
+        array_type : ir.ArrayType = ir.ArrayType(element_type, len(elements))
+        global_array : ir.GlobalVariable = ir.GlobalVariable(self.module, array_type, name=f'list_{self.list_literal_counter}')
+        self.list_literal_counter += 1
+        global_array.linkage = 'private'
+        global_array.unnamed_addr = True
+        global_array.global_constant = True
+        global_array.initializer = ir.Constant(array_type, elements)
+        return global_array.bitcast(TypeEnum.int8.as_pointer())
+
+    def compile_list_literal(self, elements:list[ArtemisNode], element_type:ir.Type) -> ir.Value:
+        # Literals of constants only become one constant array that the List borrows (core_list_wrap) until it changes,
+        # any other literal is filled in on the stack and copied into the List once
+        arguments : list[ir.Value] = [
+            ir.Constant(TypeEnum.int32, len(elements)),
+            ir.Constant(TypeEnum.int64, self.get_abi_size_from_ir_type(element_type)),
+            ir.Constant(TypeEnum.boolean, int(element_type.is_pointer))
+        ]
+        constants : list[Optional[ir.Constant]] = [self.constant_element(element, element_type) for element in elements]
+        if all(constant is not None for constant in constants):
+            data : ir.Value = self.get_constant_array(element_type, constants)
+            return self.call_core('core_list_wrap', self.list_struct_type.as_pointer(), [data] + arguments)
+        data : ir.Value = self.stack_array([self.compile_expression(element) for element in elements], element_type)
+        return self.call_core('core_list_create_from', self.list_struct_type.as_pointer(), [data] + arguments)
+
+    def load_externs_c(self, using_externs: set[str]) -> None:
+        if self.compiler_data.extern_registry is None:
+            self.compiler_data.extern_registry = get_extern_registry(self.compiler_data.map_paths)
+        for module_name in runtime_modules | set(using_externs):
+            externs : Optional[ExternOverloads] = self.compiler_data.extern_registry.get_module(module_name)
+            if externs is None:
+                continue
+            self.extern_c.add(module_name)
+            for full_name, overloads in externs.items():
+                self.extern_functions.setdefault(full_name, {}).update(overloads)
     
     def load_using(self, using_list: set[str], search_dir: str) -> None:
         arx_using : set[str] = { arx_file for arx_file in using_list if os.path.exists(os.path.join(search_dir, arx_file + arx_extension)) }
@@ -141,45 +258,189 @@ class ArtemisCompiler:
             self.extern_c.update(sub_c)
         self.load_externs_c(c_using)
 
-    def declare_malloc(self) -> ir.Function:
-        malloc_ty : ir.FunctionType = ir.FunctionType(TypeEnum.int8.as_pointer(), [TypeEnum.int64])
-        malloc_fn : ir.Function = self.module.globals.get('malloc')
-        if malloc_fn is None:
-            malloc_fn = ir.Function(self.module, malloc_ty, name='malloc')
-        return malloc_fn
-
-    def declare_list_len(self) -> ir.Function:
-        if not hasattr(self, 'list_len_func'):
-            fn_type : ir.FunctionType = ir.FunctionType(TypeEnum.int32, [self.list_struct_type.as_pointer()])
-            self.list_len_func : ir.Function = ir.Function(self.module, fn_type, name='core_list_len')
-        return self.list_len_func
-
-    def call_list_len(self, list_pointer:ir.AllocaInstr) -> ir.CallInstr:
-        return self.builder.call(self.declare_list_len(), [list_pointer])
-
-    def declare_list_get(self) -> ir.Function:
-        if not hasattr(self, 'list_get_func'):
-            fn_type : ir.FunctionType = ir.FunctionType(TypeEnum.int8.as_pointer(), [self.list_struct_type.as_pointer(), TypeEnum.int32])
-            self.list_get_func : ir.Function = ir.Function(self.module, fn_type, name='core_list_get')
-        return self.list_get_func
-
-    def call_list_get(self, list_pointer:ir.AllocaInstr, index_value:ir.LoadInstr) -> ir.CallInstr:
-        return self.builder.call(self.declare_list_get(), [list_pointer, index_value])
-
-    def compile_function(self, node:tuple):
-        _, name, parameters, statements, return_type = node
-        arg_types : list[ir.Type] = [string_to_ir(parameter_type) for _id, parameter_type, _name in parameters]
+    def get_string_literal(self, value:str) -> ir.Constant:
+        # One private unnamed_addr constant per distinct literal, identical ones across modules are merged after linking
+        # Laid out like runtime strings (c_lib/core.h), the i64 length right before the NUL-terminated characters
+        data : bytes = value.encode('utf8') + b'\0'
+        global_str : Optional[ir.GlobalVariable] = self.string_literals.get(data)
+        if global_str is None:
+            chars_type : ir.ArrayType = ir.ArrayType(TypeEnum.int8, len(data))
+            str_type : ir.LiteralStructType = ir.LiteralStructType([TypeEnum.int64, chars_type], packed=True)
+            global_str = ir.GlobalVariable(self.module, str_type, name=f'string_{len(self.string_literals)}')
+            global_str.linkage = 'private'
+            global_str.unnamed_addr = True
+            global_str.global_constant = True
+            # Packed structs have alignment 1, the runtime reads the length through an aligned ArxStringHeader
+            global_str.align = 8
+            global_str.initializer = ir.Constant(str_type, [ir.Constant(TypeEnum.int64, len(data) - 1), ir.Constant(chars_type, bytearray(data))])
+            self.string_literals[data] = global_str
+        zero : ir.Constant = ir.Constant(TypeEnum.int32, 0)
+        return global_str.gep([zero, ir.Constant(TypeEnum.int32, 1), zero])
+
+    def fold_string_literal(self, expression:ArtemisNode) -> Optional[str]:
+        # Concatenations of literals only, ('a' + 'b') becomes the literal 'ab'
+        match expression.kind:
+            case NodeKind.STRING:
+                return expression.value
+            case NodeKind.BINOP if expression.operator == '+':
+                left : Optional[str] = self.fold_string_literal(expression.left)
+                if left is None:
+                    return None
+                right : Optional[str] = self.fold_string_literal(expression.right)
+                return None if right is None else left + right
+        return None
+
+    def load_list_fields(self, list_pointer:ir.Value, element_type:ir.Type) -> tuple[ir.Value, ir.Value]:
+        # (data, length) read straight from the List struct, data typed as element_type*
+        zero : ir.Constant = ir.Constant(TypeEnum.int32, 0)
+        data_pointer : ir.GEPInstr = self.builder.gep(list_pointer, [zero, zero], inbounds=True)
+        length_pointer : ir.GEPInstr = self.builder.gep(list_pointer, [zero, ir.Constant(TypeEnum.int32, 1)], inbounds=True)
+        data : ir.LoadInstr = self.builder.load(data_pointer, name='list_data')
+        length : ir.LoadInstr = self.builder.load(length_pointer, name='list_length')
+        return (self.builder.bitcast(data, element_type.as_pointer()), length)
+
+    def argument_type(self, node:ArtemisNode, value:ir.Value) -> str:
+        # Type name used to pick an extern overload, lists are typed when they are named variables or extern results
+        if value.type == self.list_struct_type.as_pointer():
+            return self.list_type(node, value)
+        return ir_to_string(value.type)
+
+    def list_type(self, node:ArtemisNode, value:ir.Value) -> str:
+        # (list:T) when the element type is known, (list) otherwise
+        if node.kind == NodeKind.VAR and node.name in self.list_types:
+            return self.list_types[node.name]
+        return self.list_values.get(value, 'list')
+
+    def check_list_type(self, statement:ArtemisNode, node:ArtemisNode, value:ir.Value, element_type:str) -> None:
+        # Views sit in a list as (data, length) pairs and strings as pointers, a mismatch would read one as the other
+        expected : str = 'list:' + ('str' if element_type == 'string' else element_type)
+        found : str = self.list_type(node, value)
+        if found != 'list' and found != expected:
+            raise TypeError(f'Cannot use {found} as {expected} at {statement.location()}')
+
+    def keeps_lists(self, body:list[ArtemisNode]) -> bool:
+        # Lists are only reachable through local variables, so a body that names no list variable
+        # and declares no list can not resize or replace the list being iterated
+        list_type : ir.PointerType = self.list_struct_type.as_pointer()
+        for node in walk(body):
+            if node.kind == NodeKind.DECLARE_LIST:
+                return False
+            if node.kind == NodeKind.VAR and node.name in self.variables and self.variables[node.name][1] == list_type:
+                return False
+        return True
+
+    def is_range_call(self, expression:ArtemisNode) -> bool:
+        # iter.range_int(start, end, step) on the C module, not on a variable that happens to be called iter
+        if expression.kind != NodeKind.CALL_METHOD or expression.method != 'range_int' or len(expression.args) != 3:
+            return False
+        module : ArtemisNode = expression.object
+        if module.kind != NodeKind.VAR or module.name != 'iter' or module.name in self.variables or 'iter' not in self.extern_c:
+            return False
+        overload : Optional[tuple[str, str]] = find_overload(self.extern_functions.get('iter.range_int', {}), ('int', 'int', 'int'))
+        return overload is not None and overload[0] == 'iter_list_int_range'
+
+    def find_range_lists(self, body:list[ArtemisNode]) -> set[str]:
+        # A range list named anywhere but as a for-in iterable is used as a value, so it keeps its List
+        candidates : set[str] = set()
+        others : set[str] = set()
+        iterables : set[int] = set()
+        for node in walk(body):
+            if node.kind == NodeKind.DECLARE_LIST:
+                ranged : bool = node.element_type == 'int' and node.value.kind == NodeKind.CALL_METHOD and node.value.method == 'range_int'
+                (candidates if ranged else others).add(node.name)
+            elif node.kind == NodeKind.FOR_IN and node.iterable.kind == NodeKind.VAR:
+                iterables.add(id(node.iterable))
+        used : set[str] = {node.name for node in walk(body) if node.kind == NodeKind.VAR and id(node) not in iterables}
+        return candidates - others - used
+
+    def range_arguments(self, expression:ArtemisNode) -> Optional[tuple[ir.Value, ir.Value, ir.Value]]:
+        # (start, end, step) of a for-in iterable that is a range, None when it has to be iterated as a List
+        if expression.kind == NodeKind.VAR and expression.name in self.range_slots:
+            return tuple(self.builder.load(slot) for slot in self.range_slots[expression.name])
+        if not self.is_range_call(expression):
+            return None
+        values : list[ir.Value] = [self.compile_expression(arg) for arg in expression.args]
+        if any(value.type != TypeEnum.int32 for value in values):
+            arg_types : tuple[str, ...] = tuple(ir_to_string(value.type) for value in values)
+            raise TypeError(f'Function iter.range_int has no overload matching argument types {arg_types} at {expression.location()}')
+        return tuple(values)
+
+    def range_count(self, start:ir.Value, end:ir.Value, step:ir.Value) -> ir.Value:
+        # Number of values iter_list_int_range would produce, worked out in i64 so nothing overflows,
+        # a zero step or one pointing away from end gives 0
+        start, end, step = (self.builder.sext(value, TypeEnum.int64) for value in (start, end, step))
+        zero : ir.Constant = ir.Constant(TypeEnum.int64, 0)
+        one : ir.Constant = ir.Constant(TypeEnum.int64, 1)
+        upward : ir.Value = self.builder.and_(self.builder.icmp_signed('>', step, zero), self.builder.icmp_signed('<', start, end))
+        downward : ir.Value = self.builder.and_(self.builder.icmp_signed('<', step, zero), self.builder.icmp_signed('>', start, end))
+        distance : ir.Value = self.builder.select(upward, self.builder.sub(end, start), self.builder.sub(start, end))
+        stride : ir.Value = self.builder.select(upward, step, self.builder.neg(step))
+        # The divisor is never 0, when the range is empty the quotient is discarded
+        moves : ir.Value = self.builder.or_(upward, downward)
+        divisor : ir.Value = self.builder.select(moves, stride, one)
+        count : ir.Value = self.builder.sdiv(self.builder.sub(self.builder.add(distance, stride), one), divisor)
+        return self.builder.select(moves, count, zero)
+
+    def compile_range_loop(self, statement:ArtemisNode, start:ir.Value, end:ir.Value, step:ir.Value) -> None:
+        # for (int i in iter.range_int(start, end, step)) as a counted loop, no List is built
+        var_type, var_name, body = statement.type, statement.name, statement.body
+        if var_type != 'int':
+            raise TypeError(f'Range elements are int, not {var_type} at {statement.location()}')
+        count : ir.Value = self.range_count(start, end, step)
+        first : ir.Value = self.builder.sext(start, TypeEnum.int64)
+        stride : ir.Value = self.builder.sext(step, TypeEnum.int64)
+        index_pointer : ir.AllocaInstr = self.entry_alloca(TypeEnum.int64, name=f'{var_name}_index')
+        self.safe_store(ir.Constant(TypeEnum.int64, 0), index_pointer)
+        conditional_block : ir.Block = self.func.append_basic_block(f'range_conditional_{self.loop_counter}')
+        body_block : ir.Block = self.func.append_basic_block(f'range_body_{self.loop_counter}')
+        end_block : ir.Block = self.func.append_basic_block(f'range_end_{self.loop_counter}')
+        continue_block : ir.Block = self.func.append_basic_block(f'range_continue_{self.loop_counter}')
+        self.loop_counter += 1
+        self.builder.branch(conditional_block)
+        self.builder.position_at_start(conditional_block)
+        index_value : ir.LoadInstr = self.builder.load(index_pointer)
+        cond : ir.ICMPInstr = self.builder.icmp_signed('<', index_value, count)
+        self.builder.cbranch(cond, body_block, end_block)
+        self.builder.position_at_start(body_block)
+        # start + index * step stays between start and end, so it fits the int
+        element_value : ir.Value = self.builder.trunc(self.builder.add(first, self.builder.mul(index_value, stride, flags=['nsw']), flags=['nsw']), TypeEnum.int32)
+        variable_pointer : ir.AllocaInstr = self.entry_alloca(TypeEnum.int32, name=var_name)
+        self.safe_store(element_value, variable_pointer)
+        self.variables[var_name] = (variable_pointer, TypeEnum.int32)
+        self.loop_continue_stack.append(continue_block)
+        self.loop_break_stack.append(end_block)
+        for for_in_statement in body:
+            self.compile_statement(for_in_statement)
+        self.loop_continue_stack.pop()
+        self.loop_break_stack.pop()
+        if not self.builder.block.is_terminated:
+            self.builder.branch(continue_block)
+        self.builder.position_at_start(continue_block)
+        new_index = self.builder.add(index_value, ir.Constant(TypeEnum.int64, 1), flags=['nsw'])
+        self.safe_store(new_index, index_pointer)
+        self.builder.branch(conditional_block)
+        self.builder.position_at_start(end_block)
+
+    def compile_function(self, node:FunctionNode):
+        name, parameters, statements, return_type = node.name, node.params, node.body, node.return_type
+        arg_types : list[ir.Type] = [string_to_ir(parameter.type) for parameter in parameters]
         func_type : ir.FunctionType = ir.FunctionType(string_to_ir(return_type), arg_types)
         self.func : ir.Function = ir.Function(self.module, func_type, name=name)
         block : ir.Block = self.func.append_basic_block(f'entry_{self.function_counter}')
         self.function_counter += 1
         self.builder : ir.IRBuilder = ir.IRBuilder(block)
+        self.entry_alloca_count = 0
         self.variables = {}
+        self.list_types = {}
+        self.list_values = {}
+        self.range_lists = self.find_range_lists(statements)
+        self.range_slots = {}
         self.current_function_return_type : str = return_type
-        for i, (_id, _type, name) in enumerate(parameters):
+        for i, parameter in enumerate(parameters):
+            name : str = parameter.name
             arg = self.func.args[i]
             arg.name = name
-            ptr : ir.AllocaInstr = self.builder.alloca(arg.type, name=name)
+            ptr : ir.AllocaInstr = self.entry_alloca(arg.type, name=name)
             self.safe_store(arg, ptr)
             self.variables[name] = (ptr, arg.type)
         for statement in statements:
@@ -187,12 +448,12 @@ class ArtemisCompiler:
         if self.builder.block.terminator is None:
             raise Exception(f'Missing return in function {name}')
     
-    def compile_class(self, node:tuple) -> None:
-        _, name, body = node
-        fields = [m for m in body if m[0] == 'field']
-        methods = [m for m in body if m[0] == 'method']
+    def compile_class(self, node:ClassNode) -> None:
+        name, body = node.name, node.body
+        fields : list[FieldNode] = [m for m in body if m.kind == NodeKind.FIELD]
+        methods : list[MethodNode] = [m for m in body if m.kind == NodeKind.METHOD]
         struct_type = ir.global_context.get_identified_type(name)
-        field_types = [string_to_ir(ftype) for _, ftype, _, _ in fields]
+        field_types = [string_to_ir(field.type) for field in fields]
         struct_type.set_body(*field_types)
         self.compiler_data.class_bodies[name] = {
             'fields': fields,
@@ -204,75 +465,164 @@ class ArtemisCompiler:
             self.compile_method(name, method)
         self.current_class = None
 
+    def sub_module_key(self, sub_module:str, search_dir:str) -> str:
+        with open(os.path.join(search_dir, sub_module + arx_extension), 'rb') as f:
+            source : bytes = f.read()
+        parts : list[str] = [version_string, get_compiler_fingerprint(self.compiler_data.map_paths), llvmlite.__version__, hash_bytes(source)]
+        for dependency in sorted(read_using_modules(source.decode('utf-8', errors='replace'))):
+            if os.path.exists(os.path.join(search_dir, dependency + arx_extension)):
+                parts.append(f'{dependency}:{self.sub_module_key(dependency, search_dir)}')
+                continue
+            for path in sorted(self.compiler_data.map_paths):
+                map_file : str = os.path.join(path, dependency + '.map')
+                if os.path.isfile(map_file):
+                    parts.append(f'{dependency}.map:{hash_file(map_file)}')
+        return ArtemisCache.make_key(*parts)
+
+    def load_cached_sub(self, sub_module:str, search_dir:str, module_key:str) -> Optional[tuple[dict, bytes]]:
+        module_cache : Optional[ArtemisCache] = self.compiler_data.module_cache
+        if module_cache is None:
+            return None
+        metadata_bytes : Optional[bytes] = module_cache.read(module_key, '.json')
+        bitcode : Optional[bytes] = module_cache.read(module_key, '.bc') if metadata_bytes is not None else None
+        module_cache.count(bitcode is not None)
+        if bitcode is None:
+            return None
+        debug_print(f'[cache] (module) {sub_module} (hit)')
+        return (json.loads(metadata_bytes), bitcode)
+
+    def store_cached_sub(self, module_key:str, metadata:dict, module_ref:binding.ModuleRef) -> None:
+        module_cache : Optional[ArtemisCache] = self.compiler_data.module_cache
+        if module_cache is None:
+            return
+        module_cache.write(module_key, '.bc', module_ref.as_bitcode())
+        module_cache.write(module_key, '.json', json.dumps(metadata).encode('utf-8'))
+
+    def make_interface(self, sub_module:str, functions:dict[str, list]) -> ir.Module:
+        interface : ir.Module = ir.Module(name=sub_module)
+        for mangled_name, (return_type, parameter_types) in functions.items():
+            func_type : ir.FunctionType = ir.FunctionType(string_to_ir(return_type), [string_to_ir(t) for t in parameter_types])
+            ir.Function(interface, func_type, name=mangled_name)
+        return interface
+
     def compile_sub(self, sub_module:str, search_dir:str) -> tuple[set[str], ir.Module]:
         if sub_module in self.extern_modules:
             return (self.extern_c, self.extern_modules[sub_module])
         sub_compiler : ArtemisCompiler = ArtemisCompiler(self.compiler_data)
-        ast : tuple = parse_file(os.path.join(search_dir, sub_module + arx_extension))
-        using_modules : set[str] = {mod[1] for mod in ast[1]}
-        debug_print(using_modules)
-        body : tuple = ast[2]
-        sub_compiler.load_using(using_modules, search_dir)
-        for section in body:
-            match section[0]:
-                case 'function':
-                    sub_compiler.compile_function(section)
-                case 'class':
-                    sub_compiler.compile_class(section)
-        namespace_map : dict[str, str] = {}
+        module_key : str = self.sub_module_key(sub_module, search_dir)
+        cached : Optional[tuple[dict, bytes]] = self.load_cached_sub(sub_module, search_dir, module_key)
+        if cached:
+            metadata, bitcode = cached
+            with open(os.path.join(search_dir, sub_module + arx_extension)) as f:
+                sub_compiler.load_using(read_using_modules(f.read()), search_dir)
+            sub_binding : binding.ModuleRef = binding.parse_bitcode(bitcode)
+        else:
+            ast : ProgramNode = parse_file(os.path.join(search_dir, sub_module + arx_extension))
+            using_modules : set[str] = {using.name for using in ast.usings}
+            debug_print(using_modules)
+            sub_compiler.load_using(using_modules, search_dir)
+            functions : dict[str, list] = {}
+            for section in ast.body:
+                match section.kind:
+                    case NodeKind.FUNCTION:
+                        sub_compiler.compile_function(section)
+                        functions[f'{sub_module}_{section.name}'] = [section.return_type, [parameter.type for parameter in section.params]]
+                    case NodeKind.CLASS:
+                        sub_compiler.compile_class(section)
+            sub_binding : binding.ModuleRef = binding.parse_assembly(str(sub_compiler.module))
+            namespace_map : dict[str, str] = {}
+            for global_value in list(sub_binding.functions) + list(sub_binding.global_variables):
+                if global_value.is_declaration or global_value.linkage == binding.Linkage.private:
+                    continue
+                namespace_map[global_value.name] = f'{sub_module}_{global_value.name}'
+                global_value.name = namespace_map[global_value.name]
+            metadata : dict = {
+                'namespace': namespace_map,
+                'extern_c': sorted(sub_compiler.extern_c),
+                'functions': functions
+            }
+            self.store_cached_sub(module_key, metadata, sub_binding)
+        interface : ir.Module = self.make_interface(sub_module, metadata['functions'])
+        self.extern_c.update(metadata['extern_c'])
         self.extern_c.update(sub_compiler.extern_c)
-        for unmangled_name, global_value in list(sub_compiler.module.globals.items()):
-            mangled_name : str = f'{sub_module}_{unmangled_name}'
-            is_c : bool = False
-            for c_lib in [f'{c}_' for c in self.extern_c]:
-                if unmangled_name.startswith(c_lib):
-                    is_c = True
-            if is_c:
-                continue
-            global_value.name = mangled_name
-            sub_compiler.module.globals[mangled_name] = sub_compiler.module.globals.pop(unmangled_name)
-            namespace_map[unmangled_name] = mangled_name
-        self.extern_modules_namespace[sub_module] = namespace_map
-        self.extern_modules[sub_module] = sub_compiler.module
-        return (sub_compiler.extern_c, sub_compiler.module)
-
-    def compile_exec(self, file_in:str) -> str:
-        ast : tuple = parse_file(file_in)
-        using_modules : set = {mod[1] for mod in ast[1]}
+        self.link_units.update(sub_compiler.link_units)
+        self.link_units[sub_module] = sub_binding
+        self.extern_modules_namespace[sub_module] = metadata['namespace']
+        self.extern_modules[sub_module] = interface
+        return (sub_compiler.extern_c, interface)
+
+    def compile_exec(self, file_in:str) -> binding.ModuleRef:
+        ast : ProgramNode = parse_file(file_in)
+        using_modules : set = {using.name for using in ast.usings}
         debug_print(using_modules)
-        body : tuple = ast[2]
         self.load_using(using_modules, os.path.dirname(file_in))
-        for section in body:
-            match section[0]:
-                case 'function':
+        for section in ast.body:
+            match section.kind:
+                case NodeKind.FUNCTION:
                     self.compile_function(section)
-                case 'class':
+                case NodeKind.CLASS:
                     self.compile_class(section)
         self.add_c_main()
-        exec_module_lines : list[str] = str(self.module).splitlines()
-        final_ir_lines : list[str] = []
-        declare_set : set[str] = set()
-        for line in exec_module_lines:
-            if not line.startswith('; ModuleID'):
-                final_ir_lines.append(line)
-            if line.startswith('declare'):
-                declare_set.add(line)
-        for sub_name, sub_module in self.extern_modules.items():
-            sub_ir_lines = str(sub_module).splitlines()
-            for line in sub_ir_lines:
-                if line.startswith('; ModuleID') or line.startswith('target triple') or line.startswith('target datalayout'):
-                    continue
-                if line.startswith('declare'):
-                    if line in declare_set:
-                        continue
-                    declare_set.add(line)
-                for unmangled_name, mangled_name in self.extern_modules_namespace[sub_name].items():
-                    line = line.replace(f'@{unmangled_name}', f'@{mangled_name}')
-                final_ir_lines.append(line)
-        exec_module : str = '\n'.join(final_ir_lines)
-        exec_binding : binding.ModuleRef = binding.parse_assembly(exec_module)
+        exec_binding : binding.ModuleRef = binding.parse_assembly(str(self.module))
+        for sub_name, sub_binding in self.link_units.items():
+            debug_print(f'[link] {sub_name}')
+            exec_binding.link_in(sub_binding)
+        self.merge_constants(exec_binding)
         exec_binding.verify()
-        return str(exec_binding)
+        return exec_binding
+
+    def link_runtime(self, module_ref:binding.ModuleRef, bitcode_paths:list[str]) -> None:
+        # (--lto) The C runtime joins the program module before optimization so its helpers can inline,
+        # everything but the entry points becomes internal so unused runtime code is dropped
+        for bitcode_path in bitcode_paths:
+            debug_print(f'[link] {bitcode_path}')
+            with open(bitcode_path, 'rb') as f:
+                bitcode : bytes = f.read()
+            try:
+                runtime_ref : binding.ModuleRef = binding.parse_bitcode(bitcode)
+            except RuntimeError as e:
+                llvm_version : str = '.'.join(str(part) for part in binding.llvm_version_info)
+                raise EnvironmentError(f'Bitcode at [ {bitcode_path} ] is not readable by LLVM {llvm_version}, make sure (clang) is not newer than that.') from e
+            module_ref.link_in(runtime_ref)
+        for global_value in list(module_ref.functions) + list(module_ref.global_variables):
+            if global_value.is_declaration or global_value.name in entry_points or global_value.name.startswith('llvm.'):
+                continue
+            if global_value.linkage == binding.Linkage.external:
+                global_value.linkage = binding.Linkage.internal
+        module_ref.verify()
+
+    def merge_constants(self, module_ref:binding.ModuleRef) -> None:
+        # Each module pools its own literals, this folds the duplicates that linking brought together
+        module_pass_manager : binding.PassManager = binding.create_module_pass_manager()
+        module_pass_manager.add_constant_merge_pass()
+        module_pass_manager.run(module_ref)
+
+    def optimize(self, module_ref:binding.ModuleRef) -> None:
+        speed_level : int = self.compiler_data.optimization_level
+        size_level : int = self.compiler_data.size_level
+        if speed_level == 0 and size_level == 0:
+            return
+        if size_level > 0:
+            # The new pass manager in llvmlite aborts on (speed 2, size 1), use the legacy pipeline for (-Os)
+            pass_manager_builder : binding.PassManagerBuilder = binding.create_pass_manager_builder()
+            pass_manager_builder.opt_level = speed_level
+            pass_manager_builder.size_level = size_level
+            pass_manager_builder.inlining_threshold = 75
+            pass_manager_builder.slp_vectorize = True
+            module_pass_manager : binding.PassManager = binding.create_module_pass_manager()
+            self.target_machine.add_analysis_passes(module_pass_manager)
+            pass_manager_builder.populate(module_pass_manager)
+            module_pass_manager.run(module_ref)
+        else:
+            tuning : binding.PipelineTuningOptions = binding.create_pipeline_tuning_options(speed_level=speed_level, size_level=0)
+            tuning.loop_vectorization = speed_level >= 2
+            tuning.slp_vectorization = speed_level >= 2
+            pass_builder : binding.PassBuilder = binding.create_pass_builder(self.target_machine, tuning)
+            pass_builder.getModulePassManager().run(module_ref, pass_builder)
+        module_ref.verify()
+
+    def emit_object(self, module_ref:binding.ModuleRef) -> bytes:
+        return self.target_machine.emit_object(module_ref)
 
     def compile_this_access(self, field_name:str):
         field_ptr = self.get_this_field_pointer(field_name)
@@ -285,43 +635,39 @@ class ArtemisCompiler:
         class_name = getattr(self, 'current_class', None)
         if not class_name:
             raise RuntimeError('No current_class while compiling this access')
-        fields = self.compiler_data.class_bodies[class_name]['fields']
-        idx = next((i for i, (_, _, fname, _) in enumerate(fields) if fname == field_name), None)
+        fields : list[FieldNode] = self.compiler_data.class_bodies[class_name]['fields']
+        idx = next((i for i, field in enumerate(fields) if field.name == field_name), None)
         if idx is None:
             raise NameError(f'Field {field_name} not found on {class_name}')
         return self.builder.gep(this_ptr, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), idx)])
 
-    def get_field_pointer_general(self, obj_expression:tuple, field_name:str) -> ir.GEPInstr:
-        if obj_expression == ('this',) or (isinstance(obj_expression, tuple) and len(obj_expression) == 1 and obj_expression[0] == 'this'):
-            return self.get_this_field_pointer(field_name)
-        if isinstance(obj_expression, tuple):
-            if len(obj_expression) == 2 and obj_expression[0] == 'var':
-                variable_name = obj_expression[1]
-            else:
-                variable_name = obj_expression[0]
-        elif isinstance(obj_expression, str):
-            variable_name = obj_expression
-        else:
-            raise RuntimeError(f'Unexpected object expression for field access: {obj_expression}')
+    def get_field_pointer_general(self, obj_expression:ArtemisNode, field_name:str) -> ir.GEPInstr:
+        match obj_expression.kind:
+            case NodeKind.THIS:
+                return self.get_this_field_pointer(field_name)
+            case NodeKind.VAR:
+                variable_name : str = obj_expression.name
+            case _:
+                raise RuntimeError(f'Unexpected object expression for field access: {obj_expression} at {obj_expression.location()}')
         if variable_name not in self.variables:
             raise NameError(f'Undefined variable (object) for field access: {variable_name}')
         obj_pointer, obj_type = self.variables[variable_name]
         class_name = getattr(getattr(obj_type, 'pointee', None), 'name', None)
         if not class_name:
             raise RuntimeError(f'Object {variable_name} does not have a valid class type')
-        fields = self.compiler_data.class_bodies[class_name]['fields']
-        idx = next((i for i, (_, _, fname, _) in enumerate(fields) if fname == field_name), None)
+        fields : list[FieldNode] = self.compiler_data.class_bodies[class_name]['fields']
+        idx = next((i for i, field in enumerate(fields) if field.name == field_name), None)
         if idx is None:
             raise NameError(f'Field {field_name} not found on {class_name}')
         return self.builder.gep(obj_pointer, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), idx)])
 
-    def compile_method(self, class_name: str, method_node: tuple) -> None:
-        _, return_type, method_name, parameters, statements = method_node
+    def compile_method(self, class_name: str, method_node: MethodNode) -> None:
+        return_type, method_name, parameters, statements = method_node.return_type, method_node.name, method_node.params, method_node.body
         mangled = f'{class_name}_{method_name}'
         struct_type: ir.IdentifiedStructType = self.compiler_data.class_bodies[class_name]['struct']
         this_ir: ir.PointerType = struct_type.as_pointer()
-        param_types = [string_to_ir(t) for _, t, _ in parameters]
-        param_names = [n for _, _, n in parameters]
+        param_types = [string_to_ir(parameter.type) for parameter in parameters]
+        param_names = [parameter.name for parameter in parameters]
         return_ir = string_to_ir(return_type) if return_type != 'void' else ir.VoidType()
         func_type = ir.FunctionType(return_ir, [this_ir] + param_types)
         function = self.module.globals.get(mangled)
@@ -331,19 +677,25 @@ class ArtemisCompiler:
         builder = ir.IRBuilder(block)
         previous_builder = self.builder
         previous_func = self.func
+        previous_alloca_count = self.entry_alloca_count
+        previous_range_lists, previous_range_slots = self.range_lists, self.range_slots
         self.builder = builder
         self.func = function
+        self.entry_alloca_count = 0
+        self.range_lists = self.find_range_lists(statements)
+        self.range_slots = {}
         self.local_vars = {}
         args_iter = iter(function.args)
         this_arg = next(args_iter)
         self.local_vars['this'] = this_arg
         for name, llvm_arg in zip(param_names, args_iter):
-            a_ptr = builder.alloca(llvm_arg.type)
+            a_ptr = self.entry_alloca(llvm_arg.type)
             builder.store(llvm_arg, a_ptr)
             self.local_vars[name] = a_ptr
         if method_name == '_init':
             fields = self.compiler_data.class_bodies[class_name]['fields']
-            for i, (tag, ftype, fname, init_expr) in enumerate(fields):
+            for i, field in enumerate(fields):
+                init_expr : Optional[ArtemisNode] = field.value
                 field_ptr = self.builder.gep(
                     this_arg,
                     [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), i)]
@@ -366,50 +718,68 @@ class ArtemisCompiler:
             builder.ret_void()
         self.builder = previous_builder
         self.func = previous_func
+        self.entry_alloca_count = previous_alloca_count
+        self.range_lists, self.range_slots = previous_range_lists, previous_range_slots
 
-    def compile_statement(self, statement:tuple) -> None:
-        kind : str = statement[0]
-        match kind:
-            case 'expression':
-                self.compile_expression(statement[1])
-            case 'return':
-                return_value = self.compile_expression(statement[1])
+    def compile_statement(self, statement:ArtemisNode) -> None:
+        match statement.kind:
+            case NodeKind.EXPRESSION:
+                self.compile_expression(statement.expression)
+            case NodeKind.RETURN:
+                return_value = self.compile_expression(statement.value)
                 self.builder.ret(return_value)
-            case 'return_void':
+            case NodeKind.RETURN_VOID:
                 if self.current_function_return_type != 'void':
                     raise TypeError('Void return used in non-void function')
                 self.builder.ret_void()
-            case 'declare':
-                variable_type_str, variable_name, value_expr = statement[1], statement[2], statement[3]
+            case NodeKind.DECLARE:
+                variable_type_str, variable_name, value_expr = statement.type, statement.name, statement.value
                 value = self.compile_expression(value_expr)
                 match variable_type_str:
                     case 'int':
-                        ptr : ir.AllocaInstr = self.builder.alloca(TypeEnum.int32, name=variable_name)
+                        ptr : ir.AllocaInstr = self.entry_alloca(TypeEnum.int32, name=variable_name)
+                        self.safe_store(value, ptr)
+                        self.variables[variable_name] = (ptr, value.type)
+                    case 'float':
+                        ptr : ir.AllocaInstr = self.entry_alloca(TypeEnum.float32, name=variable_name)
                         self.safe_store(value, ptr)
                         self.variables[variable_name] = (ptr, value.type)
                     case 'bool':
-                        ptr : ir.AllocaInstr = self.builder.alloca(TypeEnum.boolean, name=variable_name)
+                        ptr : ir.AllocaInstr = self.entry_alloca(TypeEnum.boolean, name=variable_name)
                         self.safe_store(value, ptr)
                         self.variables[variable_name] = (ptr, value.type)
                     case 'string':
-                        ptr : ir.AllocaInstr = self.builder.alloca(TypeEnum.string, name=variable_name)
+                        ptr : ir.AllocaInstr = self.entry_alloca(TypeEnum.string, name=variable_name)
+                        self.safe_store(value, ptr)
+                        self.variables[variable_name] = (ptr, TypeEnum.string)
+                    case 'view':
+                        if value.type != TypeEnum.string_view:
+                            raise TypeError(f'Cannot assign {value.type} to view {variable_name} at {statement.location()}')
+                        ptr : ir.AllocaInstr = self.entry_alloca(TypeEnum.string_view, name=variable_name)
                         self.safe_store(value, ptr)
                         self.variables[variable_name] = (ptr, value.type)
                     case _:
                         raise NotImplementedError(f'Unsupported type: {variable_type_str}')
-            case 'declare_custom':
-                type_name, var_name, constructor_call = statement[1], statement[2], statement[3]
-                if constructor_call[0] == 'call' and constructor_call[1] == type_name:
-                    obj_pointer = self.compile_expression(('object_creation', type_name, constructor_call[2]))
+            case NodeKind.DECLARE_CUSTOM:
+                type_name, var_name, constructor_call = statement.type_name, statement.name, statement.value
+                if constructor_call.kind == NodeKind.CALL and constructor_call.name == type_name:
+                    obj_pointer = self.compile_expression(ObjectCreationNode(type_name, constructor_call.args).copy_span(constructor_call))
                 else:
                     obj_pointer = self.compile_expression(constructor_call)
-                self.variables[var_name] = (obj_pointer, obj_pointer.type)
-            case 'if_chain':
-                branches = statement[1]
+                if type_name not in self.compiler_data.class_bodies:
+                    # Runtime handles (any:StringBuilder) live in a slot like any other pointer
+                    slot : ir.AllocaInstr = self.entry_alloca(obj_pointer.type, name=var_name)
+                    self.safe_store(obj_pointer, slot)
+                    self.variables[var_name] = (slot, obj_pointer.type)
+                else:
+                    self.variables[var_name] = (obj_pointer, obj_pointer.type)
+            case NodeKind.IF_CHAIN:
+                branches = statement.branches
                 end_block : ir.Block = self.func.append_basic_block(f'if_end_{self.if_counter}')
                 self.if_counter += 1
                 has_fallthrough : bool = False
-                for i, (condition_expression, statements) in enumerate(branches):
+                for i, branch in enumerate(branches):
+                    condition_expression, statements = branch.condition, branch.body
                     then_block : ir.Block = self.func.append_basic_block(f'if_then_{i}')
                     next_block : ir.Block = self.func.append_basic_block(f'if_next_{i}') if i < len(branches) - 1 else end_block
                     if condition_expression is not None:
@@ -427,34 +797,51 @@ class ArtemisCompiler:
                         self.builder.position_at_start(next_block)
                 if has_fallthrough and not end_block.is_terminated:
                     self.builder.position_at_start(end_block)
-            case 'for_in':
-                var_type, var_name, list_name, body = statement[1], statement[2], statement[3], statement[4]
-                index_pointer : ir.AllocaInstr = self.builder.alloca(TypeEnum.int32, name=f"{var_name}_index")
+            case NodeKind.FOR_IN:
+                var_type, var_name, iterable, body = statement.type, statement.name, statement.iterable, statement.body
+                range_values : Optional[tuple[ir.Value, ir.Value, ir.Value]] = self.range_arguments(iterable)
+                if range_values is not None:
+                    self.compile_range_loop(statement, *range_values)
+                    return
+                if iterable.kind == NodeKind.VAR:
+                    if iterable.name not in self.variables:
+                        raise NameError(f'Undefined list: {iterable.name} at {statement.location()}')
+                    list_pointer : ir.Value = self.builder.load(self.variables[iterable.name][0], name=f'{iterable.name}_list')
+                else:
+                    list_pointer : ir.Value = self.compile_expression(iterable)
+                if list_pointer.type != self.list_struct_type.as_pointer():
+                    raise TypeError(f'Cannot iterate over {list_pointer.type} at {statement.location()}')
+                self.check_list_type(statement, iterable, list_pointer, var_type)
+                element_type : ir.Type = self.list_element_type(var_type)
+                index_pointer : ir.AllocaInstr = self.entry_alloca(TypeEnum.int32, name=f"{var_name}_index")
                 self.safe_store(ir.Constant(TypeEnum.int32, 0), index_pointer)
+                setup_block : ir.Block = self.func.append_basic_block(f'for_setup_{self.loop_counter}')
                 conditional_block : ir.Block = self.func.append_basic_block(f'for_conditional_{self.loop_counter}')
                 body_block : ir.Block = self.func.append_basic_block(f'for_body_{self.loop_counter}')
                 end_block : ir.Block = self.func.append_basic_block(f'for_end_{self.loop_counter}')
                 continue_block : ir.Block = self.func.append_basic_block(f'for_continue_{self.loop_counter}')
                 self.loop_counter += 1
+                # A null list iterates zero times, as core_list_len treats it as empty
+                has_list : ir.ICMPInstr = self.builder.icmp_unsigned('!=', list_pointer, ir.Constant(list_pointer.type, None))
+                self.builder.cbranch(has_list, setup_block, end_block)
+                self.builder.position_at_start(setup_block)
+                # The index only runs from 0 to length, so elements are read without bounds checks.
+                # data and length are loaded once unless the body may touch a list
+                hoisted : bool = self.keeps_lists(body)
+                if hoisted:
+                    list_data, list_length = self.load_list_fields(list_pointer, element_type)
                 self.builder.branch(conditional_block)
                 self.builder.position_at_start(conditional_block)
-                list_pointer : ir.AllocaInstr = self.variables[list_name][0]
                 index_value : ir.LoadInstr = self.builder.load(index_pointer)
-                list_len : ir.CallInstr = self.call_list_len(list_pointer)
-                cond : ir.ICMPInstr = self.builder.icmp_signed('<', index_value, list_len)
+                if not hoisted:
+                    list_data, list_length = self.load_list_fields(list_pointer, element_type)
+                cond : ir.ICMPInstr = self.builder.icmp_signed('<', index_value, list_length)
                 self.builder.cbranch(cond, body_block, end_block)
                 self.builder.position_at_start(body_block)
-                element_pointer : ir.CallInstr = self.call_list_get(list_pointer, index_value)
-                element_type : ir.Type = string_to_ir(var_type)
-                if element_type.is_pointer:
-                    element_value = self.builder.bitcast(element_pointer, element_type)
-                else:
-                    casted_ptr = self.builder.bitcast(
-                        element_pointer,
-                        element_type.as_pointer()
-                    )
-                    element_value = self.builder.load(casted_ptr)
-                variable_pointer = self.builder.alloca(string_to_ir(var_type), name=var_name)
+                element_pointer : ir.GEPInstr = self.builder.gep(list_data, [index_value], inbounds=True)
+                # A view element is used where it sits in the list, nothing is copied
+                element_value : ir.Value = element_pointer if var_type == 'view' else self.builder.load(element_pointer)
+                variable_pointer = self.entry_alloca(element_value.type, name=var_name)
                 self.safe_store(element_value, variable_pointer)
                 self.variables[var_name] = (variable_pointer, string_to_ir(var_type))
                 self.loop_continue_stack.append(continue_block)
@@ -463,14 +850,15 @@ class ArtemisCompiler:
                     self.compile_statement(for_in_statement)
                 self.loop_continue_stack.pop()
                 self.loop_break_stack.pop()
-                self.builder.branch(continue_block)
+                if not self.builder.block.is_terminated:
+                    self.builder.branch(continue_block)
                 self.builder.position_at_start(continue_block)
-                new_index = self.builder.add(index_value, ir.Constant(TypeEnum.int32, 1))
+                new_index = self.builder.add(index_value, ir.Constant(TypeEnum.int32, 1), flags=['nsw'])
                 self.safe_store(new_index, index_pointer)
                 self.builder.branch(conditional_block)
                 self.builder.position_at_start(end_block)
-            case 'while':
-                condition_expr, body = statement[1], statement[2]
+            case NodeKind.WHILE:
+                condition_expr, body = statement.condition, statement.body
                 condition_block: ir.Block = self.func.append_basic_block(f'while_conditional_{self.loop_counter}')
                 body_block: ir.Block = self.func.append_basic_block(f'while_body_{self.loop_counter}')
                 end_block: ir.Block = self.func.append_basic_block(f'while_end_{self.loop_counter}')
@@ -491,54 +879,47 @@ class ArtemisCompiler:
                 self.builder.position_at_start(continue_block)
                 self.builder.branch(condition_block)
                 self.builder.position_at_start(end_block)
-            case 'declare_list':
-                element_type, name, expression = statement[1], statement[2], statement[3]
-                if expression[0] == 'list_literal':
-                    elements = [self.compile_expression(e) for e in expression[1]]
-                    llvm_element_type : ir.Type = string_to_ir(element_type)
-                    heap_pointer : ir.Value = self.allocate_and_copy_array(elements, llvm_element_type)
-                    create_fn_type : ir.FunctionType = ir.FunctionType(
-                        self.list_struct_type.as_pointer(),
-                        [TypeEnum.int8.as_pointer(), TypeEnum.int32, TypeEnum.int32, TypeEnum.boolean]
-                    )
-                    create_fn : ir.Function = self.module.globals.get('core_list_create_from')
-                    if create_fn is None:
-                        create_fn = ir.Function(self.module, create_fn_type, name='core_list_create_from')
-                    element_size_bytes : int = self.get_abi_size_from_ir_type(llvm_element_type)
-                    list_pointer = self.builder.call(
-                        create_fn,
-                        [
-                            heap_pointer,
-                            ir.Constant(TypeEnum.int32, len(elements)),
-                            ir.Constant(TypeEnum.int32, element_size_bytes),
-                            ir.Constant(TypeEnum.boolean, int(llvm_element_type.is_pointer))
-                        ]
-                    )
-                    self.variables[name] = (list_pointer, self.list_struct_type.as_pointer())
+            case NodeKind.DECLARE_LIST:
+                element_type, name, expression = statement.element_type, statement.name, statement.value
+                if name in self.range_lists and self.is_range_call(expression):
+                    # Only ever iterated, the bounds are evaluated here once and the loops count through them
+                    slots : list[ir.AllocaInstr] = []
+                    for part, value in zip(('start', 'end', 'step'), self.range_arguments(expression)):
+                        slot : ir.AllocaInstr = self.entry_alloca(TypeEnum.int32, name=f'{name}_{part}')
+                        self.safe_store(value, slot)
+                        slots.append(slot)
+                    self.range_slots[name] = tuple(slots)
+                    return
+                if expression.kind == NodeKind.LIST_LITERAL:
+                    list_pointer : ir.Value = self.compile_list_literal(expression.elements, self.list_element_type(element_type))
                 else:
-                    value : ir.CallInstr = self.compile_expression(expression)
-                    self.variables[name] = (value, value.type)
-            case 'break':
+                    list_pointer : ir.Value = self.compile_expression(expression)
+                    self.check_list_type(statement, expression, list_pointer, element_type)
+                slot : ir.AllocaInstr = self.entry_alloca(self.list_struct_type.as_pointer(), name=name)
+                self.safe_store(list_pointer, slot)
+                self.variables[name] = (slot, self.list_struct_type.as_pointer())
+                self.list_types[name] = 'list:' + ('str' if element_type == 'string' else element_type)
+            case NodeKind.BREAK:
                 self.builder.branch(self.loop_break_stack[-1])
-            case 'continue':
+            case NodeKind.CONTINUE:
                 self.builder.branch(self.loop_continue_stack[-1])
-            case 'assign':
-                target : tuple = statement[1]
-                expr : tuple = statement[2]
-                value : ir.Value = self.compile_expression(expr)
-                if isinstance(target, str):
-                    if target not in self.variables:
-                        raise NameError(f'Variable {target} is not declared')
-                    pointer : ir.AllocaInstr = self.variables[target][0]
+            case NodeKind.ASSIGN:
+                target : ArtemisNode = statement.target
+                value : ir.Value = self.compile_expression(statement.value)
+                if target.kind == NodeKind.VAR:
+                    if target.name not in self.variables:
+                        raise NameError(f'Variable {target.name} is not declared')
+                    pointer : ir.AllocaInstr = self.variables[target.name][0]
+                    value = self.view_as(value, pointer.type.pointee)
                     if pointer.type.pointee != value.type:
                         if pointer.type.pointee.is_pointer and value.type.is_pointer:
                             value = self.builder.bitcast(value, pointer.type.pointee)
                         else:
-                            raise TypeError(f'Type mismatch in assignment to {target} expected {pointer.type.pointee} and got {value.type}')
+                            raise TypeError(f'Type mismatch in assignment to {target.name} expected {pointer.type.pointee} and got {value.type}')
                     self.safe_store(value, pointer)
-                elif isinstance(target, tuple) and target[0] == 'get_attr':
-                    obj_expr = target[1]
-                    field_name = target[2]
+                elif target.kind == NodeKind.GET_ATTR:
+                    obj_expr = target.object
+                    field_name = target.name
                     field_ptr = self.get_field_pointer_general(obj_expr, field_name)
                     if field_ptr.type.pointee != value.type:
                         if field_ptr.type.pointee.is_pointer and value.type.is_pointer:
@@ -548,20 +929,20 @@ class ArtemisCompiler:
                     self.safe_store(value, field_ptr)
                 else:
                     raise NotImplementedError(f'Assignment target {target} not implemented')
-            case 'class':
+            case NodeKind.CLASS:
                 self.compile_class(statement)
 
-    def compile_expression(self, expression:tuple) -> Union[ir.Value, Any]:
-        kind : str = expression[0]
+    def compile_expression(self, expression:ArtemisNode) -> Union[ir.Value, Any]:
+        kind : NodeKind = expression.kind
         match kind:
-            case 'call':
-                name = expression[1]
-                args = expression[2]
+            case NodeKind.CALL:
+                name = expression.name
+                args = expression.args
                 arg_values = [self.compile_expression(arg) for arg in args]
                 if name in self.compiler_data.class_bodies:
                     info = self.compiler_data.class_bodies[name]
                     obj_type = info['struct']
-                    obj_pointer : ir.AllocaInstr = self.builder.alloca(obj_type)
+                    obj_pointer : ir.AllocaInstr = self.entry_alloca(obj_type)
                     init_name : str = '_init'
                     init_func_name : str = f'{name}_{init_name}'
                     init_func = self.module.globals.get(init_func_name)
@@ -577,10 +958,10 @@ class ArtemisCompiler:
                         func_type : ir.FunctionType = ir.FunctionType(TypeEnum.void, arg_values)
                         func : ir.Function = ir.Function(self.module, func_type, name=name)
                     return self.builder.call(func, arg_values)
-            case 'call_method':
-                obj_expression, method, args = expression[1], expression[2], expression[3]
-                if isinstance(obj_expression, tuple) and obj_expression[0] == 'var':
-                    obj_name = obj_expression[1]
+            case NodeKind.CALL_METHOD:
+                obj_expression, method, args = expression.object, expression.method, expression.args
+                if obj_expression.kind == NodeKind.VAR:
+                    obj_name = obj_expression.name
                     if obj_name in self.variables:
                         obj_pointer, obj_type = self.variables[obj_name]
                         class_name = getattr(getattr(obj_type, 'pointee', None), 'name', None)
@@ -599,27 +980,31 @@ class ArtemisCompiler:
                             raise NameError(f'Extern function {full_name} not found')
                         overloads = self.extern_functions[full_name]
                         arg_vals = [self.compile_expression(arg) for arg in args]
-                        arg_types = tuple(ir_to_string(arg.type) for arg in arg_vals)
-                        if arg_types not in overloads:
-                            raise TypeError(f'Function {full_name} has no overload matching argument types {arg_types}')
-                        llvm_name, return_type_id = overloads[arg_types]
+                        arg_types = tuple(self.argument_type(arg, value) for arg, value in zip(args, arg_vals))
+                        overload : Optional[tuple[str, str]] = find_overload(overloads, arg_types)
+                        if overload is None:
+                            raise TypeError(f'Function {full_name} has no overload matching argument types {arg_types} at {expression.location()}')
+                        llvm_name, return_type_id = overload
                         return_type: ir.Type = string_to_ir(return_type_id)
                         if return_type_id.startswith('list'):
                             return_type = self.list_struct_type.as_pointer()
-                        func: Optional[ir.Function] = self.module.globals.get(llvm_name)
-                        if not func:
-                            func_type: ir.FunctionType = ir.FunctionType(return_type, [arg.type for arg in arg_vals])
-                            func = ir.Function(self.module, func_type, name=llvm_name)
-                        return self.builder.call(func, arg_vals)
+                        func : ir.Function = self.declare_c_function(llvm_name, return_type, [arg.type for arg in arg_vals])
+                        call : ir.CallInstr = self.builder.call(func, arg_vals)
+                        if return_type_id.startswith('list:'):
+                            self.list_values[call] = return_type_id
+                        return call
                     elif obj_name in self.extern_modules.keys():
                         module : ir.Module = self.extern_modules[obj_name]
                         mangled_name : str = f'{obj_name}_{method}'
-                        func: Optional[ir.Function] = module.globals.get(mangled_name)
-                        if not func:
+                        module_func: Optional[ir.Function] = module.globals.get(mangled_name)
+                        if not module_func:
                             raise NameError(f'Method {mangled_name} not found in module {obj_name}')
+                        func: Optional[ir.Function] = self.module.globals.get(mangled_name)
+                        if not func:
+                            func = ir.Function(self.module, module_func.function_type, name=mangled_name)
                         call_args = [self.compile_expression(arg) for arg in args]
                         return self.builder.call(func, call_args)
-                elif obj_expression == ('this',):
+                elif obj_expression.kind == NodeKind.THIS:
                     obj_pointer, obj_type = self.variables['this']
                     class_name = getattr(getattr(obj_type, 'pointee', None), 'name', None)
                     if not class_name:
@@ -630,31 +1015,31 @@ class ArtemisCompiler:
                         raise NameError(f'Method {mangled_name} not found in module')
                     call_args = [obj_pointer] + [self.compile_expression(arg) for arg in args]
                     return self.builder.call(func, call_args)
-                raise NameError(f'Undefined object or module: {obj_expression}')
-            case 'int':
-                return ir.Constant(TypeEnum.int32, expression[1])
-            case 'float':
-                return ir.Constant(TypeEnum.float32, expression[1])
-            case 'string':
-                data : bytearray = bytearray(expression[1].encode('utf8') + b'\0')
-                str_type : ir.ArrayType = ir.ArrayType(ir.IntType(8), len(data))
-                global_str : ir.GlobalVariable = ir.GlobalVariable(self.module, str_type, name=f'string_{len(self.module.global_values)}')
-                global_str.global_constant = True
-                global_str.initializer = ir.Constant(str_type, data)
-                pointer = self.builder.bitcast(global_str, TypeEnum.string)
-                return pointer
-            case 'binop':
-                operator, left_part, right_part = expression[1], expression[2], expression[3]
+                raise NameError(f'Undefined object or module: {obj_expression} at {expression.location()}')
+            case NodeKind.INT:
+                return ir.Constant(TypeEnum.int32, expression.value)
+            case NodeKind.FLOAT:
+                return ir.Constant(TypeEnum.float32, expression.value)
+            case NodeKind.STRING:
+                return self.get_string_literal(expression.value)
+            case NodeKind.BINOP:
+                folded : Optional[str] = self.fold_string_literal(expression)
+                if folded is not None:
+                    return self.get_string_literal(folded)
+                operator, left_part, right_part = expression.operator, expression.left, expression.right
                 left_value = self.compile_expression(left_part)
                 right_value = self.compile_expression(right_part)
                 match operator:
                     case '==':
                         if left_value.type == TypeEnum.string and right_value.type == TypeEnum.string:
-                            llvm_name: str = 'core_string_equal'
-                            func : ir.Function = self.module.globals.get(llvm_name)
-                            if not func:
-                                func = ir.Function(self.module, ir.FunctionType(TypeEnum.boolean, [TypeEnum.string, TypeEnum.string]), name=llvm_name)
-                            return self.builder.call(func, [left_value, right_value])
+                            return self.call_core('core_string_equal', TypeEnum.boolean, [left_value, right_value])
+                        # Views compare by contents in place, against other views or strings
+                        if right_value.type == TypeEnum.string_view and left_value.type == TypeEnum.string:
+                            left_value, right_value = right_value, left_value
+                        if left_value.type == TypeEnum.string_view and right_value.type == TypeEnum.string_view:
+                            return self.call_core('core_view_equal', TypeEnum.boolean, [left_value, right_value])
+                        if left_value.type == TypeEnum.string_view and right_value.type == TypeEnum.string:
+                            return self.call_core('core_view_equal_str', TypeEnum.boolean, [left_value, right_value])
                         return self.builder.icmp_signed('==', left_value, right_value)
                     case '!=':
                         return self.builder.icmp_signed('!=', left_value, right_value)
@@ -668,11 +1053,7 @@ class ArtemisCompiler:
                         return self.builder.icmp_signed('>', left_value, right_value)
                     case '+':
                         if left_value.type == TypeEnum.string and right_value.type == TypeEnum.string:
-                            llvm_name: str = 'core_string_concat'
-                            func : ir.Function = self.module.globals.get(llvm_name)
-                            if not func:
-                                func = ir.Function(self.module, ir.FunctionType(TypeEnum.string, [TypeEnum.string, TypeEnum.string]), name=llvm_name)
-                            return self.builder.call(func, [left_value, right_value])
+                            return self.call_core('core_string_concat', TypeEnum.string, [left_value, right_value])
                         return self.builder.add(left_value, right_value)
                     case '-':
                         return self.builder.sub(left_value, right_value)
@@ -686,16 +1067,16 @@ class ArtemisCompiler:
                         return self.builder.or_(left_value, right_value)
                     case _:
                         raise NotImplementedError(f'Unsupported operator: {operator}')
-            case 'unop':
-                operator, expr = expression[1], expression[2]
+            case NodeKind.UNOP:
+                operator, expr = expression.operator, expression.operand
                 value = self.compile_expression(expr)
                 match operator:
                     case 'not':
                         return self.builder.xor(value, ir.Constant(TypeEnum.boolean, 1))
                     case _:
                         raise NotImplementedError(f'Unsupported unary operator: {operator}')
-            case 'var':
-                var_name : str = expression[1]
+            case NodeKind.VAR:
+                var_name : str = expression.name
                 if var_name in self.local_vars:
                     ptr : ir.AllocaInstr = self.local_vars[var_name]
                     return self.builder.load(ptr)
@@ -703,20 +1084,21 @@ class ArtemisCompiler:
                     ptr : ir.AllocaInstr = self.variables[var_name][0]
                     return self.builder.load(ptr)
                 else:
-                    raise NameError(f'Undefined variable: {var_name}')
-            case 'bool':
-                return ir.Constant(ir.IntType(1), 1 if expression[1] else 0)
-            case 'object_creation':
-                _, class_name, arguments = expression
+                    raise NameError(f'Undefined variable: {var_name} at {expression.location()}')
+            case NodeKind.BOOL:
+                return ir.Constant(ir.IntType(1), 1 if expression.value else 0)
+            case NodeKind.OBJECT_CREATION:
+                class_name, arguments = expression.class_name, expression.args
                 info = self.compiler_data.class_bodies.get(class_name)
                 if not info:
                     raise NameError(f'Unknown class {class_name}')
                 struct_type : ir.IdentifiedStructType = info['struct']
-                obj_pointer : ir.AllocaInstr = self.builder.alloca(struct_type)
+                obj_pointer : ir.AllocaInstr = self.entry_alloca(struct_type)
                 init_name : str = '_init'
                 ctor_name = f'{class_name}_{init_name}'
                 ctor = self.module.globals.get(ctor_name)
-                for idx, (tag, ftype, fname, init_expr) in enumerate(info['fields']):
+                for idx, field in enumerate(info['fields']):
+                    init_expr : Optional[ArtemisNode] = field.value
                     if init_expr is not None and not ctor:
                         field_ptr = self.builder.gep(obj_pointer, [ir.Constant(ir.IntType(32), 0), ir.Constant(ir.IntType(32), idx)])
                         value: ir.Value = self.compile_expression(init_expr)
@@ -727,12 +1109,12 @@ class ArtemisCompiler:
                     arg_values = [self.compile_expression(arg) for arg in arguments]
                     self.builder.call(ctor, [obj_pointer] + arg_values)
                 return obj_pointer
-            case 'get_attr':
-                obj_expression, field_name = expression[1], expression[2]
-                if obj_expression == ('this',):
+            case NodeKind.GET_ATTR:
+                obj_expression, field_name = expression.object, expression.name
+                if obj_expression.kind == NodeKind.THIS:
                     return self.compile_this_access(field_name)
-                if isinstance(obj_expression, tuple) and obj_expression[0] == 'var':
-                    obj_name = obj_expression[1]
+                if obj_expression.kind == NodeKind.VAR:
+                    obj_name = obj_expression.name
                     obj_pointer, obj_type = self.variables[obj_name]
                     class_name = getattr(getattr(obj_type, 'pointee', None), 'name', None)
                     if not class_name:
@@ -740,28 +1122,19 @@ class ArtemisCompiler:
                     field_pointer: ir.GEPInstr = self.get_field_pointer_general(obj_expression, field_name)
                     return self.builder.load(field_pointer)
                 raise RuntimeError(f'Unsupported attribute access on {obj_expression}')
-            case 'postinc' | 'postdec':
-                op : str = kind
-                target_expression = expression[1]
+            case NodeKind.POSTINC | NodeKind.POSTDEC:
+                op : NodeKind = kind
+                target_expression = expression.target
 
-                def resolve_pointer_and_type(t_expr:Union[tuple, str]):
-                    if isinstance(t_expr, tuple) and t_expr[0] == 'var':
-                        vname = t_expr[1]
+                def resolve_pointer_and_type(t_expr:ArtemisNode):
+                    if t_expr.kind == NodeKind.VAR:
+                        vname = t_expr.name
                         if vname not in self.variables:
-                            raise NameError(f'Undefined variable: {vname}')
+                            raise NameError(f'Undefined variable: {vname} at {t_expr.location()}')
                         return self.variables[vname][0]
-                    if isinstance(t_expr, tuple) and len(t_expr) == 1:
-                        vname = t_expr[0]
-                        if vname in self.variables:
-                            return self.variables[vname][0]
-                    if isinstance(t_expr, tuple) and t_expr[0] == 'get_attr':
-                        obj_expr = t_expr[1]
-                        field_name = t_expr[2]
-                        return self.get_field_pointer_general(obj_expr, field_name)
-                    if isinstance(t_expr, str):
-                        if t_expr in self.variables:
-                            return self.variables[t_expr][0]
-                    raise NotImplementedError(f'Unsupported target for ++/--: {t_expr}')
+                    if t_expr.kind == NodeKind.GET_ATTR:
+                        return self.get_field_pointer_general(t_expr.object, t_expr.name)
+                    raise NotImplementedError(f'Unsupported target for ++/--: {t_expr} at {t_expr.location()}')
                 
                 pointer = resolve_pointer_and_type(target_expression)
                 cur = self.builder.load(pointer)
@@ -770,9 +1143,9 @@ class ArtemisCompiler:
 
                 one : ir.Constant = ir.Constant(cur.type, 1)
                 match op:
-                    case 'postinc':
+                    case NodeKind.POSTINC:
                         new = self.builder.add(cur, one)
-                    case 'postdec':
+                    case NodeKind.POSTDEC:
                         new = self.builder.sub(cur, one)
                 self.builder.store(new, pointer)
                 return cur
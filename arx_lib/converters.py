@@ -12,9 +12,15 @@ def string_to_ir(string_type: str) -> ir.Type:
         case 'bool':
             return TypeEnum.boolean
         case 'str':
+            # Length-prefixed at runtime, see ArxStringHeader in c_lib/core.h
             return TypeEnum.string
         case 'string':
             return TypeEnum.string
+        case 'builder':
+            return TypeEnum.string_builder
+        case 'view':
+            # Points at a (data, length) slice of another string, see StringView in c_lib/core.h
+            return TypeEnum.string_view
         case _:
             pass
     return TypeEnum.void
@@ -27,6 +33,10 @@ def ir_to_string(ir_type: ir.Type) -> str:
             return 'int'
     elif isinstance(ir_type, ir.FloatType):
         return 'float'
-    elif isinstance(ir_type, ir.PointerType):
+    elif ir_type == TypeEnum.string:
         return 'str'
+    elif ir_type == TypeEnum.string_builder:
+        return 'builder'
+    elif ir_type == TypeEnum.string_view:
+        return 'view'
     return 'void'
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from llvmlite import ir
-from typing import Any
+from typing import Any, Optional
+from .cache import ArtemisCache
+from .externs import ArtemisExternRegistry
 
 @dataclass
 class TypeEnum:
@@ -13,9 +15,18 @@ class TypeEnum:
     boolean:ir.IntType = ir.IntType(1)
     string:ir.PointerType = ir.IntType(8).as_pointer()
     void:ir.VoidType      = ir.VoidType()
+    string_builder:ir.PointerType = ir.global_context.get_identified_type('StringBuilder').as_pointer()
+    string_view:ir.PointerType = ir.global_context.get_identified_type('StringView').as_pointer()
 
 @dataclass
 class ArtemisData:
     map_paths:set[str] = field(default_factory=set)
     library_paths:set[str] = field(default_factory=set)
-    class_bodies:dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    class_bodies:dict[str, Any] = field(default_factory=dict)
+    optimization_level:int = 0
+    size_level:int = 0
+    # Without an (-O) flag the IR pass pipeline is skipped but machine code is still generated at level 2
+    codegen_level:int = 2
+    allocator:str = 'libc'
+    module_cache:Optional[ArtemisCache] = None
+    extern_registry:Optional[ArtemisExternRegistry] = None
\ No newline at end of file
@@ -0,0 +1,126 @@
+from .helpers import debug_print, version_string
+
+import os, glob, json, threading, configparser
+from typing import ItemsView, Optional
+
+# (module.function) -> argument types -> (llvm name, return type)
+ExternOverloads = dict[str, dict[tuple[str, ...], tuple[str, str]]]
+
+def parse_function_overloads(items:ItemsView[str, str], module_name: str) -> ExternOverloads:
+    externs: ExternOverloads = {}
+    for sig, mapping in items:
+        sig : str = sig.strip()
+        mapping : str = mapping.strip()
+        if not sig or not mapping:
+            continue
+        func_name, arg_part = (sig.split(':', 1) + [''])[:2]
+        func_name : str = func_name.strip()
+        arg_types : tuple = tuple(arg.strip() for arg in arg_part.split(',') if arg.strip())
+        llvm_name, return_type = map(str.strip, mapping.split('>'))
+        key : str = f'{module_name}.{func_name}'
+        externs.setdefault(key, {})[arg_types] = (llvm_name, return_type)
+    return externs
+
+def find_overload(overloads:dict[tuple[str, ...], tuple[str, str]], arg_types:tuple[str, ...]) -> Optional[tuple[str, str]]:
+    if arg_types in overloads:
+        return overloads[arg_types]
+    # A (list) parameter takes any list, an untyped (list) argument matches a (list:T) parameter when only one overload fits
+    candidates : list[tuple[str, ...]] = [
+        signature for signature in overloads
+        if len(signature) == len(arg_types) and all(
+            given == expected or (expected == 'list' and given.startswith('list')) or (given == 'list' and expected.startswith('list:'))
+            for given, expected in zip(arg_types, signature)
+        )
+    ]
+    return overloads[candidates[0]] if len(candidates) == 1 else None
+
+def list_map_files(map_paths:set[str]) -> list[str]:
+    return sorted(map_file for path in map_paths for map_file in glob.glob(os.path.join(path, '*.map')))
+
+def map_files_signature(map_files:list[str]) -> list[list]:
+    signature : list[list] = []
+    for map_file in map_files:
+        stat : os.stat_result = os.stat(map_file)
+        signature.append([map_file, stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+class ArtemisExternRegistry:
+    '''Every (.map) file of the map paths parsed once, module name -> overloads.'''
+
+    def __init__(self, map_paths:set[str], cache_path:Optional[str] = None) -> None:
+        self.map_paths : set[str] = set(map_paths)
+        self.cache_path : Optional[str] = cache_path
+        self.modules : dict[str, ExternOverloads] = {}
+        map_files : list[str] = list_map_files(self.map_paths)
+        self.signature : list[list] = map_files_signature(map_files)
+        if not self.load_cached():
+            for map_file in map_files:
+                self.add_map_file(map_file)
+            self.save_cached()
+
+    def add_map_file(self, map_file:str) -> None:
+        cfg : configparser.RawConfigParser = configparser.RawConfigParser(delimiters=('='))
+        cfg.read(map_file)
+        module_name : str = cfg['meta']['name']
+        module : ExternOverloads = self.modules.setdefault(module_name, {})
+        for full_name, overloads in parse_function_overloads(cfg['functions'].items(), module_name).items():
+            module.setdefault(full_name, {}).update(overloads)
+
+    def load_cached(self) -> bool:
+        if self.cache_path is None:
+            return False
+        try:
+            with open(self.cache_path) as f:
+                cached : dict = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+        if cached.get('version') != version_string or cached.get('maps') != self.signature:
+            debug_print('[externs] (stale)')
+            return False
+        for module_name, functions in cached['modules'].items():
+            self.modules[module_name] = {
+                full_name: {tuple(arg_types): (llvm_name, return_type) for arg_types, llvm_name, return_type in overloads}
+                for full_name, overloads in functions.items()
+            }
+        debug_print(f'[externs] (cached) {len(self.modules)} modules')
+        return True
+
+    def save_cached(self) -> None:
+        if self.cache_path is None:
+            return
+        cached : dict = {
+            'version': version_string,
+            'maps': self.signature,
+            'modules': {
+                module_name: {
+                    full_name: [[list(arg_types), llvm_name, return_type] for arg_types, (llvm_name, return_type) in overloads.items()]
+                    for full_name, overloads in functions.items()
+                }
+                for module_name, functions in self.modules.items()
+            }
+        }
+        temporary_path : str = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temporary_path, 'w') as f:
+                json.dump(cached, f)
+            os.replace(temporary_path, self.cache_path)
+        except OSError as e:
+            debug_print(f'[externs] (not saved) {e}')
+
+    def get_module(self, module_name:str) -> Optional[ExternOverloads]:
+        return self.modules.get(module_name)
+
+
+extern_registries : dict[frozenset[str], ArtemisExternRegistry] = {}
+extern_registries_lock : threading.Lock = threading.Lock()
+
+def get_extern_registry(map_paths:set[str], cache_dir:Optional[str] = None) -> ArtemisExternRegistry:
+    # One registry per set of map paths for the whole process, shared by every compiler instance
+    key : frozenset[str] = frozenset(map_paths)
+    with extern_registries_lock:
+        if key not in extern_registries:
+            cache_path : Optional[str] = os.path.join(cache_dir, 'externs.json') if cache_dir else None
+            extern_registries[key] = ArtemisExternRegistry(map_paths, cache_path)
+        return extern_registries[key]
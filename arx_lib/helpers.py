@@ -1,4 +1,5 @@
-import sys
+import os, sys
+from typing import Optional
 
 class ArtemisParserLogger(object):
     def __init__(self):
@@ -19,8 +20,50 @@ class ArtemisParserLogger(object):
 
     critical = debug
 
+def get_argument_value(flag:str) -> Optional[str]:
+    # Accepts both (-j 8) and (-j8) forms
+    for i, argument in enumerate(sys.argv):
+        if argument == flag:
+            return sys.argv[i + 1] if i + 1 < len(sys.argv) else None
+        if argument.startswith(flag) and len(argument) > len(flag):
+            return argument[len(flag):]
+    return None
+
+def get_jobs_argument() -> int:
+    value : Optional[str] = get_argument_value('-j')
+    if value is None:
+        return os.cpu_count() or 1
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f'Invalid job count [ {value} ] for (-j)')
+    return int(value)
+
+def get_optimization_argument() -> Optional[tuple[int, int]]:
+    # (-O0) .. (-O3) set the speed level, (-Os) optimizes for size, last one wins, None without a flag
+    levels : Optional[tuple[int, int]] = None
+    for argument in sys.argv:
+        match argument:
+            case '-O0' | '-O1' | '-O2' | '-O3':
+                levels = (int(argument[2]), 0)
+            case '-Os':
+                levels = (2, 1)
+            case _:
+                if argument.startswith('-O'):
+                    raise ValueError(f'Invalid optimization level [ {argument} ]')
+    return levels
+
+def get_allocator_argument() -> str:
+    # (--alloc=libc|slab|arena) picks the runtime allocator backend
+    value : Optional[str] = get_argument_value('--alloc=')
+    if value is None:
+        return 'libc'
+    if value not in allocator_backends:
+        raise ValueError(f'Invalid allocator [ {value} ] for (--alloc), expected one of {", ".join(allocator_backends)}')
+    return value
+
 def debug_print(*values:object) -> None:
     if '--debug' in sys.argv:
         print(*values)
 
+allocator_backends : tuple[str, ...] = ('libc', 'slab', 'arena')
 arx_extension : str = '.arx'
+version_string : str = '[2025.09.26]'
@@ -4,7 +4,7 @@ from sly.lex import Token
 class ArtemisLexer(Lexer):
     tokens : set[str] = {
         'USING',
-        'INT', 'FLOAT', 'LIST', 'STR', 'ANY', 'VOID', 'CLASS', 'THIS', 'BOOL',
+        'INT', 'FLOAT', 'LIST', 'STR', 'VIEW', 'ANY', 'VOID', 'CLASS', 'THIS', 'BOOL',
         'TRUE', 'FALSE', 'NOT', 'OR', 'AND',
         'ID', 'NUMBER', 'FLOATNUMBER', 'STRING',
         'EQEQ', 'NOTEQ', 'LTEQ', 'GTEQ', 'LT', 'GT',
@@ -67,6 +67,7 @@ class ArtemisLexer(Lexer):
         keywords = {
             'using' : 'USING',
             'string' : 'STR',
+            'view' : 'VIEW',
             'list' : 'LIST',
             'any' : 'ANY',
             'void' : 'VOID',
@@ -1,8 +1,65 @@
 from sly import Parser
 from sly.lex import Token
+from sly.yacc import LRTable, YaccError
 from .lexer import ArtemisLexer
-from .helpers import ArtemisParserLogger
+from .helpers import ArtemisParserLogger, debug_print
+from .ast_nodes import (
+    ArtemisNode, ProgramNode, UsingNode, FunctionNode, ParamNode, ClassNode, MethodNode, FieldNode,
+    ExpressionNode, ReturnNode, ReturnVoidNode, IfChainNode, IfBranchNode, ForInNode, WhileNode,
+    DeclareNode, DeclareListNode, DeclareCustomNode, AssignNode, BreakNode, ContinueNode,
+    IntNode, FloatNode, StringNode, BoolNode, ListLiteralNode, VarNode, ThisNode,
+    BinOpNode, UnOpNode, PostIncNode, PostDecNode, CallNode, CallMethodNode, ObjectCreationNode, GetAttrNode
+)
 from typing import Any, Optional
+import os, bisect, hashlib, pprint
+
+parser_tables_path : str = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'parser_tables.py')
+
+class ArtemisParseTables(object):
+    def __init__(self, lr_action:dict, lr_goto:dict, defaulted_states:dict) -> None:
+        self.lr_action : dict = lr_action
+        self.lr_goto : dict = lr_goto
+        self.defaulted_states : dict = defaulted_states
+
+def grammar_hash(grammar:Any) -> str:
+    signature : list[str] = [' '.join(sorted(grammar.Terminals))]
+    for production in grammar.Productions:
+        signature.append(f'{production} {production.prec}')
+    return hashlib.sha256('\n'.join(signature).encode('utf-8')).hexdigest()
+
+def load_parse_tables(expected_hash:str) -> Optional[ArtemisParseTables]:
+    try:
+        from . import parser_tables
+    except ImportError:
+        return None
+    if getattr(parser_tables, 'grammar_hash', None) != expected_hash:
+        return None
+    return ArtemisParseTables(parser_tables.lr_action, parser_tables.lr_goto, parser_tables.defaulted_states)
+
+def save_parse_tables(tables:LRTable, current_hash:str) -> None:
+    contents : str = (
+        '# Generated by arx_lib/parser.py from the ArtemisParser grammar, do not edit.\n'
+        '# Rebuilt automatically when grammar_hash no longer matches the grammar.\n'
+        f'grammar_hash = {current_hash!r}\n'
+        f'lr_action = {pprint.pformat(tables.lr_action, width=120)}\n'
+        f'lr_goto = {pprint.pformat(tables.lr_goto, width=120)}\n'
+        f'defaulted_states = {pprint.pformat(tables.defaulted_states, width=120)}\n'
+    )
+    # Written aside and renamed, a concurrent import never sees a half written module
+    temporary_path : str = f'{parser_tables_path}.{os.getpid()}.tmp'
+    try:
+        with open(temporary_path, 'w') as f:
+            f.write(contents)
+        os.replace(temporary_path, parser_tables_path)
+    except OSError as e:
+        debug_print(f'[parser] (tables) not saved {e}')
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+class ArtemisPositionSink(dict):
+    # sly maps id(value) to its position for every reduction, nodes carry their own span so nothing is kept
+    def __setitem__(self, key:int, value:Any) -> None:
+        pass
 
 class ArtemisParser(Parser):
     tokens : set[str] = ArtemisLexer.tokens
@@ -21,30 +78,71 @@ class ArtemisParser(Parser):
         ('left', 'TIMES', 'DIVIDE'),
     )
 
-    def __init__(self) -> None:
+    def __init__(self, source:str = '') -> None:
         self.using_modules = []
+        # Offsets where each line of source starts, used to turn token indexes into line/column spans
+        self.line_offsets : list[int] = [0]
+        offset : int = source.find('\n')
+        while offset != -1:
+            self.line_offsets.append(offset + 1)
+            offset = source.find('\n', offset + 1)
+        # Nodes on the same line share one int object for their line number
+        self.line_numbers : list[int] = list(range(len(self.line_offsets) + 1))
+        self._line_positions : ArtemisPositionSink = ArtemisPositionSink()
+        self._index_positions : ArtemisPositionSink = ArtemisPositionSink()
+
+    def span(self, node:ArtemisNode, start:int, end:int) -> ArtemisNode:
+        start_line : int = bisect.bisect_right(self.line_offsets, start)
+        end_line : int = bisect.bisect_right(self.line_offsets, end - 1) if end > start else start_line
+        return node.set_span(
+            self.line_numbers[start_line], start - self.line_offsets[start_line - 1] + 1,
+            self.line_numbers[end_line], end - self.line_offsets[end_line - 1] + 1
+        )
+
+    def locate(self, node:ArtemisNode, p:Any) -> ArtemisNode:
+        return self.span(node, p.index, p.end)
+
+    @classmethod
+    def _build(cls, definitions:list) -> None:
+        # Replaces sly's table construction, the LALR tables are loaded from parser_tables.py
+        # when its grammar_hash matches and only regenerated (and saved) when the grammar changed
+        rules : list = [(name, value) for name, value in definitions if callable(value) and hasattr(value, 'rules')]
+        if not cls._Parser__validate_specification():
+            raise YaccError('Invalid parser specification')
+        cls._Parser__build_grammar(rules)
+        current_hash : str = grammar_hash(cls._grammar)
+        tables : Optional[ArtemisParseTables] = load_parse_tables(current_hash)
+        if tables is None:
+            debug_print('[parser] (tables) rebuilding')
+            lrtable : LRTable = LRTable(cls._grammar)
+            cls.log.warning('%d shift/reduce conflicts', len(lrtable.sr_conflicts))
+            cls.log.warning('%d reduce/reduce conflicts', len(lrtable.rr_conflicts))
+            save_parse_tables(lrtable, current_hash)
+            tables = ArtemisParseTables(lrtable.lr_action, lrtable.lr_goto, lrtable.defaulted_states)
+        cls._lrtable = tables
 
     # ----- PROGRAM -----
 
     @_('using_directive_list top_level_list')  # type: ignore[name-defined]
-    def program(self, p) -> tuple:
-        return ('program', p.using_directive_list, p.top_level_list)
+    def program(self, p) -> ArtemisNode:
+        return self.locate(ProgramNode(p.using_directive_list, p.top_level_list), p)
     
 
     @_('top_level_list')  # type: ignore[name-defined]
-    def program(self, p) -> tuple:
-        return ('program', [], p.top_level_list)
+    def program(self, p) -> ArtemisNode:
+        return self.locate(ProgramNode([], p.top_level_list), p)
 
     # ----- USING DIRECTIVES -----
     
     @_('USING ID') # type: ignore[name-defined]
-    def using_directive(self, p) -> tuple:
+    def using_directive(self, p) -> ArtemisNode:
         self.using_modules.append(p.ID)
-        return ('using', p.ID)
+        return self.locate(UsingNode(p.ID), p)
 
-    @_('using_directive using_directive_list') # type: ignore[name-defined]
+    @_('using_directive_list using_directive') # type: ignore[name-defined]
     def using_directive_list(self, p) -> list:
-        return [p.using_directive] + p.using_directive_list
+        p.using_directive_list.append(p.using_directive)
+        return p.using_directive_list
 
     @_('using_directive') # type: ignore[name-defined]
     def using_directive_list(self, p) -> list:
@@ -52,93 +150,101 @@ class ArtemisParser(Parser):
 
     # ----- TOP LEVEL DECLARATIONS -----
 
-    @_('top_level top_level_list')  # type: ignore[name-defined]
+    @_('top_level_list top_level')  # type: ignore[name-defined]
     def top_level_list(self, p) -> list:
-        return [p.top_level] + p.top_level_list
+        p.top_level_list.append(p.top_level)
+        return p.top_level_list
 
     @_('top_level')  # type: ignore[name-defined]
     def top_level_list(self, p) -> list:
         return [p.top_level]
 
     @_('function')  # type: ignore[name-defined]
-    def top_level(self, p) -> tuple:
+    def top_level(self, p) -> ArtemisNode:
         return p.function
 
     @_('class_declaration')  # type: ignore[name-defined]
-    def top_level(self, p) -> tuple:
+    def top_level(self, p) -> ArtemisNode:
         return p.class_declaration
 
     # ----- FUNCTION CALL -----
     
     @_('type ID LPAREN RPAREN LBRACE statements RBRACE') # type: ignore[name-defined]
-    def function(self, p) -> tuple:
-        return ('function', p.ID, [], p.statements, p.type)
+    def function(self, p) -> ArtemisNode:
+        return self.locate(FunctionNode(p.ID, [], p.statements, p.type), p)
     
     @_('type ID LPAREN param_list RPAREN LBRACE statements RBRACE') # type: ignore[name-defined]
-    def function(self, p) -> tuple:
-        return ('function', p.ID, p.param_list, p.statements, p.type)
+    def function(self, p) -> ArtemisNode:
+        return self.locate(FunctionNode(p.ID, p.param_list, p.statements, p.type), p)
     
     # ----- PARAMETERS -----
 
-    @_('param COMMA param_list') # type: ignore[name-defined]
+    @_('param_list COMMA param') # type: ignore[name-defined]
     def param_list(self, p) -> list:
-        return [p.param] + p.param_list
+        p.param_list.append(p.param)
+        return p.param_list
 
     @_('param') # type: ignore[name-defined]
     def param_list(self, p) -> list:
         return [p.param]
 
     @_('INT ID') # type: ignore[name-defined]
-    def param(self, p) -> tuple:
-        return ('param', 'int', p.ID)
+    def param(self, p) -> ArtemisNode:
+        return self.locate(ParamNode('int', p.ID), p)
 
     @_('FLOAT ID') # type: ignore[name-defined]
-    def param(self, p) -> tuple:
-        return ('param', 'float', p.ID)
+    def param(self, p) -> ArtemisNode:
+        return self.locate(ParamNode('float', p.ID), p)
 
     @_('STR ID') # type: ignore[name-defined]
-    def param(self, p) -> tuple:
-        return ('param', 'str', p.ID)
+    def param(self, p) -> ArtemisNode:
+        return self.locate(ParamNode('str', p.ID), p)
 
     @_('BOOL ID') # type: ignore[name-defined]
-    def param(self, p) -> tuple:
-        return ('param', 'bool', p.ID)
+    def param(self, p) -> ArtemisNode:
+        return self.locate(ParamNode('bool', p.ID), p)
 
     # ----- STATEMENTS -----
 
     @_('statements statement') # type: ignore[name-defined]
     def statements(self, p) -> list:
-        return p.statements + [p.statement]
+        p.statements.append(p.statement)
+        return p.statements
 
     @_('') # type: ignore[name-defined]
     def statements(self, p) -> list:
         return []
 
     @_('expression') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('expression', p.expression)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(ExpressionNode(p.expression), p)
 
     @_('RETURN expression') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('return', p.expression)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(ReturnNode(p.expression), p)
     
     @_('RETURN') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('return_void',)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(ReturnVoidNode(), p)
     
     # -- IF / ELSE IF / ELSE CHAIN --
 
+    # elseif_chain is collected innermost first and reversed once the chain is complete
+
     @_('IF LPAREN expression RPAREN LBRACE statements RBRACE elseif_chain') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('if_chain', [(p.expression, p.statements)] + p.elseif_chain)
+    def statement(self, p) -> ArtemisNode:
+        p.elseif_chain.append(self.locate(IfBranchNode(p.expression, p.statements), p))
+        p.elseif_chain.reverse()
+        return self.locate(IfChainNode(p.elseif_chain), p)
 
     @_('ELSE IF LPAREN expression RPAREN LBRACE statements RBRACE elseif_chain') # type: ignore[name-defined]
     def elseif_chain(self, p) -> list:
-        return [(p.expression, p.statements)] + p.elseif_chain
+        p.elseif_chain.append(self.locate(IfBranchNode(p.expression, p.statements), p))
+        return p.elseif_chain
 
     @_('ELSE LBRACE statements RBRACE') # type: ignore[name-defined]
     def elseif_chain(self, p) -> list:
-        return [(None, p.statements)]
+        return [self.locate(IfBranchNode(None, p.statements), p)]
 
     @_('') # type: ignore[name-defined]
     def elseif_chain(self, p) -> list:
@@ -146,81 +252,81 @@ class ArtemisParser(Parser):
     
     # ----- FOR -----
 
-    @_('FOR LPAREN type ID IN ID RPAREN LBRACE statements RBRACE') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('for_in', p.type, p.ID0, p.ID1, p.statements)
+    @_('FOR LPAREN type ID IN expression RPAREN LBRACE statements RBRACE') # type: ignore[name-defined]
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(ForInNode(p.type, p.ID, p.expression, p.statements), p)
 
     # ----- WHILE -----
 
     @_('WHILE LPAREN expression RPAREN LBRACE statements RBRACE')  # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('while', p.expression, p.statements)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(WhileNode(p.expression, p.statements), p)
 
     # ----- ADD / SUBSTRACT -----
 
     @_('expression PLUSPLUS')    # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('postinc', p.expression)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(PostIncNode(p.expression), p)
 
     @_('expression MINUSMINUS')  # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('postdec', p.expression)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(PostDecNode(p.expression), p)
 
     # ----- OPS -----
 
     @_('expression PLUS expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '+', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('+', p.expression0, p.expression1), p)
 
     @_('expression MINUS expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '-', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('-', p.expression0, p.expression1), p)
 
     @_('expression TIMES expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '*', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('*', p.expression0, p.expression1), p)
 
     @_('expression DIVIDE expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '/', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('/', p.expression0, p.expression1), p)
     
     @_('expression EQEQ expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '==', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('==', p.expression0, p.expression1), p)
     
     @_('expression NOTEQ expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '!=', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('!=', p.expression0, p.expression1), p)
     
     @_('expression LTEQ expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '<=', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('<=', p.expression0, p.expression1), p)
     
     @_('expression GTEQ expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '>=', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('>=', p.expression0, p.expression1), p)
     
     @_('expression GT expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '>', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('>', p.expression0, p.expression1), p)
     
     @_('expression LT expression') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', '<', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('<', p.expression0, p.expression1), p)
 
     # ----- LOGICAL OPS -----
 
     @_('expression OR expression')   # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', 'or', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('or', p.expression0, p.expression1), p)
 
     @_('expression AND expression')   # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('binop', 'and', p.expression0, p.expression1)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BinOpNode('and', p.expression0, p.expression1), p)
 
     @_('NOT expression')   # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('unop', 'not', p.expression)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(UnOpNode('not', p.expression), p)
 
     # ----- TYPES -----
 
@@ -240,6 +346,10 @@ class ArtemisParser(Parser):
     def type(self, p) -> str:
         return 'string'
 
+    @_('VIEW') # type: ignore[name-defined]
+    def type(self, p) -> str:
+        return 'view'
+
     @_('VOID') # type: ignore[name-defined]
     def type(self, p) -> str:
         return 'void'
@@ -247,72 +357,73 @@ class ArtemisParser(Parser):
     # ----- EXPRESSIONS -----
 
     @_('type ID ASSIGN expression') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('declare', p.type, p.ID, p.expression)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(DeclareNode(p.type, p.ID, p.expression), p)
     
     @_('ID ASSIGN expression')  # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('assign', p.ID, p.expression)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(AssignNode(self.span(VarNode(p.ID), p.index, p.index + len(p.ID)), p.expression), p)
     
     @_('LIST COLON type ID ASSIGN expression') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('declare_list', p.type, p.ID, p.expression)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(DeclareListNode(p.type, p.ID, p.expression), p)
     
     @_('ANY COLON ID ID ASSIGN expression') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('declare_custom', p.ID0, p.ID1, p.expression)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(DeclareCustomNode(p.ID0, p.ID1, p.expression), p)
 
     @_('expression ASSIGN expression') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('assign', p.expression0, p.expression1)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(AssignNode(p.expression0, p.expression1), p)
     
     @_('BREAK') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('break',)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(BreakNode(), p)
 
     @_('CONTINUE') # type: ignore[name-defined]
-    def statement(self, p) -> tuple:
-        return ('continue',)
+    def statement(self, p) -> ArtemisNode:
+        return self.locate(ContinueNode(), p)
 
     @_('STRING') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('string', p.STRING)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(StringNode(p.STRING), p)
 
     @_('FLOATNUMBER') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('float', p.FLOATNUMBER)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(FloatNode(p.FLOATNUMBER), p)
     
     @_('NUMBER') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('int', p.NUMBER)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(IntNode(p.NUMBER), p)
     
     @_('TRUE') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('bool', True)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BoolNode(True), p)
 
     @_('FALSE') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('bool', False)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(BoolNode(False), p)
     
     @_('object_creation') # type: ignore[name-defined]
-    def expression(self, p) -> Any:
+    def expression(self, p) -> ArtemisNode:
         return p.object_creation
     
     # ----- THIS -----
 
     @_('THIS') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('this',)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(ThisNode(), p)
 
     # ----- LISTS -----
     
     @_('LBRACKET list_elements RBRACKET') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('list_literal', p.list_elements)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(ListLiteralNode(p.list_elements), p)
 
-    @_('expression COMMA list_elements') # type: ignore[name-defined]
+    @_('list_elements COMMA expression') # type: ignore[name-defined]
     def list_elements(self, p) -> list:
-        return [p.expression] + p.list_elements
+        p.list_elements.append(p.expression)
+        return p.list_elements
 
     @_('expression') # type: ignore[name-defined]
     def list_elements(self, p) -> list:
@@ -330,78 +441,80 @@ class ArtemisParser(Parser):
 
     @_('args COMMA expression') # type: ignore[name-defined]
     def args(self, p) -> list:
-        return p.args + [p.expression]
+        p.args.append(p.expression)
+        return p.args
     
     @_('ID') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('var', p.ID)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(VarNode(p.ID), p)
     
     @_('LPAREN expression RPAREN') # type: ignore[name-defined]
-    def expression(self, p) -> list:
+    def expression(self, p) -> ArtemisNode:
         return p.expression
     
     # ----- FUNCTION CALL -----
 
     @_('ID LPAREN args RPAREN') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('call', p.ID, p.args)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(CallNode(p.ID, p.args), p)
 
     @_('ID LPAREN RPAREN') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('call', p.ID, [])
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(CallNode(p.ID, []), p)
     
     # ----- CLASSES -----
 
     @_('CLASS ID LBRACE class_body RBRACE') # type: ignore[name-defined]
-    def class_declaration(self, p) -> tuple:
-        return ('class', p.ID, p.class_body)
+    def class_declaration(self, p) -> ArtemisNode:
+        return self.locate(ClassNode(p.ID, p.class_body), p)
     
-    @_('class_member class_body') # type: ignore[name-defined]
+    @_('class_body class_member') # type: ignore[name-defined]
     def class_body(self, p) -> list:
-        return [p.class_member] + p.class_body
+        p.class_body.append(p.class_member)
+        return p.class_body
 
     @_('class_member') # type: ignore[name-defined]
     def class_body(self, p) -> list:
         return [p.class_member]
 
     @_('method') # type: ignore[name-defined]
-    def class_member(self, p) -> Any:
+    def class_member(self, p) -> ArtemisNode:
         return p.method
     
     @_('field') # type: ignore[name-defined]
-    def class_member(self, p) -> Any:
+    def class_member(self, p) -> ArtemisNode:
         return p.field
 
     @_('type ID LPAREN param_list RPAREN LBRACE statements RBRACE') # type: ignore[name-defined]
-    def method(self, p) -> tuple:
-        return ('method', p.type, p.ID, p.param_list, p.statements)
+    def method(self, p) -> ArtemisNode:
+        return self.locate(MethodNode(p.type, p.ID, p.param_list, p.statements), p)
     
     @_('type ID LPAREN RPAREN LBRACE statements RBRACE') # type: ignore[name-defined]
-    def method(self, p) -> tuple:
-        return ('method', p.type, p.ID, [], p.statements)
+    def method(self, p) -> ArtemisNode:
+        return self.locate(MethodNode(p.type, p.ID, [], p.statements), p)
         
     @_('ID LPAREN args RPAREN') # type: ignore[name-defined]
-    def object_creation(self, p) -> tuple:
-        return ('object_creation', p.ID, p.args)
+    def object_creation(self, p) -> ArtemisNode:
+        return self.locate(ObjectCreationNode(p.ID, p.args), p)
 
     @_('type ID ASSIGN expression') # type: ignore[name-defined]
-    def field(self, p) -> tuple[str, str, str, Any]:
-        return ('field', p.type, p.ID, p.expression)
+    def field(self, p) -> FieldNode:
+        return self.locate(FieldNode(p.type, p.ID, p.expression), p)
 
     @_('type ID') # type: ignore[name-defined]
-    def field(self, p) -> tuple[str, str, str, Optional[Any]]:
-        return ('field', p.type, p.ID, None)
+    def field(self, p) -> FieldNode:
+        return self.locate(FieldNode(p.type, p.ID, None), p)
 
     # ----- MEMBER ACCESS -----
 
     @_('expression DOT ID') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('get_attr', p.expression, p.ID)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(GetAttrNode(p.expression, p.ID), p)
 
     @_('expression DOT ID LPAREN args RPAREN') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('call_method', p.expression, p.ID, p.args)
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(CallMethodNode(p.expression, p.ID, p.args), p)
 
     @_('expression DOT ID LPAREN RPAREN') # type: ignore[name-defined]
-    def expression(self, p) -> tuple:
-        return ('call_method', p.expression, p.ID, [])
+    def expression(self, p) -> ArtemisNode:
+        return self.locate(CallMethodNode(p.expression, p.ID, []), p)
@@ -0,0 +1,3120 @@
+# Generated by arx_lib/parser.py from the ArtemisParser grammar, do not edit.
+# Rebuilt automatically when grammar_hash no longer matches the grammar.
+grammar_hash = '821b7ecdb4f85870c3baedfcdbfd8986c481d5c79fafed9c880bcb855319cfdf'
+lr_action = {0: {'BOOL': 15, 'CLASS': 9, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'USING': 8, 'VIEW': 12, 'VOID': 11},
+ 1: {'$end': 0},
+ 2: {'$end': -1, 'BOOL': 15, 'CLASS': 9, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'VIEW': 12, 'VOID': 11},
+ 3: {'BOOL': 15, 'CLASS': 9, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'USING': 8, 'VIEW': 12, 'VOID': 11},
+ 4: {'$end': -6, 'BOOL': -6, 'CLASS': -6, 'FLOAT': -6, 'INT': -6, 'STR': -6, 'VIEW': -6, 'VOID': -6},
+ 5: {'BOOL': -4, 'CLASS': -4, 'FLOAT': -4, 'INT': -4, 'STR': -4, 'USING': -4, 'VIEW': -4, 'VOID': -4},
+ 6: {'$end': -8, 'BOOL': -8, 'CLASS': -8, 'FLOAT': -8, 'INT': -8, 'STR': -8, 'VIEW': -8, 'VOID': -8},
+ 7: {'$end': -9, 'BOOL': -9, 'CLASS': -9, 'FLOAT': -9, 'INT': -9, 'STR': -9, 'VIEW': -9, 'VOID': -9},
+ 8: {'ID': 20},
+ 9: {'ID': 21},
+ 10: {'ID': 22},
+ 11: {'ID': -66},
+ 12: {'ID': -67},
+ 13: {'ID': -68},
+ 14: {'ID': -69},
+ 15: {'ID': -70},
+ 16: {'ID': -71},
+ 17: {'$end': -7, 'BOOL': -7, 'CLASS': -7, 'FLOAT': -7, 'INT': -7, 'STR': -7, 'VIEW': -7, 'VOID': -7},
+ 18: {'$end': -2, 'BOOL': 15, 'CLASS': 9, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'VIEW': 12, 'VOID': 11},
+ 19: {'BOOL': -5, 'CLASS': -5, 'FLOAT': -5, 'INT': -5, 'STR': -5, 'USING': -5, 'VIEW': -5, 'VOID': -5},
+ 20: {'BOOL': -3, 'CLASS': -3, 'FLOAT': -3, 'INT': -3, 'STR': -3, 'USING': -3, 'VIEW': -3, 'VOID': -3},
+ 21: {'LBRACE': 23},
+ 22: {'LPAREN': 24},
+ 23: {'BOOL': 15, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'VIEW': 12, 'VOID': 11},
+ 24: {'BOOL': 33, 'FLOAT': 35, 'INT': 36, 'RPAREN': 31, 'STR': 34},
+ 25: {'BOOL': 15, 'FLOAT': 14, 'INT': 16, 'RBRACE': 37, 'STR': 13, 'VIEW': 12, 'VOID': 11},
+ 26: {'BOOL': -78, 'FLOAT': -78, 'INT': -78, 'RBRACE': -78, 'STR': -78, 'VIEW': -78, 'VOID': -78},
+ 27: {'BOOL': -80, 'FLOAT': -80, 'INT': -80, 'RBRACE': -80, 'STR': -80, 'VIEW': -80, 'VOID': -80},
+ 28: {'BOOL': -81, 'FLOAT': -81, 'INT': -81, 'RBRACE': -81, 'STR': -81, 'VIEW': -81, 'VOID': -81},
+ 29: {'ID': 39},
+ 30: {'COMMA': 41, 'RPAREN': 40},
+ 31: {'LBRACE': 42},
+ 32: {'COMMA': -12, 'RPAREN': -12},
+ 33: {'ID': 43},
+ 34: {'ID': 44},
+ 35: {'ID': 45},
+ 36: {'ID': 46},
+ 37: {'$end': -77, 'BOOL': -77, 'CLASS': -77, 'FLOAT': -77, 'INT': -77, 'STR': -77, 'VIEW': -77, 'VOID': -77},
+ 38: {'BOOL': -79, 'FLOAT': -79, 'INT': -79, 'RBRACE': -79, 'STR': -79, 'VIEW': -79, 'VOID': -79},
+ 39: {'ASSIGN': 47,
+      'BOOL': -85,
+      'FLOAT': -85,
+      'INT': -85,
+      'LPAREN': 48,
+      'RBRACE': -85,
+      'STR': -85,
+      'VIEW': -85,
+      'VOID': -85},
+ 40: {'LBRACE': 49},
+ 41: {'BOOL': 33, 'FLOAT': 35, 'INT': 36, 'STR': 34},
+ 42: {'ANY': -18,
+      'BOOL': -18,
+      'BREAK': -18,
+      'CONTINUE': -18,
+      'FALSE': -18,
+      'FLOAT': -18,
+      'FLOATNUMBER': -18,
+      'FOR': -18,
+      'ID': -18,
+      'IF': -18,
+      'INT': -18,
+      'LBRACKET': -18,
+      'LIST': -18,
+      'LPAREN': -18,
+      'NOT': -18,
+      'NUMBER': -18,
+      'RBRACE': -18,
+      'RETURN': -18,
+      'STR': -18,
+      'STRING': -18,
+      'THIS': -18,
+      'TRUE': -18,
+      'VIEW': -18,
+      'VOID': -18,
+      'WHILE': -18},
+ 43: {'COMMA': -14, 'RPAREN': -14},
+ 44: {'COMMA': -15, 'RPAREN': -15},
+ 45: {'COMMA': -16, 'RPAREN': -16},
+ 46: {'COMMA': -17, 'RPAREN': -17},
+ 47: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 48: {'BOOL': 33, 'FLOAT': 35, 'INT': 36, 'RPAREN': 64, 'STR': 34},
+ 49: {'ANY': -18,
+      'BOOL': -18,
+      'BREAK': -18,
+      'CONTINUE': -18,
+      'FALSE': -18,
+      'FLOAT': -18,
+      'FLOATNUMBER': -18,
+      'FOR': -18,
+      'ID': -18,
+      'IF': -18,
+      'INT': -18,
+      'LBRACKET': -18,
+      'LIST': -18,
+      'LPAREN': -18,
+      'NOT': -18,
+      'NUMBER': -18,
+      'RBRACE': -18,
+      'RETURN': -18,
+      'STR': -18,
+      'STRING': -18,
+      'THIS': -18,
+      'TRUE': -18,
+      'VIEW': -18,
+      'VOID': -18,
+      'WHILE': -18},
+ 50: {'COMMA': -13, 'RPAREN': -13},
+ 51: {'ANY': 74,
+      'BOOL': 15,
+      'BREAK': 72,
+      'CONTINUE': 71,
+      'FALSE': 58,
+      'FLOAT': 14,
+      'FLOATNUMBER': 61,
+      'FOR': 77,
+      'ID': 68,
+      'IF': 78,
+      'INT': 16,
+      'LBRACKET': 55,
+      'LIST': 75,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'RBRACE': 69,
+      'RETURN': 79,
+      'STR': 13,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59,
+      'VIEW': 12,
+      'VOID': 11,
+      'WHILE': 76},
+ 52: {'AND': -42,
+      'ANY': -42,
+      'ASSIGN': -42,
+      'BOOL': -42,
+      'BREAK': -42,
+      'COMMA': -42,
+      'CONTINUE': -42,
+      'DIVIDE': -42,
+      'DOT': -42,
+      'EQEQ': -42,
+      'FALSE': -42,
+      'FLOAT': -42,
+      'FLOATNUMBER': -42,
+      'FOR': -42,
+      'GT': -42,
+      'GTEQ': -42,
+      'ID': -42,
+      'IF': -42,
+      'INT': -42,
+      'LBRACKET': -42,
+      'LIST': -42,
+      'LPAREN': 80,
+      'LT': -42,
+      'LTEQ': -42,
+      'MINUS': -42,
+      'MINUSMINUS': -42,
+      'NOT': -42,
+      'NOTEQ': -42,
+      'NUMBER': -42,
+      'OR': -42,
+      'PLUS': -42,
+      'PLUSPLUS': -42,
+      'RBRACE': -42,
+      'RBRACKET': -42,
+      'RETURN': -42,
+      'RPAREN': -42,
+      'STR': -42,
+      'STRING': -42,
+      'THIS': -42,
+      'TIMES': -42,
+      'TRUE': -42,
+      'VIEW': -42,
+      'VOID': -42,
+      'WHILE': -42},
+ 53: {'AND': 82,
+      'BOOL': -86,
+      'DIVIDE': 90,
+      'DOT': 81,
+      'EQEQ': 89,
+      'FLOAT': -86,
+      'GT': 85,
+      'GTEQ': 86,
+      'INT': -86,
+      'LT': 84,
+      'LTEQ': 87,
+      'MINUS': 92,
+      'MINUSMINUS': 94,
+      'NOTEQ': 88,
+      'OR': 83,
+      'PLUS': 93,
+      'PLUSPLUS': 95,
+      'RBRACE': -86,
+      'STR': -86,
+      'TIMES': 91,
+      'VIEW': -86,
+      'VOID': -86},
+ 54: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 55: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 56: {'AND': -44,
+      'ANY': -44,
+      'ASSIGN': -44,
+      'BOOL': -44,
+      'BREAK': -44,
+      'COMMA': -44,
+      'CONTINUE': -44,
+      'DIVIDE': -44,
+      'DOT': -44,
+      'EQEQ': -44,
+      'FALSE': -44,
+      'FLOAT': -44,
+      'FLOATNUMBER': -44,
+      'FOR': -44,
+      'GT': -44,
+      'GTEQ': -44,
+      'ID': -44,
+      'IF': -44,
+      'INT': -44,
+      'LBRACKET': -44,
+      'LIST': -44,
+      'LPAREN': -44,
+      'LT': -44,
+      'LTEQ': -44,
+      'MINUS': -44,
+      'MINUSMINUS': -44,
+      'NOT': -44,
+      'NOTEQ': -44,
+      'NUMBER': -44,
+      'OR': -44,
+      'PLUS': -44,
+      'PLUSPLUS': -44,
+      'RBRACE': -44,
+      'RBRACKET': -44,
+      'RETURN': -44,
+      'RPAREN': -44,
+      'STR': -44,
+      'STRING': -44,
+      'THIS': -44,
+      'TIMES': -44,
+      'TRUE': -44,
+      'VIEW': -44,
+      'VOID': -44,
+      'WHILE': -44},
+ 57: {'AND': -45,
+      'ANY': -45,
+      'ASSIGN': -45,
+      'BOOL': -45,
+      'BREAK': -45,
+      'COMMA': -45,
+      'CONTINUE': -45,
+      'DIVIDE': -45,
+      'DOT': -45,
+      'EQEQ': -45,
+      'FALSE': -45,
+      'FLOAT': -45,
+      'FLOATNUMBER': -45,
+      'FOR': -45,
+      'GT': -45,
+      'GTEQ': -45,
+      'ID': -45,
+      'IF': -45,
+      'INT': -45,
+      'LBRACKET': -45,
+      'LIST': -45,
+      'LPAREN': -45,
+      'LT': -45,
+      'LTEQ': -45,
+      'MINUS': -45,
+      'MINUSMINUS': -45,
+      'NOT': -45,
+      'NOTEQ': -45,
+      'NUMBER': -45,
+      'OR': -45,
+      'PLUS': -45,
+      'PLUSPLUS': -45,
+      'RBRACE': -45,
+      'RBRACKET': -45,
+      'RETURN': -45,
+      'RPAREN': -45,
+      'STR': -45,
+      'STRING': -45,
+      'THIS': -45,
+      'TIMES': -45,
+      'TRUE': -45,
+      'VIEW': -45,
+      'VOID': -45,
+      'WHILE': -45},
+ 58: {'AND': -46,
+      'ANY': -46,
+      'ASSIGN': -46,
+      'BOOL': -46,
+      'BREAK': -46,
+      'COMMA': -46,
+      'CONTINUE': -46,
+      'DIVIDE': -46,
+      'DOT': -46,
+      'EQEQ': -46,
+      'FALSE': -46,
+      'FLOAT': -46,
+      'FLOATNUMBER': -46,
+      'FOR': -46,
+      'GT': -46,
+      'GTEQ': -46,
+      'ID': -46,
+      'IF': -46,
+      'INT': -46,
+      'LBRACKET': -46,
+      'LIST': -46,
+      'LPAREN': -46,
+      'LT': -46,
+      'LTEQ': -46,
+      'MINUS': -46,
+      'MINUSMINUS': -46,
+      'NOT': -46,
+      'NOTEQ': -46,
+      'NUMBER': -46,
+      'OR': -46,
+      'PLUS': -46,
+      'PLUSPLUS': -46,
+      'RBRACE': -46,
+      'RBRACKET': -46,
+      'RETURN': -46,
+      'RPAREN': -46,
+      'STR': -46,
+      'STRING': -46,
+      'THIS': -46,
+      'TIMES': -46,
+      'TRUE': -46,
+      'VIEW': -46,
+      'VOID': -46,
+      'WHILE': -46},
+ 59: {'AND': -47,
+      'ANY': -47,
+      'ASSIGN': -47,
+      'BOOL': -47,
+      'BREAK': -47,
+      'COMMA': -47,
+      'CONTINUE': -47,
+      'DIVIDE': -47,
+      'DOT': -47,
+      'EQEQ': -47,
+      'FALSE': -47,
+      'FLOAT': -47,
+      'FLOATNUMBER': -47,
+      'FOR': -47,
+      'GT': -47,
+      'GTEQ': -47,
+      'ID': -47,
+      'IF': -47,
+      'INT': -47,
+      'LBRACKET': -47,
+      'LIST': -47,
+      'LPAREN': -47,
+      'LT': -47,
+      'LTEQ': -47,
+      'MINUS': -47,
+      'MINUSMINUS': -47,
+      'NOT': -47,
+      'NOTEQ': -47,
+      'NUMBER': -47,
+      'OR': -47,
+      'PLUS': -47,
+      'PLUSPLUS': -47,
+      'RBRACE': -47,
+      'RBRACKET': -47,
+      'RETURN': -47,
+      'RPAREN': -47,
+      'STR': -47,
+      'STRING': -47,
+      'THIS': -47,
+      'TIMES': -47,
+      'TRUE': -47,
+      'VIEW': -47,
+      'VOID': -47,
+      'WHILE': -47},
+ 60: {'AND': -48,
+      'ANY': -48,
+      'ASSIGN': -48,
+      'BOOL': -48,
+      'BREAK': -48,
+      'COMMA': -48,
+      'CONTINUE': -48,
+      'DIVIDE': -48,
+      'DOT': -48,
+      'EQEQ': -48,
+      'FALSE': -48,
+      'FLOAT': -48,
+      'FLOATNUMBER': -48,
+      'FOR': -48,
+      'GT': -48,
+      'GTEQ': -48,
+      'ID': -48,
+      'IF': -48,
+      'INT': -48,
+      'LBRACKET': -48,
+      'LIST': -48,
+      'LPAREN': -48,
+      'LT': -48,
+      'LTEQ': -48,
+      'MINUS': -48,
+      'MINUSMINUS': -48,
+      'NOT': -48,
+      'NOTEQ': -48,
+      'NUMBER': -48,
+      'OR': -48,
+      'PLUS': -48,
+      'PLUSPLUS': -48,
+      'RBRACE': -48,
+      'RBRACKET': -48,
+      'RETURN': -48,
+      'RPAREN': -48,
+      'STR': -48,
+      'STRING': -48,
+      'THIS': -48,
+      'TIMES': -48,
+      'TRUE': -48,
+      'VIEW': -48,
+      'VOID': -48,
+      'WHILE': -48},
+ 61: {'AND': -49,
+      'ANY': -49,
+      'ASSIGN': -49,
+      'BOOL': -49,
+      'BREAK': -49,
+      'COMMA': -49,
+      'CONTINUE': -49,
+      'DIVIDE': -49,
+      'DOT': -49,
+      'EQEQ': -49,
+      'FALSE': -49,
+      'FLOAT': -49,
+      'FLOATNUMBER': -49,
+      'FOR': -49,
+      'GT': -49,
+      'GTEQ': -49,
+      'ID': -49,
+      'IF': -49,
+      'INT': -49,
+      'LBRACKET': -49,
+      'LIST': -49,
+      'LPAREN': -49,
+      'LT': -49,
+      'LTEQ': -49,
+      'MINUS': -49,
+      'MINUSMINUS': -49,
+      'NOT': -49,
+      'NOTEQ': -49,
+      'NUMBER': -49,
+      'OR': -49,
+      'PLUS': -49,
+      'PLUSPLUS': -49,
+      'RBRACE': -49,
+      'RBRACKET': -49,
+      'RETURN': -49,
+      'RPAREN': -49,
+      'STR': -49,
+      'STRING': -49,
+      'THIS': -49,
+      'TIMES': -49,
+      'TRUE': -49,
+      'VIEW': -49,
+      'VOID': -49,
+      'WHILE': -49},
+ 62: {'AND': -50,
+      'ANY': -50,
+      'ASSIGN': -50,
+      'BOOL': -50,
+      'BREAK': -50,
+      'COMMA': -50,
+      'CONTINUE': -50,
+      'DIVIDE': -50,
+      'DOT': -50,
+      'EQEQ': -50,
+      'FALSE': -50,
+      'FLOAT': -50,
+      'FLOATNUMBER': -50,
+      'FOR': -50,
+      'GT': -50,
+      'GTEQ': -50,
+      'ID': -50,
+      'IF': -50,
+      'INT': -50,
+      'LBRACKET': -50,
+      'LIST': -50,
+      'LPAREN': -50,
+      'LT': -50,
+      'LTEQ': -50,
+      'MINUS': -50,
+      'MINUSMINUS': -50,
+      'NOT': -50,
+      'NOTEQ': -50,
+      'NUMBER': -50,
+      'OR': -50,
+      'PLUS': -50,
+      'PLUSPLUS': -50,
+      'RBRACE': -50,
+      'RBRACKET': -50,
+      'RETURN': -50,
+      'RPAREN': -50,
+      'STR': -50,
+      'STRING': -50,
+      'THIS': -50,
+      'TIMES': -50,
+      'TRUE': -50,
+      'VIEW': -50,
+      'VOID': -50,
+      'WHILE': -50},
+ 63: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 64: {'LBRACE': 100},
+ 65: {'COMMA': 41, 'RPAREN': 101},
+ 66: {'ANY': 74,
+      'BOOL': 15,
+      'BREAK': 72,
+      'CONTINUE': 71,
+      'FALSE': 58,
+      'FLOAT': 14,
+      'FLOATNUMBER': 61,
+      'FOR': 77,
+      'ID': 68,
+      'IF': 78,
+      'INT': 16,
+      'LBRACKET': 55,
+      'LIST': 75,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'RBRACE': 102,
+      'RETURN': 79,
+      'STR': 13,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59,
+      'VIEW': 12,
+      'VOID': 11,
+      'WHILE': 76},
+ 67: {'ID': 103},
+ 68: {'AND': -42,
+      'ANY': -42,
+      'ASSIGN': 104,
+      'BOOL': -42,
+      'BREAK': -42,
+      'CONTINUE': -42,
+      'DIVIDE': -42,
+      'DOT': -42,
+      'EQEQ': -42,
+      'FALSE': -42,
+      'FLOAT': -42,
+      'FLOATNUMBER': -42,
+      'FOR': -42,
+      'GT': -42,
+      'GTEQ': -42,
+      'ID': -42,
+      'IF': -42,
+      'INT': -42,
+      'LBRACKET': -42,
+      'LIST': -42,
+      'LPAREN': 80,
+      'LT': -42,
+      'LTEQ': -42,
+      'MINUS': -42,
+      'MINUSMINUS': -42,
+      'NOT': -42,
+      'NOTEQ': -42,
+      'NUMBER': -42,
+      'OR': -42,
+      'PLUS': -42,
+      'PLUSPLUS': -42,
+      'RBRACE': -42,
+      'RETURN': -42,
+      'STR': -42,
+      'STRING': -42,
+      'THIS': -42,
+      'TIMES': -42,
+      'TRUE': -42,
+      'VIEW': -42,
+      'VOID': -42,
+      'WHILE': -42},
+ 69: {'$end': -11, 'BOOL': -11, 'CLASS': -11, 'FLOAT': -11, 'INT': -11, 'STR': -11, 'VIEW': -11, 'VOID': -11},
+ 70: {'ANY': -19,
+      'BOOL': -19,
+      'BREAK': -19,
+      'CONTINUE': -19,
+      'FALSE': -19,
+      'FLOAT': -19,
+      'FLOATNUMBER': -19,
+      'FOR': -19,
+      'ID': -19,
+      'IF': -19,
+      'INT': -19,
+      'LBRACKET': -19,
+      'LIST': -19,
+      'LPAREN': -19,
+      'NOT': -19,
+      'NUMBER': -19,
+      'RBRACE': -19,
+      'RETURN': -19,
+      'STR': -19,
+      'STRING': -19,
+      'THIS': -19,
+      'TRUE': -19,
+      'VIEW': -19,
+      'VOID': -19,
+      'WHILE': -19},
+ 71: {'ANY': -20,
+      'BOOL': -20,
+      'BREAK': -20,
+      'CONTINUE': -20,
+      'FALSE': -20,
+      'FLOAT': -20,
+      'FLOATNUMBER': -20,
+      'FOR': -20,
+      'ID': -20,
+      'IF': -20,
+      'INT': -20,
+      'LBRACKET': -20,
+      'LIST': -20,
+      'LPAREN': -20,
+      'NOT': -20,
+      'NUMBER': -20,
+      'RBRACE': -20,
+      'RETURN': -20,
+      'STR': -20,
+      'STRING': -20,
+      'THIS': -20,
+      'TRUE': -20,
+      'VIEW': -20,
+      'VOID': -20,
+      'WHILE': -20},
+ 72: {'ANY': -21,
+      'BOOL': -21,
+      'BREAK': -21,
+      'CONTINUE': -21,
+      'FALSE': -21,
+      'FLOAT': -21,
+      'FLOATNUMBER': -21,
+      'FOR': -21,
+      'ID': -21,
+      'IF': -21,
+      'INT': -21,
+      'LBRACKET': -21,
+      'LIST': -21,
+      'LPAREN': -21,
+      'NOT': -21,
+      'NUMBER': -21,
+      'RBRACE': -21,
+      'RETURN': -21,
+      'STR': -21,
+      'STRING': -21,
+      'THIS': -21,
+      'TRUE': -21,
+      'VIEW': -21,
+      'VOID': -21,
+      'WHILE': -21},
+ 73: {'AND': 82,
+      'ANY': -32,
+      'ASSIGN': 105,
+      'BOOL': -32,
+      'BREAK': -32,
+      'CONTINUE': -32,
+      'DIVIDE': 90,
+      'DOT': 81,
+      'EQEQ': 89,
+      'FALSE': -32,
+      'FLOAT': -32,
+      'FLOATNUMBER': -32,
+      'FOR': -32,
+      'GT': 85,
+      'GTEQ': 86,
+      'ID': -32,
+      'IF': -32,
+      'INT': -32,
+      'LBRACKET': -32,
+      'LIST': -32,
+      'LPAREN': -32,
+      'LT': 84,
+      'LTEQ': 87,
+      'MINUS': 92,
+      'MINUSMINUS': 94,
+      'NOT': -32,
+      'NOTEQ': 88,
+      'NUMBER': -32,
+      'OR': 83,
+      'PLUS': 93,
+      'PLUSPLUS': 95,
+      'RBRACE': -32,
+      'RETURN': -32,
+      'STR': -32,
+      'STRING': -32,
+      'THIS': -32,
+      'TIMES': 91,
+      'TRUE': -32,
+      'VIEW': -32,
+      'VOID': -32,
+      'WHILE': -32},
+ 74: {'COLON': 106},
+ 75: {'COLON': 107},
+ 76: {'LPAREN': 108},
+ 77: {'LPAREN': 109},
+ 78: {'LPAREN': 110},
+ 79: {'ANY': -30,
+      'BOOL': -30,
+      'BREAK': -30,
+      'CONTINUE': -30,
+      'FALSE': 58,
+      'FLOAT': -30,
+      'FLOATNUMBER': 61,
+      'FOR': -30,
+      'ID': 52,
+      'IF': -30,
+      'INT': -30,
+      'LBRACKET': 55,
+      'LIST': -30,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'RBRACE': -30,
+      'RETURN': -30,
+      'STR': -30,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59,
+      'VIEW': -30,
+      'VOID': -30,
+      'WHILE': -30},
+ 80: {'COMMA': -76,
+      'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'RPAREN': 112,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 81: {'ID': 115},
+ 82: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 83: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 84: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 85: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 86: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 87: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 88: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 89: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 90: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 91: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 92: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 93: {'FALSE': 58,
+      'FLOATNUMBER': 61,
+      'ID': 52,
+      'LBRACKET': 55,
+      'LPAREN': 54,
+      'NOT': 63,
+      'NUMBER': 60,
+      'STRING': 62,
+      'THIS': 56,
+      'TRUE': 59},
+ 94: {'AND': -64,
+      'ANY': -64,
+      'ASSIGN': -64,
+      'BOOL': -64,
+      'BREAK': -64,
+      'COMMA': -64,
+      'CONTINUE': -64,
+      'DIVIDE': -64,
+      'DOT': -64,
+      'EQEQ': -64,
+      'FALSE': -64,
+      'FLOAT': -64,
+      'FLOATNUMBER': -64,
+      'FOR': -64,
+      'GT': -64,
+      'GTEQ': -64,
+      'ID': -64,
+      'IF': -64,
+      'INT': -64,
+      'LBRACKET': -64,
+      'LIST': -64,
+      'LPAREN': -64,
+      'LT': -64,
+      'LTEQ': -64,
+      'MINUS': -64,
+      'MINUSMINUS': -64,
+      'NOT': -64,
+      'NOTEQ': -64,
+      'NUMBER': -64,
+      'OR': -64,
+      'PLUS': -64,
+      'PLUSPLUS': -64,
+      'RBRACE': -64,
+      'RBRACKET': -64,
+      'RETURN': -64,
+      'RPAREN': -64,
+      'STR': -64,
+      'STRING': -64,
+      'THIS': -64,
+      'TIMES': -64,
+      'TRUE': -64,
+      'VIEW': -64,
+      'VOID': -64,
+      'WHILE': -64},
+ 95: {'AND': -65,
+      'ANY': -65,
+      'ASSIGN': -65,
+      'BOOL': -65,
+      'BREAK': -65,
+      'COMMA': -65,
+      'CONTINUE': -65,
+      'DIVIDE': -65,
+      'DOT': -65,
+      'EQEQ': -65,
+      'FALSE': -65,
+      'FLOAT': -65,
+      'FLOATNUMBER': -65,
+      'FOR': -65,
+      'GT': -65,
+      'GTEQ': -65,
+      'ID': -65,
+      'IF': -65,
+      'INT': -65,
+      'LBRACKET': -65,
+      'LIST': -65,
+      'LPAREN': -65,
+      'LT': -65,
+      'LTEQ': -65,
+      'MINUS': -65,
+      'MINUSMINUS': -65,
+      'NOT': -65,
+      'NOTEQ': -65,
+      'NUMBER': -65,
+      'OR': -65,
+      'PLUS': -65,
+      'PLUSPLUS': -65,
+      'RBRACE': -65,
+      'RBRACKET': -65,
+      'RETURN': -65,
+      'RPAREN': -65,
+      'STR': -65,
+      'STRING': -65,
+      'THIS': -65,
+      'TIMES': -65,
+      'TRUE': -65,
+      'VIEW': -65,
+      'VOID': -65,
+      'WHILE': -65},
+ 96: {'AND': 82,
+      'DIVIDE': 90,
+      'DOT': 81,
+      'EQEQ': 89,
+      'GT': 85,
+      'GTEQ': 86,
+      'LT': 84,
+      'LTEQ': 87,
+      'MINUS': 92,
+      'MINUSMINUS': 94,
+      'NOTEQ': 88,
+      'OR': 83,
+      'PLUS': 93,
+      'PLUSPLUS': 95,
+      'RPAREN': 128,
+      'TIMES': 91},
+ 97: {'COMMA': 130, 'RBRACKET': 129},
+ 98: {'AND': 82,
+      'COMMA': -72,
+      'DIVIDE': 90,
+      'DOT': 81,
+      'EQEQ': 89,
+      'GT': 85,
+      'GTEQ': 86,
+      'LT': 84,
+      'LTEQ': 87,
+      'MINUS': 92,
+      'MINUSMINUS': 94,
+      'NOTEQ': 88,
+      'OR': 83,
+      'PLUS': 93,
+      'PLUSPLUS': 95,
+      'RBRACKET': -72,
+      'TIMES': 91},
+ 99: {'AND': -51,
+      'ANY': -51,
+      'ASSIGN': -51,
+      'BOOL': -51,
+      'BREAK': -51,
+      'COMMA': -51,
+      'CONTINUE': -51,
+      'DIVIDE': 90,
+      'DOT': -51,
+      'EQEQ': 89,
+      'FALSE': -51,
+      'FLOAT': -51,
+      'FLOATNUMBER': -51,
+      'FOR': -51,
+      'GT': 85,
+      'GTEQ': 86,
+      'ID': -51,
+      'IF': -51,
+      'INT': -51,
+      'LBRACKET': -51,
+      'LIST': -51,
+      'LPAREN': -51,
+      'LT': 84,
+      'LTEQ': 87,
+      'MINUS': 92,
+      'MINUSMINUS': -51,
+      'NOT': -51,
+      'NOTEQ': 88,
+      'NUMBER': -51,
+      'OR': -51,
+      'PLUS': 93,
+      'PLUSPLUS': -51,
+      'RBRACE': -51,
+      'RBRACKET': -51,
+      'RETURN': -51,
+      'RPAREN': -51,
+      'STR': -51,
+      'STRING': -51,
+      'THIS': -51,
+      'TIMES': 91,
+      'TRUE': -51,
+      'VIEW': -51,
+      'VOID': -51,
+      'WHILE': -51},
+ 100: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 101: {'LBRACE': 132},
+ 102: {'$end': -10, 'BOOL': -10, 'CLASS': -10, 'FLOAT': -10, 'INT': -10, 'STR': -10, 'VIEW': -10, 'VOID': -10},
+ 103: {'ASSIGN': 133},
+ 104: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 105: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 106: {'ID': 136},
+ 107: {'BOOL': 15, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'VIEW': 12, 'VOID': 11},
+ 108: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 109: {'BOOL': 15, 'FLOAT': 14, 'INT': 16, 'STR': 13, 'VIEW': 12, 'VOID': 11},
+ 110: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 111: {'AND': 82,
+       'ANY': -31,
+       'BOOL': -31,
+       'BREAK': -31,
+       'CONTINUE': -31,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'FALSE': -31,
+       'FLOAT': -31,
+       'FLOATNUMBER': -31,
+       'FOR': -31,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -31,
+       'IF': -31,
+       'INT': -31,
+       'LBRACKET': -31,
+       'LIST': -31,
+       'LPAREN': -31,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOT': -31,
+       'NOTEQ': 88,
+       'NUMBER': -31,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACE': -31,
+       'RETURN': -31,
+       'STR': -31,
+       'STRING': -31,
+       'THIS': -31,
+       'TIMES': 91,
+       'TRUE': -31,
+       'VIEW': -31,
+       'VOID': -31,
+       'WHILE': -31},
+ 112: {'AND': -39,
+       'ANY': -39,
+       'ASSIGN': -39,
+       'BOOL': -39,
+       'BREAK': -39,
+       'COMMA': -39,
+       'CONTINUE': -39,
+       'DIVIDE': -39,
+       'DOT': -39,
+       'EQEQ': -39,
+       'FALSE': -39,
+       'FLOAT': -39,
+       'FLOATNUMBER': -39,
+       'FOR': -39,
+       'GT': -39,
+       'GTEQ': -39,
+       'ID': -39,
+       'IF': -39,
+       'INT': -39,
+       'LBRACKET': -39,
+       'LIST': -39,
+       'LPAREN': -39,
+       'LT': -39,
+       'LTEQ': -39,
+       'MINUS': -39,
+       'MINUSMINUS': -39,
+       'NOT': -39,
+       'NOTEQ': -39,
+       'NUMBER': -39,
+       'OR': -39,
+       'PLUS': -39,
+       'PLUSPLUS': -39,
+       'RBRACE': -39,
+       'RBRACKET': -39,
+       'RETURN': -39,
+       'RPAREN': -39,
+       'STR': -39,
+       'STRING': -39,
+       'THIS': -39,
+       'TIMES': -39,
+       'TRUE': -39,
+       'VIEW': -39,
+       'VOID': -39,
+       'WHILE': -39},
+ 113: {'COMMA': 142, 'RPAREN': 141},
+ 114: {'AND': 82,
+       'COMMA': -75,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RPAREN': -75,
+       'TIMES': 91},
+ 115: {'AND': -38,
+       'ANY': -38,
+       'ASSIGN': -38,
+       'BOOL': -38,
+       'BREAK': -38,
+       'COMMA': -38,
+       'CONTINUE': -38,
+       'DIVIDE': -38,
+       'DOT': -38,
+       'EQEQ': -38,
+       'FALSE': -38,
+       'FLOAT': -38,
+       'FLOATNUMBER': -38,
+       'FOR': -38,
+       'GT': -38,
+       'GTEQ': -38,
+       'ID': -38,
+       'IF': -38,
+       'INT': -38,
+       'LBRACKET': -38,
+       'LIST': -38,
+       'LPAREN': 143,
+       'LT': -38,
+       'LTEQ': -38,
+       'MINUS': -38,
+       'MINUSMINUS': -38,
+       'NOT': -38,
+       'NOTEQ': -38,
+       'NUMBER': -38,
+       'OR': -38,
+       'PLUS': -38,
+       'PLUSPLUS': -38,
+       'RBRACE': -38,
+       'RBRACKET': -38,
+       'RETURN': -38,
+       'RPAREN': -38,
+       'STR': -38,
+       'STRING': -38,
+       'THIS': -38,
+       'TIMES': -38,
+       'TRUE': -38,
+       'VIEW': -38,
+       'VOID': -38,
+       'WHILE': -38},
+ 116: {'AND': -52,
+       'ANY': -52,
+       'ASSIGN': -52,
+       'BOOL': -52,
+       'BREAK': -52,
+       'COMMA': -52,
+       'CONTINUE': -52,
+       'DIVIDE': 90,
+       'DOT': -52,
+       'EQEQ': 89,
+       'FALSE': -52,
+       'FLOAT': -52,
+       'FLOATNUMBER': -52,
+       'FOR': -52,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -52,
+       'IF': -52,
+       'INT': -52,
+       'LBRACKET': -52,
+       'LIST': -52,
+       'LPAREN': -52,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': -52,
+       'NOT': -52,
+       'NOTEQ': 88,
+       'NUMBER': -52,
+       'OR': -52,
+       'PLUS': 93,
+       'PLUSPLUS': -52,
+       'RBRACE': -52,
+       'RBRACKET': -52,
+       'RETURN': -52,
+       'RPAREN': -52,
+       'STR': -52,
+       'STRING': -52,
+       'THIS': -52,
+       'TIMES': 91,
+       'TRUE': -52,
+       'VIEW': -52,
+       'VOID': -52,
+       'WHILE': -52},
+ 117: {'AND': 82,
+       'ANY': -53,
+       'ASSIGN': -53,
+       'BOOL': -53,
+       'BREAK': -53,
+       'COMMA': -53,
+       'CONTINUE': -53,
+       'DIVIDE': 90,
+       'DOT': -53,
+       'EQEQ': 89,
+       'FALSE': -53,
+       'FLOAT': -53,
+       'FLOATNUMBER': -53,
+       'FOR': -53,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -53,
+       'IF': -53,
+       'INT': -53,
+       'LBRACKET': -53,
+       'LIST': -53,
+       'LPAREN': -53,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': -53,
+       'NOT': -53,
+       'NOTEQ': 88,
+       'NUMBER': -53,
+       'OR': -53,
+       'PLUS': 93,
+       'PLUSPLUS': -53,
+       'RBRACE': -53,
+       'RBRACKET': -53,
+       'RETURN': -53,
+       'RPAREN': -53,
+       'STR': -53,
+       'STRING': -53,
+       'THIS': -53,
+       'TIMES': 91,
+       'TRUE': -53,
+       'VIEW': -53,
+       'VOID': -53,
+       'WHILE': -53},
+ 118: {'AND': -54,
+       'ANY': -54,
+       'ASSIGN': -54,
+       'BOOL': -54,
+       'BREAK': -54,
+       'COMMA': -54,
+       'CONTINUE': -54,
+       'DIVIDE': 90,
+       'DOT': -54,
+       'EQEQ': None,
+       'FALSE': -54,
+       'FLOAT': -54,
+       'FLOATNUMBER': -54,
+       'FOR': -54,
+       'GT': None,
+       'GTEQ': None,
+       'ID': -54,
+       'IF': -54,
+       'INT': -54,
+       'LBRACKET': -54,
+       'LIST': -54,
+       'LPAREN': -54,
+       'LT': None,
+       'LTEQ': None,
+       'MINUS': 92,
+       'MINUSMINUS': -54,
+       'NOT': -54,
+       'NOTEQ': None,
+       'NUMBER': -54,
+       'OR': -54,
+       'PLUS': 93,
+       'PLUSPLUS': -54,
+       'RBRACE': -54,
+       'RBRACKET': -54,
+       'RETURN': -54,
+       'RPAREN': -54,
+       'STR': -54,
+       'STRING': -54,
+       'THIS': -54,
+       'TIMES': 91,
+       'TRUE': -54,
+       'VIEW': -54,
+       'VOID': -54,
+       'WHILE': -54},
+ 119: {'AND': -55,
+       'ANY': -55,
+       'ASSIGN': -55,
+       'BOOL': -55,
+       'BREAK': -55,
+       'COMMA': -55,
+       'CONTINUE': -55,
+       'DIVIDE': 90,
+       'DOT': -55,
+       'EQEQ': None,
+       'FALSE': -55,
+       'FLOAT': -55,
+       'FLOATNUMBER': -55,
+       'FOR': -55,
+       'GT': None,
+       'GTEQ': None,
+       'ID': -55,
+       'IF': -55,
+       'INT': -55,
+       'LBRACKET': -55,
+       'LIST': -55,
+       'LPAREN': -55,
+       'LT': None,
+       'LTEQ': None,
+       'MINUS': 92,
+       'MINUSMINUS': -55,
+       'NOT': -55,
+       'NOTEQ': None,
+       'NUMBER': -55,
+       'OR': -55,
+       'PLUS': 93,
+       'PLUSPLUS': -55,
+       'RBRACE': -55,
+       'RBRACKET': -55,
+       'RETURN': -55,
+       'RPAREN': -55,
+       'STR': -55,
+       'STRING': -55,
+       'THIS': -55,
+       'TIMES': 91,
+       'TRUE': -55,
+       'VIEW': -55,
+       'VOID': -55,
+       'WHILE': -55},
+ 120: {'AND': -56,
+       'ANY': -56,
+       'ASSIGN': -56,
+       'BOOL': -56,
+       'BREAK': -56,
+       'COMMA': -56,
+       'CONTINUE': -56,
+       'DIVIDE': 90,
+       'DOT': -56,
+       'EQEQ': None,
+       'FALSE': -56,
+       'FLOAT': -56,
+       'FLOATNUMBER': -56,
+       'FOR': -56,
+       'GT': None,
+       'GTEQ': None,
+       'ID': -56,
+       'IF': -56,
+       'INT': -56,
+       'LBRACKET': -56,
+       'LIST': -56,
+       'LPAREN': -56,
+       'LT': None,
+       'LTEQ': None,
+       'MINUS': 92,
+       'MINUSMINUS': -56,
+       'NOT': -56,
+       'NOTEQ': None,
+       'NUMBER': -56,
+       'OR': -56,
+       'PLUS': 93,
+       'PLUSPLUS': -56,
+       'RBRACE': -56,
+       'RBRACKET': -56,
+       'RETURN': -56,
+       'RPAREN': -56,
+       'STR': -56,
+       'STRING': -56,
+       'THIS': -56,
+       'TIMES': 91,
+       'TRUE': -56,
+       'VIEW': -56,
+       'VOID': -56,
+       'WHILE': -56},
+ 121: {'AND': -57,
+       'ANY': -57,
+       'ASSIGN': -57,
+       'BOOL': -57,
+       'BREAK': -57,
+       'COMMA': -57,
+       'CONTINUE': -57,
+       'DIVIDE': 90,
+       'DOT': -57,
+       'EQEQ': None,
+       'FALSE': -57,
+       'FLOAT': -57,
+       'FLOATNUMBER': -57,
+       'FOR': -57,
+       'GT': None,
+       'GTEQ': None,
+       'ID': -57,
+       'IF': -57,
+       'INT': -57,
+       'LBRACKET': -57,
+       'LIST': -57,
+       'LPAREN': -57,
+       'LT': None,
+       'LTEQ': None,
+       'MINUS': 92,
+       'MINUSMINUS': -57,
+       'NOT': -57,
+       'NOTEQ': None,
+       'NUMBER': -57,
+       'OR': -57,
+       'PLUS': 93,
+       'PLUSPLUS': -57,
+       'RBRACE': -57,
+       'RBRACKET': -57,
+       'RETURN': -57,
+       'RPAREN': -57,
+       'STR': -57,
+       'STRING': -57,
+       'THIS': -57,
+       'TIMES': 91,
+       'TRUE': -57,
+       'VIEW': -57,
+       'VOID': -57,
+       'WHILE': -57},
+ 122: {'AND': -58,
+       'ANY': -58,
+       'ASSIGN': -58,
+       'BOOL': -58,
+       'BREAK': -58,
+       'COMMA': -58,
+       'CONTINUE': -58,
+       'DIVIDE': 90,
+       'DOT': -58,
+       'EQEQ': None,
+       'FALSE': -58,
+       'FLOAT': -58,
+       'FLOATNUMBER': -58,
+       'FOR': -58,
+       'GT': None,
+       'GTEQ': None,
+       'ID': -58,
+       'IF': -58,
+       'INT': -58,
+       'LBRACKET': -58,
+       'LIST': -58,
+       'LPAREN': -58,
+       'LT': None,
+       'LTEQ': None,
+       'MINUS': 92,
+       'MINUSMINUS': -58,
+       'NOT': -58,
+       'NOTEQ': None,
+       'NUMBER': -58,
+       'OR': -58,
+       'PLUS': 93,
+       'PLUSPLUS': -58,
+       'RBRACE': -58,
+       'RBRACKET': -58,
+       'RETURN': -58,
+       'RPAREN': -58,
+       'STR': -58,
+       'STRING': -58,
+       'THIS': -58,
+       'TIMES': 91,
+       'TRUE': -58,
+       'VIEW': -58,
+       'VOID': -58,
+       'WHILE': -58},
+ 123: {'AND': -59,
+       'ANY': -59,
+       'ASSIGN': -59,
+       'BOOL': -59,
+       'BREAK': -59,
+       'COMMA': -59,
+       'CONTINUE': -59,
+       'DIVIDE': 90,
+       'DOT': -59,
+       'EQEQ': None,
+       'FALSE': -59,
+       'FLOAT': -59,
+       'FLOATNUMBER': -59,
+       'FOR': -59,
+       'GT': None,
+       'GTEQ': None,
+       'ID': -59,
+       'IF': -59,
+       'INT': -59,
+       'LBRACKET': -59,
+       'LIST': -59,
+       'LPAREN': -59,
+       'LT': None,
+       'LTEQ': None,
+       'MINUS': 92,
+       'MINUSMINUS': -59,
+       'NOT': -59,
+       'NOTEQ': None,
+       'NUMBER': -59,
+       'OR': -59,
+       'PLUS': 93,
+       'PLUSPLUS': -59,
+       'RBRACE': -59,
+       'RBRACKET': -59,
+       'RETURN': -59,
+       'RPAREN': -59,
+       'STR': -59,
+       'STRING': -59,
+       'THIS': -59,
+       'TIMES': 91,
+       'TRUE': -59,
+       'VIEW': -59,
+       'VOID': -59,
+       'WHILE': -59},
+ 124: {'AND': -60,
+       'ANY': -60,
+       'ASSIGN': -60,
+       'BOOL': -60,
+       'BREAK': -60,
+       'COMMA': -60,
+       'CONTINUE': -60,
+       'DIVIDE': -60,
+       'DOT': -60,
+       'EQEQ': -60,
+       'FALSE': -60,
+       'FLOAT': -60,
+       'FLOATNUMBER': -60,
+       'FOR': -60,
+       'GT': -60,
+       'GTEQ': -60,
+       'ID': -60,
+       'IF': -60,
+       'INT': -60,
+       'LBRACKET': -60,
+       'LIST': -60,
+       'LPAREN': -60,
+       'LT': -60,
+       'LTEQ': -60,
+       'MINUS': -60,
+       'MINUSMINUS': -60,
+       'NOT': -60,
+       'NOTEQ': -60,
+       'NUMBER': -60,
+       'OR': -60,
+       'PLUS': -60,
+       'PLUSPLUS': -60,
+       'RBRACE': -60,
+       'RBRACKET': -60,
+       'RETURN': -60,
+       'RPAREN': -60,
+       'STR': -60,
+       'STRING': -60,
+       'THIS': -60,
+       'TIMES': -60,
+       'TRUE': -60,
+       'VIEW': -60,
+       'VOID': -60,
+       'WHILE': -60},
+ 125: {'AND': -61,
+       'ANY': -61,
+       'ASSIGN': -61,
+       'BOOL': -61,
+       'BREAK': -61,
+       'COMMA': -61,
+       'CONTINUE': -61,
+       'DIVIDE': -61,
+       'DOT': -61,
+       'EQEQ': -61,
+       'FALSE': -61,
+       'FLOAT': -61,
+       'FLOATNUMBER': -61,
+       'FOR': -61,
+       'GT': -61,
+       'GTEQ': -61,
+       'ID': -61,
+       'IF': -61,
+       'INT': -61,
+       'LBRACKET': -61,
+       'LIST': -61,
+       'LPAREN': -61,
+       'LT': -61,
+       'LTEQ': -61,
+       'MINUS': -61,
+       'MINUSMINUS': -61,
+       'NOT': -61,
+       'NOTEQ': -61,
+       'NUMBER': -61,
+       'OR': -61,
+       'PLUS': -61,
+       'PLUSPLUS': -61,
+       'RBRACE': -61,
+       'RBRACKET': -61,
+       'RETURN': -61,
+       'RPAREN': -61,
+       'STR': -61,
+       'STRING': -61,
+       'THIS': -61,
+       'TIMES': -61,
+       'TRUE': -61,
+       'VIEW': -61,
+       'VOID': -61,
+       'WHILE': -61},
+ 126: {'AND': -62,
+       'ANY': -62,
+       'ASSIGN': -62,
+       'BOOL': -62,
+       'BREAK': -62,
+       'COMMA': -62,
+       'CONTINUE': -62,
+       'DIVIDE': 90,
+       'DOT': -62,
+       'EQEQ': -62,
+       'FALSE': -62,
+       'FLOAT': -62,
+       'FLOATNUMBER': -62,
+       'FOR': -62,
+       'GT': -62,
+       'GTEQ': -62,
+       'ID': -62,
+       'IF': -62,
+       'INT': -62,
+       'LBRACKET': -62,
+       'LIST': -62,
+       'LPAREN': -62,
+       'LT': -62,
+       'LTEQ': -62,
+       'MINUS': -62,
+       'MINUSMINUS': -62,
+       'NOT': -62,
+       'NOTEQ': -62,
+       'NUMBER': -62,
+       'OR': -62,
+       'PLUS': -62,
+       'PLUSPLUS': -62,
+       'RBRACE': -62,
+       'RBRACKET': -62,
+       'RETURN': -62,
+       'RPAREN': -62,
+       'STR': -62,
+       'STRING': -62,
+       'THIS': -62,
+       'TIMES': 91,
+       'TRUE': -62,
+       'VIEW': -62,
+       'VOID': -62,
+       'WHILE': -62},
+ 127: {'AND': -63,
+       'ANY': -63,
+       'ASSIGN': -63,
+       'BOOL': -63,
+       'BREAK': -63,
+       'COMMA': -63,
+       'CONTINUE': -63,
+       'DIVIDE': 90,
+       'DOT': -63,
+       'EQEQ': -63,
+       'FALSE': -63,
+       'FLOAT': -63,
+       'FLOATNUMBER': -63,
+       'FOR': -63,
+       'GT': -63,
+       'GTEQ': -63,
+       'ID': -63,
+       'IF': -63,
+       'INT': -63,
+       'LBRACKET': -63,
+       'LIST': -63,
+       'LPAREN': -63,
+       'LT': -63,
+       'LTEQ': -63,
+       'MINUS': -63,
+       'MINUSMINUS': -63,
+       'NOT': -63,
+       'NOTEQ': -63,
+       'NUMBER': -63,
+       'OR': -63,
+       'PLUS': -63,
+       'PLUSPLUS': -63,
+       'RBRACE': -63,
+       'RBRACKET': -63,
+       'RETURN': -63,
+       'RPAREN': -63,
+       'STR': -63,
+       'STRING': -63,
+       'THIS': -63,
+       'TIMES': 91,
+       'TRUE': -63,
+       'VIEW': -63,
+       'VOID': -63,
+       'WHILE': -63},
+ 128: {'AND': -41,
+       'ANY': -41,
+       'ASSIGN': -41,
+       'BOOL': -41,
+       'BREAK': -41,
+       'COMMA': -41,
+       'CONTINUE': -41,
+       'DIVIDE': -41,
+       'DOT': -41,
+       'EQEQ': -41,
+       'FALSE': -41,
+       'FLOAT': -41,
+       'FLOATNUMBER': -41,
+       'FOR': -41,
+       'GT': -41,
+       'GTEQ': -41,
+       'ID': -41,
+       'IF': -41,
+       'INT': -41,
+       'LBRACKET': -41,
+       'LIST': -41,
+       'LPAREN': -41,
+       'LT': -41,
+       'LTEQ': -41,
+       'MINUS': -41,
+       'MINUSMINUS': -41,
+       'NOT': -41,
+       'NOTEQ': -41,
+       'NUMBER': -41,
+       'OR': -41,
+       'PLUS': -41,
+       'PLUSPLUS': -41,
+       'RBRACE': -41,
+       'RBRACKET': -41,
+       'RETURN': -41,
+       'RPAREN': -41,
+       'STR': -41,
+       'STRING': -41,
+       'THIS': -41,
+       'TIMES': -41,
+       'TRUE': -41,
+       'VIEW': -41,
+       'VOID': -41,
+       'WHILE': -41},
+ 129: {'AND': -43,
+       'ANY': -43,
+       'ASSIGN': -43,
+       'BOOL': -43,
+       'BREAK': -43,
+       'COMMA': -43,
+       'CONTINUE': -43,
+       'DIVIDE': -43,
+       'DOT': -43,
+       'EQEQ': -43,
+       'FALSE': -43,
+       'FLOAT': -43,
+       'FLOATNUMBER': -43,
+       'FOR': -43,
+       'GT': -43,
+       'GTEQ': -43,
+       'ID': -43,
+       'IF': -43,
+       'INT': -43,
+       'LBRACKET': -43,
+       'LIST': -43,
+       'LPAREN': -43,
+       'LT': -43,
+       'LTEQ': -43,
+       'MINUS': -43,
+       'MINUSMINUS': -43,
+       'NOT': -43,
+       'NOTEQ': -43,
+       'NUMBER': -43,
+       'OR': -43,
+       'PLUS': -43,
+       'PLUSPLUS': -43,
+       'RBRACE': -43,
+       'RBRACKET': -43,
+       'RETURN': -43,
+       'RPAREN': -43,
+       'STR': -43,
+       'STRING': -43,
+       'THIS': -43,
+       'TIMES': -43,
+       'TRUE': -43,
+       'VIEW': -43,
+       'VOID': -43,
+       'WHILE': -43},
+ 130: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 131: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 145,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 132: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 133: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 134: {'AND': 82,
+       'ANY': -25,
+       'BOOL': -25,
+       'BREAK': -25,
+       'CONTINUE': -25,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'FALSE': -25,
+       'FLOAT': -25,
+       'FLOATNUMBER': -25,
+       'FOR': -25,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -25,
+       'IF': -25,
+       'INT': -25,
+       'LBRACKET': -25,
+       'LIST': -25,
+       'LPAREN': -25,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOT': -25,
+       'NOTEQ': 88,
+       'NUMBER': -25,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACE': -25,
+       'RETURN': -25,
+       'STR': -25,
+       'STRING': -25,
+       'THIS': -25,
+       'TIMES': 91,
+       'TRUE': -25,
+       'VIEW': -25,
+       'VOID': -25,
+       'WHILE': -25},
+ 135: {'AND': 82,
+       'ANY': -22,
+       'BOOL': -22,
+       'BREAK': -22,
+       'CONTINUE': -22,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'FALSE': -22,
+       'FLOAT': -22,
+       'FLOATNUMBER': -22,
+       'FOR': -22,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -22,
+       'IF': -22,
+       'INT': -22,
+       'LBRACKET': -22,
+       'LIST': -22,
+       'LPAREN': -22,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOT': -22,
+       'NOTEQ': 88,
+       'NUMBER': -22,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACE': -22,
+       'RETURN': -22,
+       'STR': -22,
+       'STRING': -22,
+       'THIS': -22,
+       'TIMES': 91,
+       'TRUE': -22,
+       'VIEW': -22,
+       'VOID': -22,
+       'WHILE': -22},
+ 136: {'ID': 148},
+ 137: {'ID': 149},
+ 138: {'AND': 82,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RPAREN': 150,
+       'TIMES': 91},
+ 139: {'ID': 151},
+ 140: {'AND': 82,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RPAREN': 152,
+       'TIMES': 91},
+ 141: {'AND': -40,
+       'ANY': -40,
+       'ASSIGN': -40,
+       'BOOL': -40,
+       'BREAK': -40,
+       'COMMA': -40,
+       'CONTINUE': -40,
+       'DIVIDE': -40,
+       'DOT': -40,
+       'EQEQ': -40,
+       'FALSE': -40,
+       'FLOAT': -40,
+       'FLOATNUMBER': -40,
+       'FOR': -40,
+       'GT': -40,
+       'GTEQ': -40,
+       'ID': -40,
+       'IF': -40,
+       'INT': -40,
+       'LBRACKET': -40,
+       'LIST': -40,
+       'LPAREN': -40,
+       'LT': -40,
+       'LTEQ': -40,
+       'MINUS': -40,
+       'MINUSMINUS': -40,
+       'NOT': -40,
+       'NOTEQ': -40,
+       'NUMBER': -40,
+       'OR': -40,
+       'PLUS': -40,
+       'PLUSPLUS': -40,
+       'RBRACE': -40,
+       'RBRACKET': -40,
+       'RETURN': -40,
+       'RPAREN': -40,
+       'STR': -40,
+       'STRING': -40,
+       'THIS': -40,
+       'TIMES': -40,
+       'TRUE': -40,
+       'VIEW': -40,
+       'VOID': -40,
+       'WHILE': -40},
+ 142: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 143: {'COMMA': -76,
+       'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RPAREN': 154,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 144: {'AND': 82,
+       'COMMA': -73,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACKET': -73,
+       'TIMES': 91},
+ 145: {'BOOL': -82, 'FLOAT': -82, 'INT': -82, 'RBRACE': -82, 'STR': -82, 'VIEW': -82, 'VOID': -82},
+ 146: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 156,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 147: {'AND': 82,
+       'ANY': -26,
+       'BOOL': -26,
+       'BREAK': -26,
+       'CONTINUE': -26,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'FALSE': -26,
+       'FLOAT': -26,
+       'FLOATNUMBER': -26,
+       'FOR': -26,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -26,
+       'IF': -26,
+       'INT': -26,
+       'LBRACKET': -26,
+       'LIST': -26,
+       'LPAREN': -26,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOT': -26,
+       'NOTEQ': 88,
+       'NUMBER': -26,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACE': -26,
+       'RETURN': -26,
+       'STR': -26,
+       'STRING': -26,
+       'THIS': -26,
+       'TIMES': 91,
+       'TRUE': -26,
+       'VIEW': -26,
+       'VOID': -26,
+       'WHILE': -26},
+ 148: {'ASSIGN': 157},
+ 149: {'ASSIGN': 158},
+ 150: {'LBRACE': 159},
+ 151: {'IN': 160},
+ 152: {'LBRACE': 161},
+ 153: {'AND': 82,
+       'COMMA': -74,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RPAREN': -74,
+       'TIMES': 91},
+ 154: {'AND': -36,
+       'ANY': -36,
+       'ASSIGN': -36,
+       'BOOL': -36,
+       'BREAK': -36,
+       'COMMA': -36,
+       'CONTINUE': -36,
+       'DIVIDE': -36,
+       'DOT': -36,
+       'EQEQ': -36,
+       'FALSE': -36,
+       'FLOAT': -36,
+       'FLOATNUMBER': -36,
+       'FOR': -36,
+       'GT': -36,
+       'GTEQ': -36,
+       'ID': -36,
+       'IF': -36,
+       'INT': -36,
+       'LBRACKET': -36,
+       'LIST': -36,
+       'LPAREN': -36,
+       'LT': -36,
+       'LTEQ': -36,
+       'MINUS': -36,
+       'MINUSMINUS': -36,
+       'NOT': -36,
+       'NOTEQ': -36,
+       'NUMBER': -36,
+       'OR': -36,
+       'PLUS': -36,
+       'PLUSPLUS': -36,
+       'RBRACE': -36,
+       'RBRACKET': -36,
+       'RETURN': -36,
+       'RPAREN': -36,
+       'STR': -36,
+       'STRING': -36,
+       'THIS': -36,
+       'TIMES': -36,
+       'TRUE': -36,
+       'VIEW': -36,
+       'VOID': -36,
+       'WHILE': -36},
+ 155: {'COMMA': 142, 'RPAREN': 162},
+ 156: {'BOOL': -83, 'FLOAT': -83, 'INT': -83, 'RBRACE': -83, 'STR': -83, 'VIEW': -83, 'VOID': -83},
+ 157: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 158: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 159: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 160: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 161: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 162: {'AND': -37,
+       'ANY': -37,
+       'ASSIGN': -37,
+       'BOOL': -37,
+       'BREAK': -37,
+       'COMMA': -37,
+       'CONTINUE': -37,
+       'DIVIDE': -37,
+       'DOT': -37,
+       'EQEQ': -37,
+       'FALSE': -37,
+       'FLOAT': -37,
+       'FLOATNUMBER': -37,
+       'FOR': -37,
+       'GT': -37,
+       'GTEQ': -37,
+       'ID': -37,
+       'IF': -37,
+       'INT': -37,
+       'LBRACKET': -37,
+       'LIST': -37,
+       'LPAREN': -37,
+       'LT': -37,
+       'LTEQ': -37,
+       'MINUS': -37,
+       'MINUSMINUS': -37,
+       'NOT': -37,
+       'NOTEQ': -37,
+       'NUMBER': -37,
+       'OR': -37,
+       'PLUS': -37,
+       'PLUSPLUS': -37,
+       'RBRACE': -37,
+       'RBRACKET': -37,
+       'RETURN': -37,
+       'RPAREN': -37,
+       'STR': -37,
+       'STRING': -37,
+       'THIS': -37,
+       'TIMES': -37,
+       'TRUE': -37,
+       'VIEW': -37,
+       'VOID': -37,
+       'WHILE': -37},
+ 163: {'AND': 82,
+       'ANY': -23,
+       'BOOL': -23,
+       'BREAK': -23,
+       'CONTINUE': -23,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'FALSE': -23,
+       'FLOAT': -23,
+       'FLOATNUMBER': -23,
+       'FOR': -23,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -23,
+       'IF': -23,
+       'INT': -23,
+       'LBRACKET': -23,
+       'LIST': -23,
+       'LPAREN': -23,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOT': -23,
+       'NOTEQ': 88,
+       'NUMBER': -23,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACE': -23,
+       'RETURN': -23,
+       'STR': -23,
+       'STRING': -23,
+       'THIS': -23,
+       'TIMES': 91,
+       'TRUE': -23,
+       'VIEW': -23,
+       'VOID': -23,
+       'WHILE': -23},
+ 164: {'AND': 82,
+       'ANY': -24,
+       'BOOL': -24,
+       'BREAK': -24,
+       'CONTINUE': -24,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'FALSE': -24,
+       'FLOAT': -24,
+       'FLOATNUMBER': -24,
+       'FOR': -24,
+       'GT': 85,
+       'GTEQ': 86,
+       'ID': -24,
+       'IF': -24,
+       'INT': -24,
+       'LBRACKET': -24,
+       'LIST': -24,
+       'LPAREN': -24,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOT': -24,
+       'NOTEQ': 88,
+       'NUMBER': -24,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RBRACE': -24,
+       'RETURN': -24,
+       'STR': -24,
+       'STRING': -24,
+       'THIS': -24,
+       'TIMES': 91,
+       'TRUE': -24,
+       'VIEW': -24,
+       'VOID': -24,
+       'WHILE': -24},
+ 165: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 168,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 166: {'AND': 82,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RPAREN': 169,
+       'TIMES': 91},
+ 167: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 170,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 168: {'ANY': -27,
+       'BOOL': -27,
+       'BREAK': -27,
+       'CONTINUE': -27,
+       'FALSE': -27,
+       'FLOAT': -27,
+       'FLOATNUMBER': -27,
+       'FOR': -27,
+       'ID': -27,
+       'IF': -27,
+       'INT': -27,
+       'LBRACKET': -27,
+       'LIST': -27,
+       'LPAREN': -27,
+       'NOT': -27,
+       'NUMBER': -27,
+       'RBRACE': -27,
+       'RETURN': -27,
+       'STR': -27,
+       'STRING': -27,
+       'THIS': -27,
+       'TRUE': -27,
+       'VIEW': -27,
+       'VOID': -27,
+       'WHILE': -27},
+ 169: {'LBRACE': 171},
+ 170: {'ANY': -33,
+       'BOOL': -33,
+       'BREAK': -33,
+       'CONTINUE': -33,
+       'ELSE': 173,
+       'FALSE': -33,
+       'FLOAT': -33,
+       'FLOATNUMBER': -33,
+       'FOR': -33,
+       'ID': -33,
+       'IF': -33,
+       'INT': -33,
+       'LBRACKET': -33,
+       'LIST': -33,
+       'LPAREN': -33,
+       'NOT': -33,
+       'NUMBER': -33,
+       'RBRACE': -33,
+       'RETURN': -33,
+       'STR': -33,
+       'STRING': -33,
+       'THIS': -33,
+       'TRUE': -33,
+       'VIEW': -33,
+       'VOID': -33,
+       'WHILE': -33},
+ 171: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 172: {'ANY': -29,
+       'BOOL': -29,
+       'BREAK': -29,
+       'CONTINUE': -29,
+       'FALSE': -29,
+       'FLOAT': -29,
+       'FLOATNUMBER': -29,
+       'FOR': -29,
+       'ID': -29,
+       'IF': -29,
+       'INT': -29,
+       'LBRACKET': -29,
+       'LIST': -29,
+       'LPAREN': -29,
+       'NOT': -29,
+       'NUMBER': -29,
+       'RBRACE': -29,
+       'RETURN': -29,
+       'STR': -29,
+       'STRING': -29,
+       'THIS': -29,
+       'TRUE': -29,
+       'VIEW': -29,
+       'VOID': -29,
+       'WHILE': -29},
+ 173: {'IF': 176, 'LBRACE': 175},
+ 174: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 177,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 175: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 176: {'LPAREN': 179},
+ 177: {'ANY': -28,
+       'BOOL': -28,
+       'BREAK': -28,
+       'CONTINUE': -28,
+       'FALSE': -28,
+       'FLOAT': -28,
+       'FLOATNUMBER': -28,
+       'FOR': -28,
+       'ID': -28,
+       'IF': -28,
+       'INT': -28,
+       'LBRACKET': -28,
+       'LIST': -28,
+       'LPAREN': -28,
+       'NOT': -28,
+       'NUMBER': -28,
+       'RBRACE': -28,
+       'RETURN': -28,
+       'STR': -28,
+       'STRING': -28,
+       'THIS': -28,
+       'TRUE': -28,
+       'VIEW': -28,
+       'VOID': -28,
+       'WHILE': -28},
+ 178: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 180,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 179: {'FALSE': 58,
+       'FLOATNUMBER': 61,
+       'ID': 52,
+       'LBRACKET': 55,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59},
+ 180: {'ANY': -34,
+       'BOOL': -34,
+       'BREAK': -34,
+       'CONTINUE': -34,
+       'FALSE': -34,
+       'FLOAT': -34,
+       'FLOATNUMBER': -34,
+       'FOR': -34,
+       'ID': -34,
+       'IF': -34,
+       'INT': -34,
+       'LBRACKET': -34,
+       'LIST': -34,
+       'LPAREN': -34,
+       'NOT': -34,
+       'NUMBER': -34,
+       'RBRACE': -34,
+       'RETURN': -34,
+       'STR': -34,
+       'STRING': -34,
+       'THIS': -34,
+       'TRUE': -34,
+       'VIEW': -34,
+       'VOID': -34,
+       'WHILE': -34},
+ 181: {'AND': 82,
+       'DIVIDE': 90,
+       'DOT': 81,
+       'EQEQ': 89,
+       'GT': 85,
+       'GTEQ': 86,
+       'LT': 84,
+       'LTEQ': 87,
+       'MINUS': 92,
+       'MINUSMINUS': 94,
+       'NOTEQ': 88,
+       'OR': 83,
+       'PLUS': 93,
+       'PLUSPLUS': 95,
+       'RPAREN': 182,
+       'TIMES': 91},
+ 182: {'LBRACE': 183},
+ 183: {'ANY': -18,
+       'BOOL': -18,
+       'BREAK': -18,
+       'CONTINUE': -18,
+       'FALSE': -18,
+       'FLOAT': -18,
+       'FLOATNUMBER': -18,
+       'FOR': -18,
+       'ID': -18,
+       'IF': -18,
+       'INT': -18,
+       'LBRACKET': -18,
+       'LIST': -18,
+       'LPAREN': -18,
+       'NOT': -18,
+       'NUMBER': -18,
+       'RBRACE': -18,
+       'RETURN': -18,
+       'STR': -18,
+       'STRING': -18,
+       'THIS': -18,
+       'TRUE': -18,
+       'VIEW': -18,
+       'VOID': -18,
+       'WHILE': -18},
+ 184: {'ANY': 74,
+       'BOOL': 15,
+       'BREAK': 72,
+       'CONTINUE': 71,
+       'FALSE': 58,
+       'FLOAT': 14,
+       'FLOATNUMBER': 61,
+       'FOR': 77,
+       'ID': 68,
+       'IF': 78,
+       'INT': 16,
+       'LBRACKET': 55,
+       'LIST': 75,
+       'LPAREN': 54,
+       'NOT': 63,
+       'NUMBER': 60,
+       'RBRACE': 185,
+       'RETURN': 79,
+       'STR': 13,
+       'STRING': 62,
+       'THIS': 56,
+       'TRUE': 59,
+       'VIEW': 12,
+       'VOID': 11,
+       'WHILE': 76},
+ 185: {'ANY': -33,
+       'BOOL': -33,
+       'BREAK': -33,
+       'CONTINUE': -33,
+       'ELSE': 173,
+       'FALSE': -33,
+       'FLOAT': -33,
+       'FLOATNUMBER': -33,
+       'FOR': -33,
+       'ID': -33,
+       'IF': -33,
+       'INT': -33,
+       'LBRACKET': -33,
+       'LIST': -33,
+       'LPAREN': -33,
+       'NOT': -33,
+       'NUMBER': -33,
+       'RBRACE': -33,
+       'RETURN': -33,
+       'STR': -33,
+       'STRING': -33,
+       'THIS': -33,
+       'TRUE': -33,
+       'VIEW': -33,
+       'VOID': -33,
+       'WHILE': -33},
+ 186: {'ANY': -35,
+       'BOOL': -35,
+       'BREAK': -35,
+       'CONTINUE': -35,
+       'FALSE': -35,
+       'FLOAT': -35,
+       'FLOATNUMBER': -35,
+       'FOR': -35,
+       'ID': -35,
+       'IF': -35,
+       'INT': -35,
+       'LBRACKET': -35,
+       'LIST': -35,
+       'LPAREN': -35,
+       'NOT': -35,
+       'NUMBER': -35,
+       'RBRACE': -35,
+       'RETURN': -35,
+       'STR': -35,
+       'STRING': -35,
+       'THIS': -35,
+       'TRUE': -35,
+       'VIEW': -35,
+       'VOID': -35,
+       'WHILE': -35}}
+lr_goto = {0: {'class_declaration': 6,
+     'function': 7,
+     'program': 1,
+     'top_level': 4,
+     'top_level_list': 2,
+     'type': 10,
+     'using_directive': 5,
+     'using_directive_list': 3},
+ 1: {},
+ 2: {'class_declaration': 6, 'function': 7, 'top_level': 17, 'type': 10},
+ 3: {'class_declaration': 6, 'function': 7, 'top_level': 4, 'top_level_list': 18, 'type': 10, 'using_directive': 19},
+ 4: {},
+ 5: {},
+ 6: {},
+ 7: {},
+ 8: {},
+ 9: {},
+ 10: {},
+ 11: {},
+ 12: {},
+ 13: {},
+ 14: {},
+ 15: {},
+ 16: {},
+ 17: {},
+ 18: {'class_declaration': 6, 'function': 7, 'top_level': 17, 'type': 10},
+ 19: {},
+ 20: {},
+ 21: {},
+ 22: {},
+ 23: {'class_body': 25, 'class_member': 26, 'field': 27, 'method': 28, 'type': 29},
+ 24: {'param': 32, 'param_list': 30},
+ 25: {'class_member': 38, 'field': 27, 'method': 28, 'type': 29},
+ 26: {},
+ 27: {},
+ 28: {},
+ 29: {},
+ 30: {},
+ 31: {},
+ 32: {},
+ 33: {},
+ 34: {},
+ 35: {},
+ 36: {},
+ 37: {},
+ 38: {},
+ 39: {},
+ 40: {},
+ 41: {'param': 50},
+ 42: {'statements': 51},
+ 43: {},
+ 44: {},
+ 45: {},
+ 46: {},
+ 47: {'expression': 53, 'object_creation': 57},
+ 48: {'param': 32, 'param_list': 65},
+ 49: {'statements': 66},
+ 50: {},
+ 51: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 52: {},
+ 53: {},
+ 54: {'expression': 96, 'object_creation': 57},
+ 55: {'expression': 98, 'list_elements': 97, 'object_creation': 57},
+ 56: {},
+ 57: {},
+ 58: {},
+ 59: {},
+ 60: {},
+ 61: {},
+ 62: {},
+ 63: {'expression': 99, 'object_creation': 57},
+ 64: {},
+ 65: {},
+ 66: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 67: {},
+ 68: {},
+ 69: {},
+ 70: {},
+ 71: {},
+ 72: {},
+ 73: {},
+ 74: {},
+ 75: {},
+ 76: {},
+ 77: {},
+ 78: {},
+ 79: {'expression': 111, 'object_creation': 57},
+ 80: {'args': 113, 'expression': 114, 'object_creation': 57},
+ 81: {},
+ 82: {'expression': 116, 'object_creation': 57},
+ 83: {'expression': 117, 'object_creation': 57},
+ 84: {'expression': 118, 'object_creation': 57},
+ 85: {'expression': 119, 'object_creation': 57},
+ 86: {'expression': 120, 'object_creation': 57},
+ 87: {'expression': 121, 'object_creation': 57},
+ 88: {'expression': 122, 'object_creation': 57},
+ 89: {'expression': 123, 'object_creation': 57},
+ 90: {'expression': 124, 'object_creation': 57},
+ 91: {'expression': 125, 'object_creation': 57},
+ 92: {'expression': 126, 'object_creation': 57},
+ 93: {'expression': 127, 'object_creation': 57},
+ 94: {},
+ 95: {},
+ 96: {},
+ 97: {},
+ 98: {},
+ 99: {},
+ 100: {'statements': 131},
+ 101: {},
+ 102: {},
+ 103: {},
+ 104: {'expression': 134, 'object_creation': 57},
+ 105: {'expression': 135, 'object_creation': 57},
+ 106: {},
+ 107: {'type': 137},
+ 108: {'expression': 138, 'object_creation': 57},
+ 109: {'type': 139},
+ 110: {'expression': 140, 'object_creation': 57},
+ 111: {},
+ 112: {},
+ 113: {},
+ 114: {},
+ 115: {},
+ 116: {},
+ 117: {},
+ 118: {},
+ 119: {},
+ 120: {},
+ 121: {},
+ 122: {},
+ 123: {},
+ 124: {},
+ 125: {},
+ 126: {},
+ 127: {},
+ 128: {},
+ 129: {},
+ 130: {'expression': 144, 'object_creation': 57},
+ 131: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 132: {'statements': 146},
+ 133: {'expression': 147, 'object_creation': 57},
+ 134: {},
+ 135: {},
+ 136: {},
+ 137: {},
+ 138: {},
+ 139: {},
+ 140: {},
+ 141: {},
+ 142: {'expression': 153, 'object_creation': 57},
+ 143: {'args': 155, 'expression': 114, 'object_creation': 57},
+ 144: {},
+ 145: {},
+ 146: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 147: {},
+ 148: {},
+ 149: {},
+ 150: {},
+ 151: {},
+ 152: {},
+ 153: {},
+ 154: {},
+ 155: {},
+ 156: {},
+ 157: {'expression': 163, 'object_creation': 57},
+ 158: {'expression': 164, 'object_creation': 57},
+ 159: {'statements': 165},
+ 160: {'expression': 166, 'object_creation': 57},
+ 161: {'statements': 167},
+ 162: {},
+ 163: {},
+ 164: {},
+ 165: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 166: {},
+ 167: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 168: {},
+ 169: {},
+ 170: {'elseif_chain': 172},
+ 171: {'statements': 174},
+ 172: {},
+ 173: {},
+ 174: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 175: {'statements': 178},
+ 176: {},
+ 177: {},
+ 178: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 179: {'expression': 181, 'object_creation': 57},
+ 180: {},
+ 181: {},
+ 182: {},
+ 183: {'statements': 184},
+ 184: {'expression': 73, 'object_creation': 57, 'statement': 70, 'type': 67},
+ 185: {'elseif_chain': 186},
+ 186: {}}
+defaulted_states = {11: -66, 12: -67, 13: -68, 14: -69, 15: -70, 16: -71}
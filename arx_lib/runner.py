@@ -0,0 +1,70 @@
+from .compiler import ArtemisCompiler
+from .data_classes import ArtemisData
+from .helpers import debug_print
+from .cache import ArtemisCache
+from .builder import build_shared_runtime, build_runtime_bitcode, get_c_flags, get_lto_flags, get_cache_dir
+from .externs import get_extern_registry
+
+from llvmlite import binding
+import os, sys, ctypes, shutil
+from typing import Optional
+
+is_windows : bool = os.name == 'nt'
+
+# JIT engines holding runtime code stay alive until the process exits, the runtime registers atexit handlers
+jit_engines : list[binding.ExecutionEngine] = []
+
+def flush_c_stdout() -> None:
+    libc : ctypes.CDLL = ctypes.cdll.msvcrt if is_windows else ctypes.CDLL(None)
+    libc.fflush(None)
+
+def run(file_in:str, executable_dir:str, optimization:Optional[tuple[int, int]]=None, lto:bool=False, jobs:int=1, allocator:str='libc') -> int:
+    map_paths : set[str] = set()
+    map_paths.add(os.path.join(executable_dir, 'c_map'))
+    compiler_data : ArtemisData = ArtemisData(map_paths)
+    if optimization is not None:
+        compiler_data.optimization_level, compiler_data.size_level = optimization
+        compiler_data.codegen_level = min(compiler_data.optimization_level, 3)
+    compiler_data.allocator = allocator
+    compiler_data.module_cache = ArtemisCache(os.path.join(get_cache_dir(executable_dir), 'modules'))
+    compiler_data.extern_registry = get_extern_registry(map_paths, get_cache_dir(executable_dir))
+    compiler : ArtemisCompiler = ArtemisCompiler(compiler_data)
+    module_ref : binding.ModuleRef = compiler.compile_exec(file_in)
+    object_cache : ArtemisCache = ArtemisCache(get_cache_dir(executable_dir))
+    if lto:
+        # The runtime is linked into the module, its libc calls resolve against this process
+        compiler.link_runtime(module_ref, build_runtime_bitcode(executable_dir, compiler.extern_c, get_lto_flags(compiler_data), object_cache, jobs))
+    compiler.optimize(module_ref)
+
+    if not lto:
+        gcc_path : Optional[str] = shutil.which('gcc')
+        if (not gcc_path):
+            raise EnvironmentError('Make sure (gcc) is installed and on your PATH.')
+        os.makedirs(os.path.join(executable_dir, 'build'), exist_ok=True)
+        runtime_path : str = build_shared_runtime(gcc_path, executable_dir, compiler.extern_c, get_c_flags(compiler_data), object_cache)
+        binding.load_library_permanently(runtime_path)
+    object_cache.save_stats()
+    compiler_data.module_cache.save_stats()
+
+    jit_target_machine : binding.TargetMachine = compiler.target.create_target_machine(
+        opt=compiler_data.codegen_level,
+        codemodel='jitdefault'
+    )
+    engine : binding.ExecutionEngine = binding.create_mcjit_compiler(module_ref, jit_target_machine)
+    engine.finalize_object()
+    jit_engines.append(engine)
+    engine.run_static_constructors()
+    exec_address : int = engine.get_function_address('_exec')
+    if not exec_address:
+        raise RuntimeError(f'No (_exec) function in [ {file_in} ]')
+    debug_print(f'[jit] (_exec) at {hex(exec_address)}')
+
+    sys.stdout.flush()
+    exec_function = ctypes.CFUNCTYPE(ctypes.c_int32)(exec_address)
+    return_code : int = exec_function()
+    # io keeps its own output buffer, from the module with (--lto) or from the shared runtime
+    flush_address : int = engine.get_function_address('io_flush') or binding.address_of_symbol('io_flush') or 0
+    if flush_address:
+        ctypes.CFUNCTYPE(None)(flush_address)()
+    flush_c_stdout()
+    return return_code
@@ -0,0 +1,43 @@
+from .helpers import debug_print
+
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+@dataclass
+class BuildJob:
+    name:str
+    action:Callable[[], Optional[str]]
+    dependencies:list[str] = field(default_factory=list)
+    label:Optional[str] = None
+
+def run_jobs(jobs:list[BuildJob], max_workers:int) -> None:
+    # Runs each job once all of its dependencies finished, at most max_workers at a time.
+    # Jobs with a label count as progress steps, the action may return a suffix for its line.
+    pending : dict[str, BuildJob] = {job.name: job for job in jobs}
+    finished_jobs : set[str] = set()
+    total_steps : int = sum(1 for job in jobs if job.label)
+    step : int = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        running : dict[Future, BuildJob] = {}
+        while pending or running:
+            ready : list[BuildJob] = [job for job in pending.values() if all(dep in finished_jobs for dep in job.dependencies)]
+            for job in ready:
+                debug_print(f'[job] (start) {job.name}')
+                running[executor.submit(job.action)] = job
+                del pending[job.name]
+            if not running:
+                raise RuntimeError(f'Unresolvable build dependencies for {sorted(pending)}')
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job : BuildJob = running.pop(future)
+                try:
+                    suffix : Optional[str] = future.result()
+                except BaseException:
+                    for other in running:
+                        other.cancel()
+                    raise
+                finished_jobs.add(job.name)
+                if job.label:
+                    step += 1
+                    print(f'[ {step}/{total_steps} ] {job.label}' + (f' {suffix}' if suffix else ''))
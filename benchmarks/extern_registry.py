@@ -0,0 +1,31 @@
+# Extern registry load time for generated map directories with many entries
+# Usage: python benchmarks/extern_registry.py [modules] [entries_per_module]
+import os, sys, time, tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from arx_lib.externs import ArtemisExternRegistry
+
+def write_maps(map_dir: str, modules: int, entries: int) -> None:
+    for m in range(modules):
+        lines : list[str] = ['[meta]', 'type = c_lib', f'name = bench{m}', f'file = bench{m}.c', '[functions]']
+        lines += [f'function_{i}:int,str = bench{m}_function_{i} > int' for i in range(entries)]
+        with open(os.path.join(map_dir, f'bench{m}.map'), 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+def time_registry(map_dir: str, cache_path: str) -> float:
+    start : float = time.perf_counter()
+    ArtemisExternRegistry({map_dir}, cache_path)
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    modules : int = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    entries : int = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        map_dir : str = os.path.join(temporary_dir, 'c_map')
+        os.makedirs(map_dir)
+        write_maps(map_dir, modules, entries)
+        cache_path : str = os.path.join(temporary_dir, 'externs.json')
+        print(f'{modules} maps, {modules * entries} entries')
+        print(f'  parse (no cache) {time_registry(map_dir, None) * 1000:>8.2f} ms')
+        print(f'  parse + save     {time_registry(map_dir, cache_path) * 1000:>8.2f} ms')
+        print(f'  cached           {time_registry(map_dir, cache_path) * 1000:>8.2f} ms')
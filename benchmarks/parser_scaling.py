@@ -0,0 +1,53 @@
+# Parse time for generated sources of growing size, the time per element should stay flat
+# Usage: python benchmarks/parser_scaling.py [max_size]
+import os, sys, time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from arx_lib.lexer import ArtemisLexer
+from arx_lib.parser import ArtemisParser
+from typing import Callable
+
+def long_function(size: int) -> str:
+    statements : str = '\n'.join(f'    int v{i} = {i} + 1' for i in range(size))
+    return f'int _exec() {{\n{statements}\n    return 0\n}}\n'
+
+def long_list(size: int) -> str:
+    elements : str = ', '.join(str(i) for i in range(size))
+    return f'int _exec() {{\n    list:int x = [{elements}]\n    return 0\n}}\n'
+
+def long_call(size: int) -> str:
+    arguments : str = ', '.join(str(i) for i in range(size))
+    return f'int _exec() {{\n    f({arguments})\n    return 0\n}}\n'
+
+def long_class(size: int) -> str:
+    fields : str = '\n'.join(f'    int f{i} = {i}' for i in range(size))
+    return f'class Big {{\n{fields}\n}}\n'
+
+def many_functions(size: int) -> str:
+    return '\n'.join(f'int f{i}(int a, int b) {{\n    return a\n}}' for i in range(size)) + '\n'
+
+def time_parse(source: str) -> float:
+    tokens : list = list(ArtemisLexer().tokenize(source))
+    start : float = time.perf_counter()
+    ast = ArtemisParser(source).parse(iter(tokens))
+    elapsed : float = time.perf_counter() - start
+    if not ast:
+        raise RuntimeError('Parsing failed')
+    return elapsed
+
+if __name__ == '__main__':
+    max_size : int = int(sys.argv[1]) if len(sys.argv) > 1 else 32000
+    generators : dict[str, Callable[[int], str]] = {
+        'statements': long_function,
+        'list_elements': long_list,
+        'args': long_call,
+        'class_body': long_class,
+        'top_level': many_functions,
+    }
+    for name, generator in generators.items():
+        print(f'[{name}]')
+        size : int = 1000
+        while size <= max_size:
+            elapsed : float = time_parse(generator(size))
+            print(f'  {size:>8} elements {elapsed * 1000:>10.1f} ms {elapsed / size * 1e6:>8.2f} us/element')
+            size *= 2
@@ -0,0 +1,292 @@
+// alloc.c
+#include "alloc.h"
+#include "core.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdbool.h>
+#include <limits.h>
+
+// Every block starts with a 16 byte header so free and realloc know the size, user pointers stay 16 byte aligned
+typedef struct {
+    size_t size;
+    size_t size_class;
+} ArxBlockHeader;
+
+#define ARX_HEADER_SIZE sizeof(ArxBlockHeader)
+#define ARX_ALIGN(n) (((n) + 15) & ~(size_t)15)
+#define ARX_LARGE ((size_t)-1)
+
+typedef struct ArxChunk {
+    struct ArxChunk* next;
+    size_t capacity;
+    size_t used;
+    size_t padding;
+} ArxChunk;
+
+static ArxAllocStats stats = {0};
+static ArxChunk* chunks = NULL;
+static bool initialized = false;
+
+static void* out_of_memory(size_t size) {
+    fprintf(stderr, "Out of memory allocating %zu bytes\n", size);
+    exit(1);
+}
+
+static void count_alloc(size_t size) {
+    stats.allocations++;
+    stats.bytes_allocated += size;
+    stats.bytes_in_use += size;
+    if (stats.bytes_in_use > stats.peak_bytes) stats.peak_bytes = stats.bytes_in_use;
+}
+
+static void count_free(size_t size) {
+    stats.frees++;
+    stats.bytes_in_use -= size;
+}
+
+static void release_chunks(void) {
+    while (chunks) {
+        ArxChunk* next = chunks->next;
+        free(chunks);
+        chunks = next;
+    }
+}
+
+static void alloc_exit(void) {
+    if (getenv("ARX_ALLOC_STATS")) {
+        fprintf(stderr, "[alloc] (%s) %lld allocations, %lld frees, %lld bytes, %lld peak\n",
+            alloc_backend(), (long long)stats.allocations, (long long)stats.frees,
+            (long long)stats.bytes_allocated, (long long)stats.peak_bytes);
+    }
+    release_chunks();
+}
+
+static void alloc_init(void) {
+    initialized = true;
+    atexit(alloc_exit);
+}
+
+#if defined(ARX_ALLOC_SLAB) || defined(ARX_ALLOC_ARENA)
+static ArxChunk* new_chunk(size_t capacity) {
+    ArxChunk* chunk = malloc(sizeof(ArxChunk) + capacity);
+    if (!chunk) out_of_memory(capacity);
+    chunk->capacity = capacity;
+    chunk->used = 0;
+    chunk->next = chunks;
+    chunks = chunk;
+    return chunk;
+}
+
+static inline char* chunk_data(ArxChunk* chunk) {
+    return (char*)chunk + sizeof(ArxChunk);
+}
+#endif
+
+#if !defined(ARX_ALLOC_ARENA)
+static ArxBlockHeader* large_alloc(size_t size) {
+    ArxBlockHeader* header = malloc(ARX_HEADER_SIZE + size);
+    if (!header) out_of_memory(size);
+    header->size_class = ARX_LARGE;
+    return header;
+}
+#endif
+
+#if defined(ARX_ALLOC_SLAB)
+
+// Size classes by block size (header included), small blocks are carved from 64KB slabs and recycled through free lists
+#define ARX_SLAB_CHUNK (64 * 1024)
+#define ARX_SLAB_CLASSES 7
+static const size_t slab_sizes[ARX_SLAB_CLASSES] = {32, 48, 64, 128, 256, 512, 1024};
+
+typedef struct ArxFreeBlock {
+    struct ArxFreeBlock* next;
+} ArxFreeBlock;
+
+static ArxFreeBlock* free_lists[ARX_SLAB_CLASSES] = {0};
+static ArxChunk* slabs[ARX_SLAB_CLASSES] = {0};
+
+static inline size_t size_class_of(size_t block_size) {
+    for (size_t i = 0; i < ARX_SLAB_CLASSES; i++) {
+        if (block_size <= slab_sizes[i]) return i;
+    }
+    return ARX_LARGE;
+}
+
+static ArxBlockHeader* backend_alloc(size_t size) {
+    size_t size_class = size_class_of(ARX_HEADER_SIZE + size);
+    if (size_class == ARX_LARGE) return large_alloc(size);
+
+    ArxBlockHeader* header;
+    if (free_lists[size_class]) {
+        header = (ArxBlockHeader*)free_lists[size_class];
+        free_lists[size_class] = free_lists[size_class]->next;
+    } else {
+        size_t block_size = slab_sizes[size_class];
+        ArxChunk* slab = slabs[size_class];
+        if (!slab || slab->used + block_size > slab->capacity) {
+            slab = slabs[size_class] = new_chunk(ARX_SLAB_CHUNK);
+        }
+        header = (ArxBlockHeader*)(chunk_data(slab) + slab->used);
+        slab->used += block_size;
+    }
+    header->size_class = size_class;
+    return header;
+}
+
+static void backend_free(ArxBlockHeader* header) {
+    if (header->size_class == ARX_LARGE) {
+        free(header);
+        return;
+    }
+    ArxFreeBlock* block = (ArxFreeBlock*)header;
+    block->next = free_lists[header->size_class];
+    free_lists[header->size_class] = block;
+}
+
+static ArxBlockHeader* backend_realloc(ArxBlockHeader* header, size_t size) {
+    if (header->size_class == ARX_LARGE) {
+        if (size_class_of(ARX_HEADER_SIZE + size) == ARX_LARGE) {
+            ArxBlockHeader* grown = realloc(header, ARX_HEADER_SIZE + size);
+            if (!grown) out_of_memory(size);
+            return grown;
+        }
+    } else if (ARX_HEADER_SIZE + size <= slab_sizes[header->size_class]) {
+        return header;
+    }
+    ArxBlockHeader* moved = backend_alloc(size);
+    memcpy(moved + 1, header + 1, header->size < size ? header->size : size);
+    backend_free(header);
+    return moved;
+}
+
+#define ARX_BACKEND_NAME "slab"
+
+#elif defined(ARX_ALLOC_ARENA)
+
+// Bump allocation from 1MB chunks, nothing is freed before exit except the tail block growing in place
+#define ARX_ARENA_CHUNK (1024 * 1024)
+
+static ArxChunk* arena = NULL;
+static ArxBlockHeader* last_block = NULL;
+
+static ArxBlockHeader* backend_alloc(size_t size) {
+    size_t block_size = ARX_HEADER_SIZE + ARX_ALIGN(size);
+    if (!arena || arena->used + block_size > arena->capacity) {
+        if (block_size > ARX_ARENA_CHUNK / 4) {
+            // Big blocks get their own chunk, the current one keeps its free space
+            ArxChunk* chunk = new_chunk(block_size);
+            chunk->used = block_size;
+            ArxBlockHeader* header = (ArxBlockHeader*)chunk_data(chunk);
+            header->size_class = ARX_LARGE;
+            return header;
+        }
+        arena = new_chunk(ARX_ARENA_CHUNK);
+    }
+    ArxBlockHeader* header = (ArxBlockHeader*)(chunk_data(arena) + arena->used);
+    arena->used += block_size;
+    header->size_class = 0;
+    last_block = header;
+    return header;
+}
+
+static void backend_free(ArxBlockHeader* header) {
+    (void)header;
+}
+
+static ArxBlockHeader* backend_realloc(ArxBlockHeader* header, size_t size) {
+    size_t old_block = ARX_HEADER_SIZE + ARX_ALIGN(header->size);
+    size_t new_block = ARX_HEADER_SIZE + ARX_ALIGN(size);
+    if (new_block <= old_block) return header;
+    if (header == last_block && arena->used - old_block + new_block <= arena->capacity) {
+        arena->used += new_block - old_block;
+        return header;
+    }
+    ArxBlockHeader* moved = backend_alloc(size);
+    memcpy(moved + 1, header + 1, header->size);
+    return moved;
+}
+
+#define ARX_BACKEND_NAME "arena"
+
+#else
+
+static ArxBlockHeader* backend_alloc(size_t size) {
+    return large_alloc(size);
+}
+
+static void backend_free(ArxBlockHeader* header) {
+    free(header);
+}
+
+static ArxBlockHeader* backend_realloc(ArxBlockHeader* header, size_t size) {
+    ArxBlockHeader* grown = realloc(header, ARX_HEADER_SIZE + size);
+    if (!grown) out_of_memory(size);
+    return grown;
+}
+
+#define ARX_BACKEND_NAME "libc"
+
+#endif
+
+// Returned to ARX as a (str), so it carries the string length header
+static const struct {
+    ArxStringHeader header;
+    char name[sizeof(ARX_BACKEND_NAME)];
+} backend_name = {{sizeof(ARX_BACKEND_NAME) - 1}, ARX_BACKEND_NAME};
+
+const char* alloc_backend(void) {
+    return backend_name.name;
+}
+
+void* arx_alloc(size_t size) {
+    if (!initialized) alloc_init();
+    ArxBlockHeader* header = backend_alloc(size);
+    header->size = size;
+    count_alloc(size);
+    return header + 1;
+}
+
+void* arx_realloc(void* ptr, size_t size) {
+    if (!ptr) return arx_alloc(size);
+    ArxBlockHeader* header = (ArxBlockHeader*)ptr - 1;
+    size_t old_size = header->size;
+    header = backend_realloc(header, size);
+    header->size = size;
+    stats.bytes_in_use += (int64_t)size - (int64_t)old_size;
+    if (size > old_size) stats.bytes_allocated += size - old_size;
+    if (stats.bytes_in_use > stats.peak_bytes) stats.peak_bytes = stats.bytes_in_use;
+    return header + 1;
+}
+
+void arx_free(void* ptr) {
+    if (!ptr) return;
+    ArxBlockHeader* header = (ArxBlockHeader*)ptr - 1;
+    count_free(header->size);
+    backend_free(header);
+}
+
+char* arx_strndup(const char* src, size_t len) {
+    char* result = arx_alloc(len + 1);
+    memcpy(result, src, len);
+    result[len] = '\0';
+    return result;
+}
+
+char* arx_strdup(const char* src) {
+    return arx_strndup(src, strlen(src));
+}
+
+const ArxAllocStats* arx_alloc_stats(void) {
+    return &stats;
+}
+
+static int clamp_int(int64_t value) {
+    return value > INT_MAX ? INT_MAX : (int)value;
+}
+
+int alloc_count(void) { return clamp_int(stats.allocations); }
+int alloc_frees(void) { return clamp_int(stats.frees); }
+int alloc_bytes(void) { return clamp_int(stats.bytes_allocated); }
+int alloc_live_bytes(void) { return clamp_int(stats.bytes_in_use); }
+int alloc_peak_bytes(void) { return clamp_int(stats.peak_bytes); }
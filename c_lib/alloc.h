@@ -0,0 +1,37 @@
+// alloc.h
+#ifndef ALLOC_H
+#define ALLOC_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+// Every runtime and compiler-emitted allocation goes through these.
+// The backend is picked when the runtime is compiled (arx build --alloc=libc|slab|arena):
+//   (default)        libc malloc / realloc / free
+//   ARX_ALLOC_SLAB   size-class slabs with free lists for small blocks, libc for the rest
+//   ARX_ALLOC_ARENA  bump allocation from large chunks, free is a no-op, chunks are released at exit
+// The runtime is single threaded, the allocator takes no locks.
+
+typedef struct {
+    int64_t allocations;
+    int64_t frees;
+    int64_t bytes_allocated;
+    int64_t bytes_in_use;
+    int64_t peak_bytes;
+} ArxAllocStats;
+
+void* arx_alloc(size_t size);
+void* arx_realloc(void* ptr, size_t size);
+void  arx_free(void* ptr);
+char* arx_strdup(const char* src);
+char* arx_strndup(const char* src, size_t len);
+
+const ArxAllocStats* arx_alloc_stats(void);
+const char* alloc_backend(void);
+int alloc_count(void);
+int alloc_frees(void);
+int alloc_bytes(void);
+int alloc_live_bytes(void);
+int alloc_peak_bytes(void);
+
+#endif
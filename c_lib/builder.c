@@ -0,0 +1,81 @@
+// builder.c
+#include "builder.h"
+#include "core.h"
+#include "alloc.h"
+#include <stdio.h>
+#include <string.h>
+
+StringBuilder* builder_create_capacity(int capacity) {
+    StringBuilder* sb = arx_alloc(sizeof(StringBuilder));
+    sb->capacity = capacity > 16 ? capacity : 16;
+    sb->length = 0;
+    sb->data = arx_alloc(sb->capacity + 1);
+    sb->data[0] = '\0';
+    return sb;
+}
+
+StringBuilder* builder_create(void) {
+    return builder_create_capacity(64);
+}
+
+void builder_reserve(StringBuilder* sb, int64_t extra) {
+    int64_t needed = sb->length + extra;
+    if (needed <= sb->capacity) return;
+    int64_t capacity = sb->capacity * 2;
+    while (capacity < needed) capacity *= 2;
+    sb->data = arx_realloc(sb->data, capacity + 1);
+    sb->capacity = capacity;
+}
+
+void builder_append_str(StringBuilder* sb, const char* s) {
+    if (!sb) return;
+    int64_t len = core_string_length(s);
+    builder_reserve(sb, len);
+    memcpy(sb->data + sb->length, s, len);
+    sb->length += len;
+    sb->data[sb->length] = '\0';
+}
+
+void builder_append_int(StringBuilder* sb, int value) {
+    if (!sb) return;
+    // -2147483648 is the longest int
+    builder_reserve(sb, 11);
+    sb->length += snprintf(sb->data + sb->length, 12, "%d", value);
+}
+
+void builder_append_float(StringBuilder* sb, float value) {
+    if (!sb) return;
+    // Same format as io.print, FLT_MAX takes 46 characters
+    builder_reserve(sb, 48);
+    sb->length += snprintf(sb->data + sb->length, 49, "%f", value);
+}
+
+void builder_append_bool(StringBuilder* sb, bool value) {
+    if (!sb) return;
+    const char* text = value ? "true" : "false";
+    int64_t len = value ? 4 : 5;
+    builder_reserve(sb, len);
+    memcpy(sb->data + sb->length, text, len + 1);
+    sb->length += len;
+}
+
+int builder_length(StringBuilder* sb) {
+    return sb ? (int)sb->length : 0;
+}
+
+void builder_clear(StringBuilder* sb) {
+    if (!sb) return;
+    sb->length = 0;
+    sb->data[0] = '\0';
+}
+
+char* builder_to_string(StringBuilder* sb) {
+    if (!sb) return core_string_from("", 0);
+    return core_string_from(sb->data, sb->length);
+}
+
+void builder_free(StringBuilder* sb) {
+    if (!sb) return;
+    arx_free(sb->data);
+    arx_free(sb);
+}
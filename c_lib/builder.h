@@ -0,0 +1,27 @@
+// builder.h
+#ifndef BUILDER_H
+#define BUILDER_H
+
+#include <stdbool.h>
+#include <stdint.h>
+
+// Growable buffer for building strings piece by piece, capacity doubles so appends are amortized O(1)
+typedef struct {
+    char* data;
+    int64_t length;
+    int64_t capacity;
+} StringBuilder;
+
+StringBuilder* builder_create(void);
+StringBuilder* builder_create_capacity(int capacity);
+void builder_reserve(StringBuilder* sb, int64_t extra);
+void builder_append_str(StringBuilder* sb, const char* s);
+void builder_append_int(StringBuilder* sb, int value);
+void builder_append_float(StringBuilder* sb, float value);
+void builder_append_bool(StringBuilder* sb, bool value);
+int builder_length(StringBuilder* sb);
+void builder_clear(StringBuilder* sb);
+char* builder_to_string(StringBuilder* sb);
+void builder_free(StringBuilder* sb);
+
+#endif
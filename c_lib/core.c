@@ -1,38 +1,88 @@
 // core.c
 #include "core.h"
+#include "alloc.h"
 #include <string.h>
 #include <stdio.h>
 #include <stdlib.h>
 
+char* core_string_alloc(int64_t length) {
+    ArxStringHeader* header = arx_alloc(sizeof(ArxStringHeader) + length + 1);
+    header->length = length;
+    char* result = (char*)(header + 1);
+    result[length] = '\0';
+    return result;
+}
+
+char* core_string_from(const char* data, int64_t length) {
+    char* result = core_string_alloc(length);
+    memcpy(result, data, length);
+    return result;
+}
+
+char* core_string_resize(char* s, int64_t length) {
+    // Grows or shrinks a string from core_string_alloc, the characters that fit are kept
+    ArxStringHeader* header = arx_realloc((ArxStringHeader*)s - 1, sizeof(ArxStringHeader) + length + 1);
+    header->length = length;
+    char* result = (char*)(header + 1);
+    result[length] = '\0';
+    return result;
+}
+
+void core_string_free(char* s) {
+    if (s) arx_free((ArxStringHeader*)s - 1);
+}
+
+int64_t core_string_find(const char* src, int64_t src_length, int64_t from, const char* needle, int64_t needle_length) {
+    // Index of needle in src at or after from, -1 if missing
+    if (needle_length == 0) return from <= src_length ? from : -1;
+    int64_t last = src_length - needle_length;
+    while (from <= last) {
+        const char* hit = memchr(src + from, needle[0], last - from + 1);
+        if (!hit) return -1;
+        from = hit - src;
+        if (memcmp(hit, needle, needle_length) == 0) return from;
+        from++;
+    }
+    return -1;
+}
+
+int core_string_len(const char* s) {
+    return (int)core_string_length(s);
+}
+
 char* core_string_concat(const char* a, const char* b) {
-    size_t len = strlen(a) + strlen(b) + 1;
-    char* result = malloc(len);
-    if (!result) return NULL;
-    strcpy(result, a);
-    strcat(result, b);
+    int64_t len_a = core_string_length(a);
+    int64_t len_b = core_string_length(b);
+    char* result = core_string_alloc(len_a + len_b);
+    memcpy(result, a, len_a);
+    memcpy(result + len_a, b, len_b);
     return result;
 }
 
-List* core_list_create(int64_t element_size, bool is_pointer) {
-    List* list = malloc(sizeof(List));
+List* core_list_create_capacity(int64_t element_size, bool is_pointer, int capacity) {
+    List* list = arx_alloc(sizeof(List));
     if (!list) return NULL;
 
-    list->capacity = 8;
+    list->capacity = capacity > 8 ? capacity : 8;
     list->length = 0;
     list->element_size = element_size;
     list->is_pointer = is_pointer;
-    list->data = malloc(element_size * list->capacity);
+    list->data = arx_alloc(element_size * list->capacity);
 
     if (!list->data) {
-        free(list);
+        arx_free(list);
         return NULL;
     }
 
     return list;
 }
 
+List* core_list_create(int64_t element_size, bool is_pointer) {
+    return core_list_create_capacity(element_size, is_pointer, 8);
+}
+
 List* core_list_create_from(void* data, int len, int64_t element_size, bool is_pointer) {
-    List* list = malloc(sizeof(List));
+    List* list = arx_alloc(sizeof(List));
     if (!list) return NULL;
 
     list->length = len;
@@ -40,9 +90,9 @@ List* core_list_create_from(void* data, int len, int64_t element_size, bool is_p
     list->element_size = element_size;
     list->is_pointer = is_pointer;
 
-    list->data = malloc(len * element_size);
+    list->data = arx_alloc(len * element_size);
     if (!list->data) {
-        free(list);
+        arx_free(list);
         return NULL;
     }
 
@@ -50,21 +100,87 @@ List* core_list_create_from(void* data, int len, int64_t element_size, bool is_p
     return list;
 }
 
-void core_list_append(List* list, void* value) {
-    if (!list) return;
+List* core_list_wrap(const void* data, int len, int64_t element_size, bool is_pointer) {
+    // Only the header is allocated, data (a constant list literal) is shared until the list is changed
+    List* list = arx_alloc(sizeof(List));
+    list->data = (void*)data;
+    list->length = len;
+    list->capacity = 0;
+    list->element_size = element_size;
+    list->is_pointer = is_pointer;
+    return list;
+}
+
+void core_list_own(List* list) {
+    // Copies borrowed data into a buffer of the list's own, anything that writes list->data calls this first
+    if (!list || list->capacity >= list->length) return;
+    int capacity = list->length > 8 ? list->length : 8;
+    void* data = arx_alloc(list->element_size * capacity);
+    memcpy(data, list->data, list->element_size * list->length);
+    list->data = data;
+    list->capacity = capacity;
+}
 
+static void core_list_reserve_one(List* list) {
+    core_list_own(list);
     if (list->length >= list->capacity) {
-        list->capacity *= 2;
-        void* new_data = realloc(list->data, list->element_size * list->capacity);
-        if (!new_data) return;
-        list->data = new_data;
+        list->capacity = list->capacity > 0 ? list->capacity * 2 : 8;
+        list->data = arx_realloc(list->data, list->element_size * list->capacity);
     }
+}
+
+void core_list_append(List* list, void* value) {
+    if (!list) return;
+    core_list_reserve_one(list);
 
     void* dest = (char*)list->data + list->length * list->element_size;
     memcpy(dest, value, list->element_size);
     list->length++;
 }
 
+// Typed appends and gets for list:int, list:float and list:string, the element is stored or read directly
+
+void core_list_append_int(List* list, int value) {
+    if (!list) return;
+    core_list_reserve_one(list);
+    ((int*)list->data)[list->length++] = value;
+}
+
+void core_list_append_float(List* list, float value) {
+    if (!list) return;
+    core_list_reserve_one(list);
+    ((float*)list->data)[list->length++] = value;
+}
+
+void core_list_append_str(List* list, const char* value) {
+    if (!list) return;
+    core_list_reserve_one(list);
+    ((const char**)list->data)[list->length++] = value;
+}
+
+static void check_index(List* list, int index) {
+    int length = core_list_len(list);
+    if (index < 0 || index >= length) {
+        fprintf(stderr, "List index out of range: %d (length %d)\n", index, length);
+        exit(1);
+    }
+}
+
+int core_list_get_int(List* list, int index) {
+    check_index(list, index);
+    return ((int*)list->data)[index];
+}
+
+float core_list_get_float(List* list, int index) {
+    check_index(list, index);
+    return ((float*)list->data)[index];
+}
+
+const char* core_list_get_str(List* list, int index) {
+    check_index(list, index);
+    return ((const char**)list->data)[index];
+}
+
 int core_list_len(List* list) {
     return list ? list->length : 0;
 }
@@ -79,11 +195,40 @@ void* core_list_get(List* list, int index) {
 
 void core_list_free(List* list) {
     if (!list) return;
-    free(list->data);
-    free(list);
+    if (list->capacity >= list->length) arx_free(list->data);
+    arx_free(list);
 }
 bool core_string_equal(const char* a, const char* b) {
-    return strcmp(a, b) == 0;
+    int64_t len = core_string_length(a);
+    return len == core_string_length(b) && memcmp(a, b, len) == 0;
+}
+
+StringView* core_view_create(const char* data, int64_t length) {
+    // Only the (data, length) pair is allocated, through the runtime allocator so (--alloc=slab|arena) pool it.
+    // Views in a list:view are stored by value in the list data and never come through here.
+    StringView* view = arx_alloc(sizeof(StringView));
+    view->data = data;
+    view->length = length;
+    return view;
+}
+
+char* core_view_to_string(const StringView* view) {
+    // The one place a view is copied, when it is used as a (str)
+    return view ? core_string_from(view->data, view->length) : core_string_from("", 0);
+}
+
+int core_view_len(const StringView* view) {
+    return view ? (int)view->length : 0;
+}
+
+bool core_view_equal(const StringView* a, const StringView* b) {
+    int64_t len = a ? a->length : 0;
+    return len == (b ? b->length : 0) && (len == 0 || memcmp(a->data, b->data, len) == 0);
+}
+
+bool core_view_equal_str(const StringView* a, const char* b) {
+    int64_t len = a ? a->length : 0;
+    return len == core_string_length(b) && (len == 0 || memcmp(a->data, b, len) == 0);
 }
 
 List* core_list_slice(List* self, int start, int end) {
@@ -93,11 +238,11 @@ List* core_list_slice(List* self, int start, int end) {
     }
 
     int slice_len = end - start;
-    List* result = malloc(sizeof(List));
+    List* result = arx_alloc(sizeof(List));
     result->length = slice_len;
     result->capacity = slice_len;
     result->element_size = self->element_size;
-    result->data = malloc(slice_len * self->element_size);
+    result->data = arx_alloc(slice_len * self->element_size);
 
     void* src_ptr = (char*)self->data + (start * self->element_size);
     memcpy(result->data, src_ptr, slice_len * self->element_size);
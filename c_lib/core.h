@@ -6,6 +6,7 @@
 #include <stddef.h>
 #include <stdint.h>
 
+// capacity below length means data is borrowed (core_list_wrap), it is copied before the list first changes
 typedef struct {
     void* data;
     int length;
@@ -14,12 +15,49 @@ typedef struct {
     bool is_pointer;
 } List;
 
+// Strings stay NUL-terminated char* for C, with their length stored right before the characters.
+// Literals get the same layout from the compiler (get_string_literal), so every (str) value has it.
+typedef struct {
+    int64_t length;
+} ArxStringHeader;
+
+static inline int64_t core_string_length(const char* s) {
+    return s ? ((const ArxStringHeader*)s - 1)->length : 0;
+}
+
+// A read-only slice of a string, the characters are not copied and not NUL-terminated.
+// ARX sees it as (view), a (str) is only made from one by core_view_to_string.
+typedef struct {
+    const char* data;
+    int64_t length;
+} StringView;
+
+char* core_string_alloc(int64_t length);
+char* core_string_from(const char* data, int64_t length);
+char* core_string_resize(char* s, int64_t length);
+void core_string_free(char* s);
+int64_t core_string_find(const char* src, int64_t src_length, int64_t from, const char* needle, int64_t needle_length);
+int core_string_len(const char* s);
 char* core_string_concat(const char* a, const char* b);
 List* core_list_create(int64_t element_size, bool is_pointer);
+List* core_list_create_capacity(int64_t element_size, bool is_pointer, int capacity);
 List* core_list_create_from(void* data, int len, int64_t element_size, bool is_pointer);
+List* core_list_wrap(const void* data, int len, int64_t element_size, bool is_pointer);
+void core_list_own(List* list);
 void core_list_append(List* list, void* value);
+void core_list_append_int(List* list, int value);
+void core_list_append_float(List* list, float value);
+void core_list_append_str(List* list, const char* value);
+int core_list_get_int(List* list, int index);
+float core_list_get_float(List* list, int index);
+const char* core_list_get_str(List* list, int index);
 int core_list_len(List* list);
 void* core_list_get(List* list, int index);
 bool core_string_equal(const char* a, const char* b);
+StringView* core_view_create(const char* data, int64_t length);
+char* core_view_to_string(const StringView* view);
+int core_view_len(const StringView* view);
+bool core_view_equal(const StringView* a, const StringView* b);
+bool core_view_equal_str(const StringView* a, const char* b);
 
 #endif
@@ -0,0 +1,164 @@
+// fs.c
+#include "core.h"
+#include "alloc.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdbool.h>
+#include <fcntl.h>
+#include <sys/stat.h>
+#ifdef _WIN32
+#include <io.h>
+#define open _open
+#define read _read
+#define write _write
+#define close _close
+#define FS_BINARY _O_BINARY
+#else
+#include <unistd.h>
+#include <sys/mman.h>
+#define FS_BINARY 0
+#endif
+
+static int open_for_reading(const char* path) {
+    int fd = open(path, O_RDONLY | FS_BINARY);
+    if (fd < 0) {
+        fprintf(stderr, "Could not open file: %s\n", path);
+        exit(1);
+    }
+    return fd;
+}
+
+static char* read_fully(int fd, int64_t size) {
+    char* result = core_string_alloc(size);
+    int64_t done = 0;
+    while (done < size) {
+        long count = read(fd, result + done, size - done > (1 << 30) ? (1 << 30) : size - done);
+        if (count <= 0) break;
+        done += count;
+    }
+    return done == size ? result : core_string_resize(result, done);
+}
+
+#ifndef _WIN32
+static size_t mapped_size(int64_t size) {
+    // One page for the length header, then the file and at least one zero byte for the terminator
+    size_t page = sysconf(_SC_PAGESIZE);
+    return page + ((size + 1 + page - 1) / page) * page;
+}
+#endif
+
+char* fs_read_file(const char* path) {
+    // On POSIX the file is mapped, not copied, right after the page holding its length header.
+    // The string lives until the program exits and must not be handed to core_string_free.
+    int fd = open_for_reading(path);
+    struct stat info;
+    int64_t size = fstat(fd, &info) == 0 ? info.st_size : 0;
+    if (size == 0) {
+        close(fd);
+        return core_string_from("", 0);
+    }
+#ifndef _WIN32
+    size_t page = sysconf(_SC_PAGESIZE);
+    char* region = mmap(NULL, mapped_size(size), PROT_READ | PROT_WRITE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0);
+    if (region != MAP_FAILED) {
+        char* data = mmap(region + page, size, PROT_READ, MAP_PRIVATE | MAP_FIXED, fd, 0);
+        if (data != MAP_FAILED) {
+            close(fd);
+            ((ArxStringHeader*)data - 1)->length = size;
+            return data;
+        }
+        munmap(region, mapped_size(size));
+    }
+#endif
+    char* result = read_fully(fd, size);
+    close(fd);
+    return result;
+}
+
+static void release_file(char* data) {
+#ifndef _WIN32
+    // Mapped files start on a page boundary, allocated strings never do as they follow an 8 byte header
+    size_t page = sysconf(_SC_PAGESIZE);
+    if (((size_t)data % page) == 0 && munmap(data - page, mapped_size(core_string_length(data))) == 0) return;
+#endif
+    core_string_free(data);
+}
+
+List* fs_lines(const char* path) {
+    // Every line, without (\n) or (\r\n), packed one after the other in a single block
+    char* data = fs_read_file(path);
+    int64_t size = core_string_length(data);
+    const char* end = data + size;
+
+    int count = 0;
+    for (const char* p = data; p < end; count++) {
+        const char* newline = memchr(p, '\n', end - p);
+        p = newline ? newline + 1 : end;
+    }
+
+    List* lines = core_list_create_capacity(sizeof(char*), true, count);
+    // Each header starts on its own alignment boundary, the block has room for the padding of every line
+    const uintptr_t align = _Alignof(ArxStringHeader);
+    char* block = arx_alloc(size + (int64_t)count * (sizeof(ArxStringHeader) + 1 + align - 1));
+    char** items = lines->data;
+    for (const char* p = data; p < end; lines->length++) {
+        const char* newline = memchr(p, '\n', end - p);
+        const char* line_end = newline ? newline : end;
+        int64_t length = line_end - p;
+        if (length > 0 && p[length - 1] == '\r') length--;
+        block = (char*)(((uintptr_t)block + align - 1) & ~(align - 1));
+        ((ArxStringHeader*)block)->length = length;
+        char* line = block + sizeof(ArxStringHeader);
+        memcpy(line, p, length);
+        line[length] = '\0';
+        items[lines->length] = line;
+        block = line + length + 1;
+        p = newline ? newline + 1 : end;
+    }
+    release_file(data);
+    return lines;
+}
+
+List* fs_line_views(const char* path) {
+    // Every line as a view into the file contents, which stay loaded (mapped on POSIX) until exit
+    char* data = fs_read_file(path);
+    const char* end = data + core_string_length(data);
+
+    int count = 0;
+    for (const char* p = data; p < end; count++) {
+        const char* newline = memchr(p, '\n', end - p);
+        p = newline ? newline + 1 : end;
+    }
+
+    List* lines = core_list_create_capacity(sizeof(StringView), false, count);
+    StringView* items = lines->data;
+    for (const char* p = data; p < end; lines->length++) {
+        const char* newline = memchr(p, '\n', end - p);
+        const char* line_end = newline ? newline : end;
+        int64_t length = line_end - p;
+        if (length > 0 && p[length - 1] == '\r') length--;
+        items[lines->length].data = p;
+        items[lines->length].length = length;
+        p = newline ? newline + 1 : end;
+    }
+    return lines;
+}
+
+bool fs_write_file(const char* path, const char* contents) {
+    int fd = open(path, O_WRONLY | O_CREAT | O_TRUNC | FS_BINARY, 0644);
+    if (fd < 0) return false;
+    int64_t size = core_string_length(contents);
+    int64_t done = 0;
+    while (done < size) {
+        long count = write(fd, contents + done, size - done > (1 << 30) ? (1 << 30) : size - done);
+        if (count <= 0) break;
+        done += count;
+    }
+    return close(fd) == 0 && done == size;
+}
+
+bool fs_exists(const char* path) {
+    struct stat info;
+    return stat(path, &info) == 0;
+}
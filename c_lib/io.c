@@ -1,67 +1,285 @@
 // io.c
+#include "core.h"
+#include "alloc.h"
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdbool.h>
 #include <string.h>
+#include <math.h>
+#ifdef _WIN32
+#include <io.h>
+#define isatty _isatty
+#define fileno _fileno
+#define read _read
+#else
+#include <unistd.h>
+#endif
+
+// Output goes through one buffer, written out when full, before reading input, on io.flush and at exit.
+// On a terminal it is also written at every newline so interactive output shows up as before.
+#define IO_BUFFER_SIZE (64 * 1024)
+
+static char io_buffer[IO_BUFFER_SIZE];
+static size_t io_buffer_length = 0;
+static bool io_initialized = false;
+static bool io_line_buffered = false;
+
+void io_flush(void) {
+    if (io_buffer_length > 0) {
+        fwrite(io_buffer, 1, io_buffer_length, stdout);
+        io_buffer_length = 0;
+    }
+    fflush(stdout);
+}
+
+static void io_init(void) {
+    io_initialized = true;
+    io_line_buffered = isatty(fileno(stdout));
+    atexit(io_flush);
+}
+
+static void io_write(const char* data, size_t length) {
+    if (!io_initialized) io_init();
+    if (io_buffer_length + length > IO_BUFFER_SIZE) {
+        io_flush();
+        if (length > IO_BUFFER_SIZE) {
+            fwrite(data, 1, length, stdout);
+            return;
+        }
+    }
+    memcpy(io_buffer + io_buffer_length, data, length);
+    io_buffer_length += length;
+    if (io_line_buffered && memchr(data, '\n', length)) io_flush();
+}
+
+static size_t format_uint(char* end, uint64_t value) {
+    // Digits written backwards ending at end, returns how many
+    char* p = end;
+    do {
+        *--p = '0' + value % 10;
+        value /= 10;
+    } while (value);
+    return end - p;
+}
+
+static void io_write_int(int64_t x) {
+    char digits[24];
+    char* end = digits + sizeof(digits);
+    uint64_t magnitude = x < 0 ? -(uint64_t)x : (uint64_t)x;
+    size_t length = format_uint(end, magnitude);
+    if (x < 0) end[-(int64_t)++length] = '-';
+    io_write(end - length, length);
+}
+
+static void io_write_float(double x) {
+    // Same output as printf("%f"), six decimals rounded half to even
+    double magnitude = signbit(x) ? -x : x;
+    if (isnan(x) || isinf(x) || magnitude >= 9e18) {
+        char text[64];
+        int length = snprintf(text, sizeof(text), "%f", x);
+        io_write(text, length);
+        return;
+    }
+    char text[40];
+    char* end = text + sizeof(text);
+    uint64_t whole = (uint64_t)magnitude;
+    // Exact for float inputs, the fraction has at most 24 bits and 1e6 fits in 20
+    double scaled = (magnitude - (double)whole) * 1e6;
+    uint64_t fraction = (uint64_t)scaled;
+    double remainder = scaled - (double)fraction;
+    if (remainder > 0.5 || (remainder == 0.5 && (fraction & 1))) fraction++;
+    if (fraction >= 1000000) {
+        fraction -= 1000000;
+        whole++;
+    }
+    char* p = end;
+    for (int i = 0; i < 6; i++) {
+        *--p = '0' + fraction % 10;
+        fraction /= 10;
+    }
+    *--p = '.';
+    p -= format_uint(p, whole);
+    if (signbit(x)) *--p = '-';
+    io_write(p, end - p);
+}
 
 void io_print_int(int x) {
-    printf("%d", x);
+    io_write_int(x);
 }
 
 void io_print_float(float x) {
-    printf("%f", x);
+    io_write_float(x);
 }
 
 void io_print_str(const char* s) {
-    printf("%s", s);
+    io_write(s, core_string_length(s));
+}
+
+void io_print_view(const StringView* view) {
+    if (view) io_write(view->data, view->length);
 }
 
 void io_print_bool(bool b) {
-    printf(b ? "true" : "false");
+    if (b) io_write("true", 4);
+    else io_write("false", 5);
 }
 
-char* io_input_str(const char* prompt) {
-    static char buffer[256];
-    static char decoded[256];
+static void write_list(List* list, char kind, const char* separator, int64_t separator_length, bool trailing) {
+    int length = core_list_len(list);
+    for (int i = 0; i < length; i++) {
+        if (i > 0) io_write(separator, separator_length);
+        switch (kind) {
+            case 'i': io_write_int(((int*)list->data)[i]); break;
+            case 'f': io_write_float(((float*)list->data)[i]); break;
+            case 'v': io_print_view((StringView*)list->data + i); break;
+            default: io_print_str(((const char**)list->data)[i]); break;
+        }
+    }
+    if (trailing && length > 0) io_write(separator, separator_length);
+}
+
+// One element per line
+void io_print_list_int(List* list) { write_list(list, 'i', "\n", 1, true); }
+void io_print_list_float(List* list) { write_list(list, 'f', "\n", 1, true); }
+void io_print_list_str(List* list) { write_list(list, 's', "\n", 1, true); }
+void io_print_list_view(List* list) { write_list(list, 'v', "\n", 1, true); }
+
+// Elements with separator between them, no newline
+void io_print_list_int_separated(List* list, const char* separator) {
+    write_list(list, 'i', separator, core_string_length(separator), false);
+}
+
+void io_print_list_float_separated(List* list, const char* separator) {
+    write_list(list, 'f', separator, core_string_length(separator), false);
+}
+
+void io_print_list_str_separated(List* list, const char* separator) {
+    write_list(list, 's', separator, core_string_length(separator), false);
+}
+
+void io_print_list_view_separated(List* list, const char* separator) {
+    write_list(list, 'v', separator, core_string_length(separator), false);
+}
+
+// Input is read from stdin in IO_BUFFER_SIZE blocks, lines of any length are returned as new strings.
+// read() returns what is available, so a terminal still hands over each line as it is typed.
+static char input_buffer[IO_BUFFER_SIZE];
+static size_t input_start = 0;
+static size_t input_end = 0;
+static bool input_eof = false;
+
+static bool input_fill(void) {
+    if (input_eof) return false;
+    io_flush();
+    input_start = 0;
+    input_end = 0;
+    long count = read(fileno(stdin), input_buffer, IO_BUFFER_SIZE);
+    if (count <= 0) {
+        input_eof = true;
+        return false;
+    }
+    input_end = count;
+    return true;
+}
+
+bool io_eof(void) {
+    return input_start == input_end && !input_fill();
+}
+
+char* io_read_line(void) {
+    // The next line without its (\n) or (\r\n), empty at the end of input
+    char* pending = NULL;
+    int64_t pending_length = 0;
+    int64_t pending_capacity = 0;
+    while (input_start < input_end || input_fill()) {
+        char* begin = input_buffer + input_start;
+        size_t available = input_end - input_start;
+        char* newline = memchr(begin, '\n', available);
+        size_t take = newline ? (size_t)(newline - begin) : available;
+        input_start += newline ? take + 1 : take;
+        if (!pending && newline) {
+            if (take > 0 && begin[take - 1] == '\r') take--;
+            return core_string_from(begin, take);
+        }
+        // The line continues past this block
+        if (pending_length + (int64_t)take > pending_capacity) {
+            pending_capacity = (pending_length + take) * 2;
+            pending = arx_realloc(pending, pending_capacity);
+        }
+        memcpy(pending + pending_length, begin, take);
+        pending_length += take;
+        if (newline) break;
+    }
+    if (pending_length > 0 && pending[pending_length - 1] == '\r') pending_length--;
+    char* line = core_string_from(pending ? pending : "", pending_length);
+    arx_free(pending);
+    return line;
+}
+
+List* io_read_lines(void) {
+    List* lines = core_list_create(sizeof(char*), true);
+    while (!io_eof()) {
+        char* line = io_read_line();
+        core_list_append(lines, &line);
+    }
+    return lines;
+}
 
-    if (prompt && strlen(prompt) > 0) {
-        fputs(prompt, stdout);
-        fflush(stdout);
+char* io_read_all(void) {
+    // Whatever is buffered, then the rest of stdin read straight into the result
+    int64_t length = input_end - input_start;
+    int64_t capacity = length > IO_BUFFER_SIZE ? length : IO_BUFFER_SIZE;
+    char* result = core_string_alloc(capacity);
+    memcpy(result, input_buffer + input_start, length);
+    input_start = input_end;
+    io_flush();
+    while (!input_eof) {
+        if (length == capacity) {
+            capacity *= 2;
+            result = core_string_resize(result, capacity);
+        }
+        long count = read(fileno(stdin), result + length, capacity - length);
+        if (count <= 0) {
+            input_eof = true;
+            break;
+        }
+        length += count;
     }
+    return core_string_resize(result, length);
+}
 
-    if (fgets(buffer, sizeof(buffer), stdin)) {
-        buffer[strcspn(buffer, "\n")] = 0;
-        char* src = buffer;
-        char* dst = decoded;
-
-        while (*src) {
-            if (*src == '\\') {
-                src++;
-                switch (*src) {
-                    case 'n': *dst++ = '\n'; break;
-                    case 't': *dst++ = '\t'; break;
-                    case '\\': *dst++ = '\\'; break;
-                    case '\"': *dst++ = '\"'; break;
-                    case '\'': *dst++ = '\''; break;
-                    case 'r': *dst++ = '\r'; break;
-                    case '0': *dst++ = '\0'; break;
-                    default: *dst++ = '\\'; *dst++ = *src; break;
-                }
-                src++;
-            } else {
-                *dst++ = *src++;
+char* io_input_str(const char* prompt) {
+    io_print_str(prompt);
+    io_flush();
+
+    // Escapes typed as text (\n, \t, ...) become the characters, the result is never longer than the line
+    char* line = io_read_line();
+    int64_t length = core_string_length(line);
+    char* decoded = core_string_alloc(length);
+    char* dst = decoded;
+    for (int64_t i = 0; i < length; i++) {
+        if (line[i] == '\\' && i + 1 < length) {
+            switch (line[++i]) {
+                case 'n': *dst++ = '\n'; break;
+                case 't': *dst++ = '\t'; break;
+                case '\\': *dst++ = '\\'; break;
+                case '\"': *dst++ = '\"'; break;
+                case '\'': *dst++ = '\''; break;
+                case 'r': *dst++ = '\r'; break;
+                case '0': *dst++ = '\0'; break;
+                default: *dst++ = '\\'; *dst++ = line[i]; break;
             }
+        } else {
+            *dst++ = line[i];
         }
-        *dst = '\0';
-        return decoded;
     }
-    return "";
+    core_string_free(line);
+    return core_string_resize(decoded, dst - decoded);
 }
 
 int io_input_int(const char* prompt) {
     char* str = io_input_str(prompt);
-    if (str == NULL || str[0] == '\0') {
-        return 0;
-    }
-    return atoi(str);
-}
\ No newline at end of file
+    int value = atoi(str);
+    core_string_free(str);
+    return value;
+}
@@ -1,5 +1,6 @@
 // iter.c
 #include "core.h"
+#include "alloc.h"
 #include <string.h>
 #include <stdlib.h>
 
@@ -22,24 +23,52 @@ List* string_split(const char* src, const char* delimiter) {
     if (!src || !delimiter || !*delimiter) return NULL;
 
     List* parts = core_list_create(sizeof(char*), true);
-    const char* start = src;
-    const char* pos;
+    int64_t src_len = core_string_length(src);
+    int64_t delim_len = core_string_length(delimiter);
+    int64_t start = 0;
+    int64_t pos;
 
-    size_t delim_len = strlen(delimiter);
+    while ((pos = core_string_find(src, src_len, start, delimiter, delim_len)) >= 0) {
+        char* part = core_string_from(src + start, pos - start);
+        core_list_append(parts, &part);
+        start = pos + delim_len;
+    }
+
+    if (start < src_len) {
+        char* part = core_string_from(src + start, src_len - start);
+        core_list_append(parts, &part);
+    }
+
+    return parts;
+}
+
+static List* split_views(const char* src, int64_t src_len, const char* delimiter) {
+    // Same pieces as string_split, held in the list as views into src instead of copies
+    if (!src || !delimiter || !*delimiter) return NULL;
+
+    List* parts = core_list_create(sizeof(StringView), false);
+    int64_t delim_len = core_string_length(delimiter);
+    int64_t start = 0;
+    int64_t pos;
 
-    while ((pos = strstr(start, delimiter)) != NULL) {
-        size_t len = pos - start;
-        char* part = malloc(len + 1);
-        memcpy(part, start, len);
-        part[len] = '\0';
+    while ((pos = core_string_find(src, src_len, start, delimiter, delim_len)) >= 0) {
+        StringView part = {src + start, pos - start};
         core_list_append(parts, &part);
         start = pos + delim_len;
     }
 
-    if (*start) {
-        char* part = strdup(start);
+    if (start < src_len) {
+        StringView part = {src + start, src_len - start};
         core_list_append(parts, &part);
     }
 
     return parts;
 }
+
+List* string_split_view(const char* src, const char* delimiter) {
+    return split_views(src, core_string_length(src), delimiter);
+}
+
+List* view_split(const StringView* view, const char* delimiter) {
+    return view ? split_views(view->data, view->length, delimiter) : NULL;
+}
@@ -1,177 +1,239 @@
 #include "string_lib.h"
+#include "core.h"
+#include "alloc.h"
 #include <string.h>
 #include <stdlib.h>
 #include <ctype.h>
 
 char* str_substring(const char* src, int start, int end) {
     if (!src || start < 0 || end < start) return NULL;
-    int len = strlen(src);
+    int len = core_string_length(src);
     if (end > len) end = len;
+    if (start > end) start = end;
 
-    int sub_len = end - start;
-    char* result = malloc(sub_len + 1);
-    if (!result) return NULL;
-
-    strncpy(result, src + start, sub_len);
-    result[sub_len] = '\0';
-    return result;
+    return core_string_from(src + start, end - start);
 }
 
 char* str_repeat(const char* src, int times) {
-    if (!src || times <= 0) return strdup("");
-    int len = strlen(src);
-    char* result = malloc(len * times + 1);
-    if (!result) return NULL;
+    if (!src || times <= 0) return core_string_from("", 0);
+    int64_t len = core_string_length(src);
+    char* result = core_string_alloc(len * times);
 
     char* p = result;
     for (int i = 0; i < times; i++) {
         memcpy(p, src, len);
         p += len;
     }
-    *p = '\0';
     return result;
 }
 
-char* str_join(const char** parts, int count, const char* delimiter) {
-    if (count == 0) return strdup("");
-    if (!delimiter) delimiter = "";
+char* str_join(List* parts, const char* delimiter) {
+    int count = core_list_len(parts);
+    if (count == 0) return core_string_from("", 0);
+    const char** items = parts->data;
 
-    int delim_len = strlen(delimiter);
-    int total = 0;
+    // Sized once, then every part is copied once
+    int64_t delim_len = core_string_length(delimiter);
+    int64_t total = delim_len * (count - 1);
     for (int i = 0; i < count; i++)
-        total += strlen(parts[i]) + (i < count - 1 ? delim_len : 0);
+        total += core_string_length(items[i]);
 
-    char* result = malloc(total + 1);
-    if (!result) return NULL;
-    result[0] = '\0';
+    char* result = core_string_alloc(total);
+    char* dest = result;
 
     for (int i = 0; i < count; i++) {
-        strcat(result, parts[i]);
-        if (i < count - 1) strcat(result, delimiter);
+        int64_t part_len = core_string_length(items[i]);
+        memcpy(dest, items[i], part_len);
+        dest += part_len;
+        if (i < count - 1) {
+            memcpy(dest, delimiter, delim_len);
+            dest += delim_len;
+        }
     }
     return result;
 }
 
 char* str_trim_left(const char* src) {
     if (!src) return NULL;
-    while (isspace((unsigned char)*src)) src++;
-    return strdup(src);
+    const char* end = src + core_string_length(src);
+    while (src < end && isspace((unsigned char)*src)) src++;
+    return core_string_from(src, end - src);
 }
 
 char* str_trim_right(const char* src) {
     if (!src) return NULL;
-    int len = strlen(src);
+    int64_t len = core_string_length(src);
     while (len > 0 && isspace((unsigned char)src[len - 1])) len--;
-    char* result = malloc(len + 1);
-    if (!result) return NULL;
-    strncpy(result, src, len);
-    result[len] = '\0';
-    return result;
+    return core_string_from(src, len);
 }
 
 char* str_trim(const char* src) {
-    char* left = str_trim_left(src);
-    char* both = str_trim_right(left);
-    free(left);
-    return both;
+    if (!src) return NULL;
+    const char* end = src + core_string_length(src);
+    while (src < end && isspace((unsigned char)*src)) src++;
+    while (end > src && isspace((unsigned char)end[-1])) end--;
+    return core_string_from(src, end - src);
 }
 
 char* str_replace(const char* src, const char* find, const char* replace) {
     if (!src || !find || !replace) return NULL;
-    const char* pos = src;
-    int find_len = strlen(find);
-    int replace_len = strlen(replace);
-    int count = 0;
+    int64_t src_len = core_string_length(src);
+    int64_t find_len = core_string_length(find);
+    int64_t replace_len = core_string_length(replace);
+    if (find_len == 0) return core_string_from(src, src_len);
 
-    while ((pos = strstr(pos, find))) {
+    int64_t count = 0;
+    for (int64_t pos = core_string_find(src, src_len, 0, find, find_len); pos >= 0; pos = core_string_find(src, src_len, pos + find_len, find, find_len))
         count++;
-        pos += find_len;
-    }
-    if (count == 0) return strdup(src);
+    if (count == 0) return core_string_from(src, src_len);
 
     // Allocate final buffer
-    int new_len = strlen(src) + count * (replace_len - find_len);
-    char* result = malloc(new_len + 1);
-    if (!result) return NULL;
+    char* result = core_string_alloc(src_len + count * (replace_len - find_len));
 
-    const char* current = src;
+    int64_t current = 0;
     char* dest = result;
-    while ((pos = strstr(current, find))) {
-        int segment_len = pos - current;
-        memcpy(dest, current, segment_len);
-        dest += segment_len;
+    for (int64_t pos = core_string_find(src, src_len, 0, find, find_len); pos >= 0; pos = core_string_find(src, src_len, current, find, find_len)) {
+        memcpy(dest, src + current, pos - current);
+        dest += pos - current;
         memcpy(dest, replace, replace_len);
         dest += replace_len;
         current = pos + find_len;
     }
-    strcpy(dest, current);
+    memcpy(dest, src + current, src_len - current);
     return result;
 }
 
 int str_index_of(const char* src, const char* substr) {
     if (!src || !substr) return -1;
-    char* p = strstr(src, substr);
-    return p ? (int)(p - src) : -1;
+    return (int)core_string_find(src, core_string_length(src), 0, substr, core_string_length(substr));
 }
 
 int str_last_index_of(const char* src, const char* substr) {
     if (!src || !substr) return -1;
-    int last = -1;
-    int len = strlen(substr);
-    const char* p = src;
-    while ((p = strstr(p, substr))) {
-        last = p - src;
-        p += len;
-    }
-    return last;
+    int64_t src_len = core_string_length(src);
+    int64_t len = core_string_length(substr);
+    if (len == 0) return -1;
+    int64_t last = -1;
+    for (int64_t pos = core_string_find(src, src_len, 0, substr, len); pos >= 0; pos = core_string_find(src, src_len, pos + len, substr, len))
+        last = pos;
+    return (int)last;
 }
 
 bool str_starts_with(const char* src, const char* prefix) {
     if (!src || !prefix) return false;
-    return strncmp(src, prefix, strlen(prefix)) == 0;
+    int64_t len_pre = core_string_length(prefix);
+    return len_pre <= core_string_length(src) && memcmp(src, prefix, len_pre) == 0;
 }
 
 bool str_ends_with(const char* src, const char* suffix) {
     if (!src || !suffix) return false;
-    int len_src = strlen(src);
-    int len_suf = strlen(suffix);
+    int64_t len_src = core_string_length(src);
+    int64_t len_suf = core_string_length(suffix);
     if (len_suf > len_src) return false;
-    return strcmp(src + len_src - len_suf, suffix) == 0;
+    return memcmp(src + len_src - len_suf, suffix, len_suf) == 0;
 }
 
 char* str_to_lower(const char* src) {
     if (!src) return NULL;
-    char* result = strdup(src);
-    for (char* p = result; *p; p++)
-        *p = tolower((unsigned char)*p);
+    int64_t len = core_string_length(src);
+    char* result = core_string_alloc(len);
+    for (int64_t i = 0; i < len; i++)
+        result[i] = tolower((unsigned char)src[i]);
     return result;
 }
 
 char* str_to_upper(const char* src) {
     if (!src) return NULL;
-    char* result = strdup(src);
-    for (char* p = result; *p; p++)
-        *p = toupper((unsigned char)*p);
+    int64_t len = core_string_length(src);
+    char* result = core_string_alloc(len);
+    for (int64_t i = 0; i < len; i++)
+        result[i] = toupper((unsigned char)src[i]);
     return result;
 }
 
 bool str_is_numeric(const char* src) {
-    if (!src || !*src) return false;
-    for (const char* p = src; *p; p++)
-        if (!isdigit((unsigned char)*p)) return false;
+    int64_t len = core_string_length(src);
+    if (len == 0) return false;
+    for (int64_t i = 0; i < len; i++)
+        if (!isdigit((unsigned char)src[i])) return false;
     return true;
 }
 
 bool str_is_alpha(const char* src) {
-    if (!src || !*src) return false;
-    for (const char* p = src; *p; p++)
-        if (!isalpha((unsigned char)*p)) return false;
+    int64_t len = core_string_length(src);
+    if (len == 0) return false;
+    for (int64_t i = 0; i < len; i++)
+        if (!isalpha((unsigned char)src[i])) return false;
     return true;
 }
 
 bool str_is_space(const char* src) {
-    if (!src || !*src) return false;
-    for (const char* p = src; *p; p++)
-        if (!isspace((unsigned char)*p)) return false;
+    int64_t len = core_string_length(src);
+    if (len == 0) return false;
+    for (int64_t i = 0; i < len; i++)
+        if (!isspace((unsigned char)src[i])) return false;
     return true;
 }
+
+// Views point into the string they came from, which has to outlive them
+
+StringView* str_view(const char* src) {
+    return core_view_create(src ? src : "", core_string_length(src));
+}
+
+static StringView* slice_view(const char* data, int64_t length, int start, int end) {
+    // Same bounds as str_substring
+    if (start < 0 || end < start) return NULL;
+    if (end > length) end = length;
+    if (start > end) start = end;
+    return core_view_create(data + start, end - start);
+}
+
+StringView* str_substring_view(const char* src, int start, int end) {
+    if (!src) return NULL;
+    return slice_view(src, core_string_length(src), start, end);
+}
+
+StringView* view_substring(const StringView* view, int start, int end) {
+    if (!view) return NULL;
+    return slice_view(view->data, view->length, start, end);
+}
+
+StringView* view_trim(const StringView* view) {
+    if (!view) return NULL;
+    const char* begin = view->data;
+    const char* end = begin + view->length;
+    while (begin < end && isspace((unsigned char)*begin)) begin++;
+    while (end > begin && isspace((unsigned char)end[-1])) end--;
+    return core_view_create(begin, end - begin);
+}
+
+int view_index_of(const StringView* view, const char* substr) {
+    if (!view || !substr) return -1;
+    return (int)core_string_find(view->data, view->length, 0, substr, core_string_length(substr));
+}
+
+bool view_starts_with(const StringView* view, const char* prefix) {
+    if (!view || !prefix) return false;
+    int64_t len_pre = core_string_length(prefix);
+    return len_pre <= view->length && memcmp(view->data, prefix, len_pre) == 0;
+}
+
+bool view_ends_with(const StringView* view, const char* suffix) {
+    if (!view || !suffix) return false;
+    int64_t len_suf = core_string_length(suffix);
+    return len_suf <= view->length && memcmp(view->data + view->length - len_suf, suffix, len_suf) == 0;
+}
+
+int view_to_int(const StringView* view) {
+    // Like atoi, leading spaces and a sign then digits, read in place as the view has no terminator
+    if (!view) return 0;
+    const char* p = view->data;
+    const char* end = p + view->length;
+    while (p < end && isspace((unsigned char)*p)) p++;
+    bool negative = p < end && *p == '-';
+    if (p < end && (*p == '-' || *p == '+')) p++;
+    int64_t value = 0;
+    while (p < end && isdigit((unsigned char)*p) && value <= INT32_MAX) value = value * 10 + (*p++ - '0');
+    return (int)(negative ? -value : value);
+}
@@ -1,11 +1,12 @@
 #ifndef CORE_STRING_LIB_H
 #define CORE_STRING_LIB_H
 
+#include "core.h"
 #include <stdbool.h>
 
 char* str_substring(const char* src, int start, int end);
 char* str_repeat(const char* src, int times);
-char* str_join(const char** parts, int count, const char* delimiter);
+char* str_join(List* parts, const char* delimiter);
 char* str_trim(const char* src);
 char* str_trim_left(const char* src);
 char* str_trim_right(const char* src);
@@ -20,4 +21,13 @@ bool  str_is_numeric(const char* src);
 bool  str_is_alpha(const char* src);
 bool  str_is_space(const char* src);
 
+StringView* str_view(const char* src);
+StringView* str_substring_view(const char* src, int start, int end);
+StringView* view_substring(const StringView* view, int start, int end);
+StringView* view_trim(const StringView* view);
+int   view_index_of(const StringView* view, const char* substr);
+bool  view_starts_with(const StringView* view, const char* prefix);
+bool  view_ends_with(const StringView* view, const char* suffix);
+int   view_to_int(const StringView* view);
+
 #endif
@@ -0,0 +1,245 @@
+// vec.c
+#include "core.h"
+#include "alloc.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <stdbool.h>
+
+// Bulk operations on list:int and list:float, written as plain counted loops over the list data so the
+// C compiler can vectorize them at the level get_c_flags picks. Without an (-O) flag the runtime is built
+// unoptimized and these run as scalar loops, the speedup needs (-O2) or (-O3).
+// Float reductions run in VEC_LANES independent accumulators, which keeps them vectorizable without
+// -ffast-math (sums use doubles, more precise than one float running total).
+#define VEC_LANES 8
+
+static int length_of(List* list) {
+    return core_list_len(list);
+}
+
+static void check_lengths(List* a, List* b) {
+    if (length_of(a) != length_of(b)) {
+        fprintf(stderr, "Vector lengths differ: %d and %d\n", length_of(a), length_of(b));
+        exit(1);
+    }
+}
+
+static List* zeros(int64_t element_size, int length) {
+    if (length < 0) length = 0;
+    List* list = core_list_create_capacity(element_size, false, length);
+    memset(list->data, 0, element_size * length);
+    list->length = length;
+    return list;
+}
+
+List* vec_zeros_int(int length) { return zeros(sizeof(int), length); }
+List* vec_zeros_float(int length) { return zeros(sizeof(float), length); }
+
+int vec_sum_int(List* list) {
+    int n = length_of(list);
+    const int* x = n ? list->data : NULL;
+    // Wraps like int addition, unsigned so the overflow is defined
+    unsigned total = 0;
+    for (int i = 0; i < n; i++) total += x[i];
+    return (int)total;
+}
+
+float vec_sum_float(List* list) {
+    int n = length_of(list);
+    const float* x = n ? list->data : NULL;
+    double lanes[VEC_LANES] = {0};
+    int i = 0;
+    for (; i + VEC_LANES <= n; i += VEC_LANES)
+        for (int k = 0; k < VEC_LANES; k++) lanes[k] += x[i + k];
+    double total = 0;
+    for (; i < n; i++) total += x[i];
+    for (int k = 0; k < VEC_LANES; k++) total += lanes[k];
+    return (float)total;
+}
+
+int vec_dot_int(List* a, List* b) {
+    check_lengths(a, b);
+    int n = length_of(a);
+    const int* x = n ? a->data : NULL;
+    const int* y = n ? b->data : NULL;
+    unsigned total = 0;
+    for (int i = 0; i < n; i++) total += (unsigned)x[i] * y[i];
+    return (int)total;
+}
+
+float vec_dot_float(List* a, List* b) {
+    check_lengths(a, b);
+    int n = length_of(a);
+    const float* x = n ? a->data : NULL;
+    const float* y = n ? b->data : NULL;
+    double lanes[VEC_LANES] = {0};
+    int i = 0;
+    for (; i + VEC_LANES <= n; i += VEC_LANES)
+        for (int k = 0; k < VEC_LANES; k++) lanes[k] += (double)x[i + k] * y[i + k];
+    double total = 0;
+    for (; i < n; i++) total += (double)x[i] * y[i];
+    for (int k = 0; k < VEC_LANES; k++) total += lanes[k];
+    return (float)total;
+}
+
+// min and max of an empty list are 0
+
+int vec_min_int(List* list) {
+    int n = length_of(list);
+    if (n == 0) return 0;
+    const int* x = list->data;
+    int result = x[0];
+    for (int i = 1; i < n; i++) result = x[i] < result ? x[i] : result;
+    return result;
+}
+
+int vec_max_int(List* list) {
+    int n = length_of(list);
+    if (n == 0) return 0;
+    const int* x = list->data;
+    int result = x[0];
+    for (int i = 1; i < n; i++) result = x[i] > result ? x[i] : result;
+    return result;
+}
+
+float vec_min_float(List* list) {
+    int n = length_of(list);
+    if (n == 0) return 0;
+    const float* x = list->data;
+    float lanes[VEC_LANES];
+    for (int k = 0; k < VEC_LANES; k++) lanes[k] = x[0];
+    int i = 0;
+    for (; i + VEC_LANES <= n; i += VEC_LANES)
+        for (int k = 0; k < VEC_LANES; k++) lanes[k] = x[i + k] < lanes[k] ? x[i + k] : lanes[k];
+    float result = x[0];
+    for (; i < n; i++) result = x[i] < result ? x[i] : result;
+    for (int k = 0; k < VEC_LANES; k++) result = lanes[k] < result ? lanes[k] : result;
+    return result;
+}
+
+float vec_max_float(List* list) {
+    int n = length_of(list);
+    if (n == 0) return 0;
+    const float* x = list->data;
+    float lanes[VEC_LANES];
+    for (int k = 0; k < VEC_LANES; k++) lanes[k] = x[0];
+    int i = 0;
+    for (; i + VEC_LANES <= n; i += VEC_LANES)
+        for (int k = 0; k < VEC_LANES; k++) lanes[k] = x[i + k] > lanes[k] ? x[i + k] : lanes[k];
+    float result = x[0];
+    for (; i < n; i++) result = x[i] > result ? x[i] : result;
+    for (int k = 0; k < VEC_LANES; k++) result = lanes[k] > result ? lanes[k] : result;
+    return result;
+}
+
+// argmax is the first index holding the maximum, -1 for an empty list.
+// The maximum comes from the vectorized reduction, then a plain search finds it.
+
+int vec_argmax_int(List* list) {
+    int n = length_of(list);
+    if (n == 0) return -1;
+    const int* x = list->data;
+    int best = vec_max_int(list);
+    int i = 0;
+    while (x[i] != best) i++;
+    return i;
+}
+
+int vec_argmax_float(List* list) {
+    int n = length_of(list);
+    if (n == 0) return -1;
+    const float* x = list->data;
+    float best = vec_max_float(list);
+    for (int i = 0; i < n; i++)
+        if (x[i] == best) return i;
+    return 0;
+}
+
+// In place operations copy a borrowed (constant literal) list before writing to it
+
+void vec_scale_int(List* list, int factor) {
+    int n = length_of(list);
+    if (n == 0) return;
+    core_list_own(list);
+    int* x = list->data;
+    for (int i = 0; i < n; i++) x[i] *= factor;
+}
+
+void vec_scale_float(List* list, float factor) {
+    int n = length_of(list);
+    if (n == 0) return;
+    core_list_own(list);
+    float* x = list->data;
+    for (int i = 0; i < n; i++) x[i] *= factor;
+}
+
+static void add_int(int* restrict x, const int* restrict y, int n) {
+    for (int i = 0; i < n; i++) x[i] += y[i];
+}
+
+static void add_float(float* restrict x, const float* restrict y, int n) {
+    for (int i = 0; i < n; i++) x[i] += y[i];
+}
+
+void vec_add_int(List* a, List* b) {
+    // a += b element by element, vec.add(a, a) doubles a
+    check_lengths(a, b);
+    int n = length_of(a);
+    if (n == 0) return;
+    if (a == b) {
+        vec_scale_int(a, 2);
+        return;
+    }
+    core_list_own(a);
+    add_int(a->data, b->data, n);
+}
+
+void vec_add_float(List* a, List* b) {
+    check_lengths(a, b);
+    int n = length_of(a);
+    if (n == 0) return;
+    if (a == b) {
+        vec_scale_float(a, 2);
+        return;
+    }
+    core_list_own(a);
+    add_float(a->data, b->data, n);
+}
+
+void vec_fill_int(List* list, int value) {
+    int n = length_of(list);
+    if (n == 0) return;
+    core_list_own(list);
+    int* x = list->data;
+    for (int i = 0; i < n; i++) x[i] = value;
+}
+
+void vec_fill_float(List* list, float value) {
+    int n = length_of(list);
+    if (n == 0) return;
+    core_list_own(list);
+    float* x = list->data;
+    for (int i = 0; i < n; i++) x[i] = value;
+}
+
+// Inclusive running totals, element i becomes the sum of elements 0 to i
+
+void vec_prefix_sum_int(List* list) {
+    int n = length_of(list);
+    if (n == 0) return;
+    core_list_own(list);
+    int* x = list->data;
+    for (int i = 1; i < n; i++) x[i] += x[i - 1];
+}
+
+void vec_prefix_sum_float(List* list) {
+    int n = length_of(list);
+    if (n == 0) return;
+    core_list_own(list);
+    float* x = list->data;
+    double total = 0;
+    for (int i = 0; i < n; i++) {
+        total += x[i];
+        x[i] = (float)total;
+    }
+}
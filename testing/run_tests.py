@@ -0,0 +1,88 @@
+# Runs programs under testing/ through (arx run) and compares their output with the expected text
+# Usage: python testing/run_tests.py [name_filter]
+import os, sys, subprocess
+
+root_dir : str = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+# (arx run) prints two banner lines before the program output
+banner_lines : int = 2
+
+# (file, flags, expected output)
+cases : list[tuple[str, list[str], str]] = [
+    # Booleans cross into C (bool) parameters, (not) must leave the upper bits clear at every level
+    ('ops_test.arx', [], 'a and b = false\na or b = true\nnot a = false\nnot b = true\n(a and not b) or (b and a) = true'),
+    ('ops_test.arx', ['-O0'], 'a and b = false\na or b = true\nnot a = false\nnot b = true\n(a and not b) or (b and a) = true'),
+    ('ops_test.arx', ['-O2'], 'a and b = false\na or b = true\nnot a = false\nnot b = true\n(a and not b) or (b and a) = true'),
+    # Generic for-in over an appended list, and counted loops over iter.range_int
+    ('list_sum.arx', [], '499500000'),
+    ('range_loop.arx', [], '10 7 4 1 \n499500000\n0\n0, 1, 2, 3, 4'),
+    ('range_loop.arx', ['-O2'], '10 7 4 1 \n499500000\n0\n0, 1, 2, 3, 4'),
+    # StringBuilder appends and string_lib.join
+    ('string_builder.arx', [], 'line 0\nline 1\nline 2\nline 3\nline 4\n35\none, two, three\n3'),
+    ('string_builder.arx', ['-O2'], 'line 0\nline 1\nline 2\nline 3\nline 4\n35\none, two, three\n3'),
+    # Buffered io.print_list with and without a separator, flushed by io.flush
+    ('print_list.arx', [], '0\n2\n4\n6\n8\n0, 2, 4, 6, 8\nalpha | beta | gamma'),
+    ('print_list.arx', ['-O2'], '0\n2\n4\n6\n8\n0, 2, 4, 6, 8\nalpha | beta | gamma'),
+    # fs reads a written file whole and as lines
+    ('file_lines.arx', [], 'true\n19\nfirst | second | third\nfalse'),
+    ('file_lines.arx', ['-O2'], 'true\n19\nfirst | second | third\nfalse'),
+    # Lines read from standard input, an empty one included
+    ('line_count.arx', [], '4 lines, 16 characters'),
+    ('line_count.arx', ['-O2'], '4 lines, 16 characters'),
+    # Views from split_view, substring_view, fs.line_views and trim
+    ('string_views.arx', [], '2\nbanana!\n1 ada 90\n2 bob 75\n42'),
+    ('string_views.arx', ['-O2'], '2\nbanana!\n1 ada 90\n2 bob 75\n42'),
+    # Constant list literals, borrowed until written
+    ('list_literals.arx', [], '365\nada, bob, cy\ntrue false true \n40 41 42'),
+    ('list_literals.arx', ['-O2'], '365\nada, bob, cy\ntrue false true \n40 41 42'),
+    # vec reductions and in place operations on list:int and list:float
+    ('vec_ops.arx', [], '26 1 9 1\n4 13 14 23 26\n15.500000\n7.000000 4.500000 10.000000\n25 979'),
+    ('vec_ops.arx', ['-O2'], '26 1 9 1\n4 13 14 23 26\n15.500000\n7.000000 4.500000 10.000000\n25 979'),
+]
+
+# Standard input for programs that read it, the others get none
+inputs : dict[str, str] = {
+    'line_count.arx': 'one\ntwo words\n\nlast\n',
+}
+
+# (file, last line of the compiler error) for programs that must be rejected
+error_cases : list[tuple[str, str]] = [
+    # Views sit in a list:view as (data, length) pairs, they can not be read as strings
+    ('view_loop_mismatch.arx', 'TypeError: Cannot use list:view as list:str at 6:5'),
+    ('view_list_mismatch.arx', 'TypeError: Cannot use list:view as list:str at 6:5'),
+]
+
+def run_arx(file_name: str, flags: list[str]) -> subprocess.CompletedProcess:
+    command : list[str] = [sys.executable, os.path.join(root_dir, 'arx.py'), 'run', os.path.join('testing', file_name)] + flags
+    return subprocess.run(command, cwd=root_dir, input=inputs.get(file_name, ''), capture_output=True, text=True)
+
+def run_case(file_name: str, flags: list[str]) -> str:
+    result : subprocess.CompletedProcess = run_arx(file_name, flags)
+    if result.returncode != 0:
+        return f'exit code {result.returncode}\n{result.stderr}'
+    return '\n'.join(result.stdout.split('\n')[banner_lines:]).rstrip('\n')
+
+def run_error_case(file_name: str) -> str:
+    result : subprocess.CompletedProcess = run_arx(file_name, [])
+    if result.returncode == 0:
+        return 'exit code 0'
+    return result.stderr.strip().split('\n')[-1]
+
+def report(name: str, output: str, expected: str) -> bool:
+    if output == expected:
+        print(f'  ok    {name}')
+        return True
+    print(f'  FAIL  {name}')
+    print('    expected: ' + expected.replace('\n', '\n              '))
+    print('    got:      ' + output.replace('\n', '\n              '))
+    return False
+
+if __name__ == '__main__':
+    name_filter : str = sys.argv[1] if len(sys.argv) > 1 else ''
+    failures : int = 0
+    for file_name, flags, expected in cases:
+        if name_filter in file_name and not report(f'{file_name} {" ".join(flags)}', run_case(file_name, flags), expected):
+            failures += 1
+    for file_name, expected in error_cases:
+        if name_filter in file_name and not report(f'{file_name} (rejected)', run_error_case(file_name), expected):
+            failures += 1
+    exit(1 if failures else 0)